@@ -54,6 +54,16 @@
 #  Version 2.4.3C, Dated 2016-Jan-15
 #                  Corrected some minor errors.
 #  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 2.4.4,  Dated 2026-Oct-17
+#                  The MLE codes of all the ambiguities are computed for the whole
+#                  swath before the i/j loop [Compute_MLE_STRNG_Array] instead of
+#                  four Compute_MLE_STRNG calls per WVC.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 2.4.5, Dated 2026-Oct-17
+#                                 Determine_mndate_from_jday/leapjday look the day up
+#                                 in MMDD_TABLE/LEAP_MMDD_TABLE instead of running the
+#                                 -elif jday == N- chains.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 #
 #
 #==========================================================================================
@@ -161,6 +171,9 @@ import commands
 #  ==> Compute_MLE_STRNG(datafromfile, MAX_data_Value)
 #	--> datafromfile:Float, Output: Formatted String
 #  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Compute_MLE_STRNG_Array(ambig_obj)
+#	--> ambig_obj:Masked Array [row, cell, ambiguity], Output: String Array of 5 character MLE codes
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
 #  ==> Print_Current_Time(now)
 #	--> now:String, Output: Formatted String
 #  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
@@ -210,6 +223,18 @@ with WARNINGS.catch_warnings():
 #
 #
 #
+#----------------------------------------------------------------
+# MMDD of every Julian day, indexed by the Julian day [1-365 on a
+# non-leap year, 1-366 on a leap year]. Entry 0 is "0000", the
+# answer for a day that is not in the year.
+#----------------------------------------------------------------
+#
+MMDD_TABLE=["0000"]+[(datetime.date(2017, 1, 1)+datetime.timedelta(days=jday-1)).strftime("%m%d")
+                     for jday in range(1, 366)]
+#
+LEAP_MMDD_TABLE=["0000"]+[(datetime.date(2016, 1, 1)+datetime.timedelta(days=jday-1)).strftime("%m%d")
+                          for jday in range(1, 367)]
+#
 #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
 #######  Begin Function Determine_mndate_from_leapjday
 #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
@@ -239,760 +264,12 @@ def Determine_mndate_from_leapjday(jday):
         #----------------------------------------------------
 
 
-    if jday == 1:
-        month_n_date="0101"
-    elif jday == 2:
-        month_n_date="0102"
-    elif jday == 3:
-        month_n_date="0103"
-    elif jday == 4:
-        month_n_date="0104"
-    elif jday == 5:
-        month_n_date="0105"
-    elif jday == 6:
-        month_n_date="0106"
-    elif jday == 7:
-        month_n_date="0107"
-    elif jday == 8:
-        month_n_date="0108"
-    elif jday == 9:
-        month_n_date="0109"
-    elif jday == 10:
-        month_n_date="0110"
-    elif jday == 11:
-        month_n_date="0111"
-    elif jday == 12:
-        month_n_date="0112"
-    elif jday == 13:
-        month_n_date="0113"
-    elif jday == 14:
-        month_n_date="0114"
-    elif jday == 15:
-        month_n_date="0115"
-    elif jday == 16:
-        month_n_date="0116"
-    elif jday == 17:
-        month_n_date="0117"
-    elif jday == 18:
-        month_n_date="0118"
-    elif jday == 19:
-        month_n_date="0119"
-    elif jday == 20:
-        month_n_date="0120"
-    elif jday == 21:
-        month_n_date="0121"
-    elif jday == 22:
-        month_n_date="0122"
-    elif jday == 23:
-        month_n_date="0123"
-    elif jday == 24:
-        month_n_date="0124"
-    elif jday == 25:
-        month_n_date="0125"
-    elif jday == 26:
-        month_n_date="0126"
-    elif jday == 27:
-        month_n_date="0127"
-    elif jday == 28:
-        month_n_date="0128"
-    elif jday == 29:
-        month_n_date="0129"
-    elif jday == 30:
-        month_n_date="0130"
-    elif jday == 31:
-        month_n_date="0131"
-        #--------------------------
-    elif jday == 32:
-        month_n_date="0201"
-    elif jday == 33:
-        month_n_date="0202"
-    elif jday == 34:
-        month_n_date="0203"
-    elif jday == 35:
-        month_n_date="0204"
-    elif jday == 36:
-        month_n_date="0205"
-    elif jday == 37:
-        month_n_date="0206"
-    elif jday == 38:
-        month_n_date="0207"
-    elif jday == 39:
-        month_n_date="0208"
-    elif jday == 40:
-        month_n_date="0209"
-    elif jday == 41:
-        month_n_date="0210"
-    elif jday == 42:
-        month_n_date="0211"
-    elif jday == 43:
-        month_n_date="0212"
-    elif jday == 44:
-        month_n_date="0213"
-    elif jday == 45:
-        month_n_date="0214"
-    elif jday == 46:
-        month_n_date="0215"
-    elif jday == 47:
-        month_n_date="0216"
-    elif jday == 48:
-        month_n_date="0217"
-    elif jday == 49:
-        month_n_date="0218"
-    elif jday == 50:
-        month_n_date="0219"
-    elif jday == 51:
-        month_n_date="0220"
-    elif jday == 52:
-        month_n_date="0221"
-    elif jday == 53:
-        month_n_date="0222"
-    elif jday == 54:
-        month_n_date="0223"
-    elif jday == 55:
-        month_n_date="0224"
-    elif jday == 56:
-        month_n_date="0225"
-    elif jday == 57:
-        month_n_date="0226"
-    elif jday == 58:
-        month_n_date="0227"
-    elif jday == 59:
-        month_n_date="0228"
-    elif jday == 60:
-        month_n_date="0229"
-        #--------------------------
-    elif jday == 61:
-        month_n_date="0301"
-    elif jday == 62:
-        month_n_date="0302"
-    elif jday == 63:
-        month_n_date="0303"
-    elif jday == 64:
-        month_n_date="0304"
-    elif jday == 65:
-        month_n_date="0305"
-    elif jday == 66:
-        month_n_date="0306"
-    elif jday == 67:
-        month_n_date="0307"
-    elif jday == 68:
-        month_n_date="0308"
-    elif jday == 69:
-        month_n_date="0309"
-    elif jday == 70:
-        month_n_date="0310"
-    elif jday == 71:
-        month_n_date="0311"
-    elif jday == 72:
-        month_n_date="0312"
-    elif jday == 73:
-        month_n_date="0313"
-    elif jday == 74:
-        month_n_date="0314"
-    elif jday == 75:
-        month_n_date="0315"
-    elif jday == 76:
-        month_n_date="0316"
-    elif jday == 77:
-        month_n_date="0317"
-    elif jday == 78:
-        month_n_date="0318"
-    elif jday == 79:
-        month_n_date="0319"
-    elif jday == 80:
-        month_n_date="0320"
-    elif jday == 81:
-        month_n_date="0321"
-    elif jday == 82:
-        month_n_date="0322"
-    elif jday == 83:
-        month_n_date="0323"
-    elif jday == 84:
-        month_n_date="0324"
-    elif jday == 85:
-        month_n_date="0325"
-    elif jday == 86:
-        month_n_date="0326"
-    elif jday == 87:
-        month_n_date="0327"
-    elif jday == 88:
-        month_n_date="0328"
-    elif jday == 89:
-        month_n_date="0329"
-    elif jday == 90:
-        month_n_date="0330"
-    elif jday == 91:
-        month_n_date="0331"
-        #--------------------------
-        #--------------------------
-    elif jday == 92:
-        month_n_date="0401"
-    elif jday == 93:
-        month_n_date="0402"
-    elif jday == 94:
-        month_n_date="0403"
-    elif jday == 95:
-        month_n_date="0404"
-    elif jday == 96:
-        month_n_date="0405"
-    elif jday == 97:
-        month_n_date="0406"
-    elif jday == 98:
-        month_n_date="0407"
-    elif jday == 99:
-        month_n_date="0408"
-    elif jday == 100:
-        month_n_date="0409"
-    elif jday == 101:
-        month_n_date="0410"
-    elif jday == 102:
-        month_n_date="0411"
-    elif jday == 103:
-        month_n_date="0412"
-    elif jday == 104:
-        month_n_date="0413"
-    elif jday == 105:
-        month_n_date="0414"
-    elif jday == 106:
-        month_n_date="0415"
-    elif jday == 107:
-        month_n_date="0416"
-    elif jday == 108:
-        month_n_date="0417"
-    elif jday == 109:
-        month_n_date="0418"
-    elif jday == 110:
-        month_n_date="0419"
-    elif jday == 111:
-        month_n_date="0420"
-    elif jday == 112:
-        month_n_date="0421"
-    elif jday == 113:
-        month_n_date="0422"
-    elif jday == 114:
-        month_n_date="0423"
-    elif jday == 115:
-        month_n_date="0424"
-    elif jday == 116:
-        month_n_date="0425"
-    elif jday == 117:
-        month_n_date="0426"
-    elif jday == 118:
-        month_n_date="0427"
-    elif jday == 119:
-        month_n_date="0428"
-    elif jday == 120:
-        month_n_date="0429"
-    elif jday == 121:
-        month_n_date="0430"
-    #--------------------------
-    elif jday == 122:
-        month_n_date="0501"
-    elif jday == 123:
-        month_n_date="0502"
-    elif jday == 124:
-        month_n_date="0503"
-    elif jday == 125:
-        month_n_date="0504"
-    elif jday == 126:
-        month_n_date="0505"
-    elif jday == 127:
-        month_n_date="0506"
-    elif jday == 128:
-        month_n_date="0507"
-    elif jday == 129:
-        month_n_date="0508"
-    elif jday == 130:
-        month_n_date="0509"
-    elif jday == 131:
-        month_n_date="0510"
-    elif jday == 132:
-        month_n_date="0511"
-    elif jday == 133:
-        month_n_date="0512"
-    elif jday == 134:
-        month_n_date="0513"
-    elif jday == 135:
-        month_n_date="0514"
-    elif jday == 136:
-        month_n_date="0515"
-    elif jday == 137:
-        month_n_date="0516"
-    elif jday == 138:
-        month_n_date="0517"
-    elif jday == 139:
-        month_n_date="0518"
-    elif jday == 140:
-        month_n_date="0519"
-    elif jday == 141:
-        month_n_date="0520"
-    elif jday == 142:
-        month_n_date="0521"
-    elif jday == 143:
-        month_n_date="0522"
-    elif jday == 144:
-        month_n_date="0523"
-    elif jday == 145:
-        month_n_date="0524"
-    elif jday == 146:
-        month_n_date="0525"
-    elif jday == 147:
-        month_n_date="0526"
-    elif jday == 148:
-        month_n_date="0527"
-    elif jday == 149:
-        month_n_date="0528"
-    elif jday == 150:
-        month_n_date="0529"
-    elif jday == 151:
-        month_n_date="0530"
-    elif jday == 152:
-        month_n_date="0531"
-        #--------------------------
-    elif jday == 153:
-        month_n_date="0601"
-    elif jday == 154:
-        month_n_date="0602"
-    elif jday == 155:
-        month_n_date="0603"
-    elif jday == 156:
-        month_n_date="0604"
-    elif jday == 157:
-        month_n_date="0605"
-    elif jday == 158:
-        month_n_date="0606"
-    elif jday == 159:
-        month_n_date="0607"
-    elif jday == 160:
-        month_n_date="0608"
-    elif jday == 161:
-        month_n_date="0609"
-    elif jday == 162:
-        month_n_date="0610"
-    elif jday == 163:
-        month_n_date="0611"
-    elif jday == 164:
-        month_n_date="0612"
-    elif jday == 165:
-        month_n_date="0613"
-    elif jday == 166:
-        month_n_date="0614"
-    elif jday == 167:
-        month_n_date="0615"
-    elif jday == 168:
-        month_n_date="0616"
-    elif jday == 169:
-        month_n_date="0617"
-    elif jday == 170:
-        month_n_date="0618"
-    elif jday == 171:
-        month_n_date="0619"
-    elif jday == 172:
-        month_n_date="0620"
-    elif jday == 173:
-        month_n_date="0621"
-    elif jday == 174:
-        month_n_date="0622"
-    elif jday == 175:
-        month_n_date="0623"
-    elif jday == 176:
-        month_n_date="0624"
-    elif jday == 177:
-        month_n_date="0625"
-    elif jday == 178:
-        month_n_date="0626"
-    elif jday == 179:
-        month_n_date="0627"
-    elif jday == 180:
-        month_n_date="0628"
-    elif jday == 181:
-        month_n_date="0629"
-    elif jday == 182:
-        month_n_date="0630"
-        #--------------------------
-    elif jday == 183:
-        month_n_date="0701"
-    elif jday == 184:
-        month_n_date="0702"
-    elif jday == 185:
-        month_n_date="0703"
-    elif jday == 186:
-        month_n_date="0704"
-    elif jday == 187:
-        month_n_date="0705"
-    elif jday == 188:
-        month_n_date="0706"
-    elif jday == 189:
-        month_n_date="0707"
-    elif jday == 190:
-        month_n_date="0708"
-    elif jday == 191:
-        month_n_date="0709"
-    elif jday == 192:
-        month_n_date="0710"
-    elif jday == 193:
-        month_n_date="0711"
-    elif jday == 194:
-        month_n_date="0712"
-    elif jday == 195:
-        month_n_date="0713"
-    elif jday == 196:
-        month_n_date="0714"
-    elif jday == 197:
-        month_n_date="0715"
-    elif jday == 198:
-        month_n_date="0716"
-    elif jday == 199:
-        month_n_date="0717"
-    elif jday == 200:
-        month_n_date="0718"
-    elif jday == 201:
-        month_n_date="0719"
-    elif jday == 202:
-        month_n_date="0720"
-    elif jday == 203:
-        month_n_date="0721"
-    elif jday == 204:
-        month_n_date="0722"
-    elif jday == 205:
-        month_n_date="0723"
-    elif jday == 206:
-        month_n_date="0724"
-    elif jday == 207:
-        month_n_date="0725"
-    elif jday == 208:
-        month_n_date="0726"
-    elif jday == 209:
-        month_n_date="0727"
-    elif jday == 210:
-        month_n_date="0728"
-    elif jday == 211:
-        month_n_date="0729"
-    elif jday == 212:
-        month_n_date="0730"
-    elif jday == 213:
-        month_n_date="0731"
-        #--------------------------
-    elif jday == 214:
-        month_n_date="0801"
-    elif jday == 215:
-        month_n_date="0802"
-    elif jday == 216:
-        month_n_date="0803"
-    elif jday == 217:
-        month_n_date="0804"
-    elif jday == 218:
-        month_n_date="0805"
-    elif jday == 219:
-        month_n_date="0806"
-    elif jday == 220:
-        month_n_date="0807"
-    elif jday == 221:
-        month_n_date="0808"
-    elif jday == 222:
-        month_n_date="0809"
-    elif jday == 223:
-        month_n_date="0810"
-    elif jday == 224:
-        month_n_date="0811"
-    elif jday == 225:
-        month_n_date="0812"
-    elif jday == 226:
-        month_n_date="0813"
-    elif jday == 227:
-        month_n_date="0814"
-    elif jday == 228:
-        month_n_date="0815"
-    elif jday == 229:
-        month_n_date="0816"
-    elif jday == 230:
-        month_n_date="0817"
-    elif jday == 231:
-        month_n_date="0818"
-    elif jday == 232:
-        month_n_date="0819"
-    elif jday == 233:
-        month_n_date="0820"
-    elif jday == 234:
-        month_n_date="0821"
-    elif jday == 235:
-        month_n_date="0822"
-    elif jday == 236:
-        month_n_date="0823"
-    elif jday == 237:
-        month_n_date="0824"
-    elif jday == 238:
-        month_n_date="0825"
-    elif jday == 239:
-        month_n_date="0826"
-    elif jday == 240:
-        month_n_date="0827"
-    elif jday == 241:
-        month_n_date="0828"
-    elif jday == 242:
-        month_n_date="0829"
-    elif jday == 243:
-        month_n_date="0830"
-    elif jday == 244:
-        month_n_date="0831"
-        #--------------------------
-    elif jday == 245:
-        month_n_date="0901"
-    elif jday == 246:
-        month_n_date="0902"
-    elif jday == 247:
-        month_n_date="0903"
-    elif jday == 248:
-        month_n_date="0904"
-    elif jday == 249:
-        month_n_date="0905"
-    elif jday == 250:
-        month_n_date="0906"
-    elif jday == 251:
-        month_n_date="0907"
-    elif jday == 252:
-        month_n_date="0908"
-    elif jday == 253:
-        month_n_date="0909"
-    elif jday == 254:
-        month_n_date="0910"
-    elif jday == 255:
-        month_n_date="0911"
-    elif jday == 256:
-        month_n_date="0912"
-    elif jday == 257:
-        month_n_date="0913"
-    elif jday == 258:
-        month_n_date="0914"
-    elif jday == 259:
-        month_n_date="0915"
-    elif jday == 260:
-        month_n_date="0916"
-    elif jday == 261:
-        month_n_date="0917"
-    elif jday == 262:
-        month_n_date="0918"
-    elif jday == 263:
-        month_n_date="0919"
-    elif jday == 264:
-        month_n_date="0920"
-    elif jday == 265:
-        month_n_date="0921"
-    elif jday == 266:
-        month_n_date="0922"
-    elif jday == 267:
-        month_n_date="0923"
-    elif jday == 268:
-        month_n_date="0924"
-    elif jday == 269:
-        month_n_date="0925"
-    elif jday == 270:
-        month_n_date="0926"
-    elif jday == 271:
-        month_n_date="0927"
-    elif jday == 272:
-        month_n_date="0928"
-    elif jday == 273:
-        month_n_date="0929"
-    elif jday == 274:
-        month_n_date="0930"
-        #--------------------------
-    elif jday == 275:
-        month_n_date="1001"
-    elif jday == 276:
-        month_n_date="1002"
-    elif jday == 277:
-        month_n_date="1003"
-    elif jday == 278:
-        month_n_date="1004"
-    elif jday == 279:
-        month_n_date="1005"
-    elif jday == 280:
-        month_n_date="1006"
-    elif jday == 281:
-        month_n_date="1007"
-    elif jday == 282:
-        month_n_date="1008"
-    elif jday == 283:
-        month_n_date="1009"
-    elif jday == 284:
-        month_n_date="1010"
-    elif jday == 285:
-        month_n_date="1011"
-    elif jday == 286:
-        month_n_date="1012"
-    elif jday == 287:
-        month_n_date="1013"
-    elif jday == 288:
-        month_n_date="1014"
-    elif jday == 289:
-        month_n_date="1015"
-    elif jday == 290:
-        month_n_date="1016"
-    elif jday == 291:
-        month_n_date="1017"
-    elif jday == 292:
-        month_n_date="1018"
-    elif jday == 293:
-        month_n_date="1019"
-    elif jday == 294:
-        month_n_date="1020"
-    elif jday == 295:
-        month_n_date="1021"
-    elif jday == 296:
-        month_n_date="1022"
-    elif jday == 297:
-        month_n_date="1023"
-    elif jday == 298:
-        month_n_date="1024"
-    elif jday == 299:
-        month_n_date="1025"
-    elif jday == 300:
-        month_n_date="1026"
-    elif jday == 301:
-        month_n_date="1027"
-    elif jday == 302:
-        month_n_date="1028"
-    elif jday == 303:
-        month_n_date="1029"
-    elif jday == 304:
-        month_n_date="1030"
-    elif jday == 305:
-        month_n_date="1031"
-        #--------------------------
-    elif jday == 306:
-        month_n_date="1101"
-    elif jday == 307:
-        month_n_date="1102"
-    elif jday == 308:
-        month_n_date="1103"
-    elif jday == 309:
-        month_n_date="1104"
-    elif jday == 310:
-        month_n_date="1105"
-    elif jday == 311:
-        month_n_date="1106"
-    elif jday == 312:
-        month_n_date="1107"
-    elif jday == 313:
-        month_n_date="1108"
-    elif jday == 314:
-        month_n_date="1109"
-    elif jday == 315:
-        month_n_date="1110"
-    elif jday == 316:
-        month_n_date="1111"
-    elif jday == 317:
-        month_n_date="1112"
-    elif jday == 318:
-        month_n_date="1113"
-    elif jday == 319:
-        month_n_date="1114"
-    elif jday == 320:
-        month_n_date="1115"
-    elif jday == 321:
-        month_n_date="1116"
-    elif jday == 322:
-        month_n_date="1117"
-    elif jday == 323:
-        month_n_date="1118"
-    elif jday == 324:
-        month_n_date="1119"
-    elif jday == 325:
-        month_n_date="1120"
-    elif jday == 326:
-        month_n_date="1121"
-    elif jday == 327:
-        month_n_date="1122"
-    elif jday == 328:
-        month_n_date="1123"
-    elif jday == 329:
-        month_n_date="1124"
-    elif jday == 330:
-        month_n_date="1125"
-    elif jday == 331:
-        month_n_date="1126"
-    elif jday == 332:
-        month_n_date="1127"
-    elif jday == 333:
-        month_n_date="1128"
-    elif jday == 334:
-        month_n_date="1129"
-    elif jday == 335:
-        month_n_date="1130"
-        #--------------------------
-    elif jday == 336:
-        month_n_date="1201"
-    elif jday == 337:
-        month_n_date="1202"
-    elif jday == 338:
-        month_n_date="1203"
-    elif jday == 339:
-        month_n_date="1204"
-    elif jday == 340:
-        month_n_date="1205"
-    elif jday == 341:
-        month_n_date="1206"
-    elif jday == 342:
-        month_n_date="1207"
-    elif jday == 343:
-        month_n_date="1208"
-    elif jday == 344:
-        month_n_date="1209"
-    elif jday == 345:
-        month_n_date="1210"
-    elif jday == 346:
-        month_n_date="1211"
-    elif jday == 347:
-        month_n_date="1212"
-    elif jday == 348:
-        month_n_date="1213"
-    elif jday == 349:
-        month_n_date="1214"
-    elif jday == 350:
-        month_n_date="1215"
-    elif jday == 351:
-        month_n_date="1216"
-    elif jday == 352:
-        month_n_date="1217"
-    elif jday == 353:
-        month_n_date="1218"
-    elif jday == 354:
-        month_n_date="1219"
-    elif jday == 355:
-        month_n_date="1220"
-    elif jday == 356:
-        month_n_date="1221"
-    elif jday == 357:
-        month_n_date="1222"
-    elif jday == 358:
-        month_n_date="1223"
-    elif jday == 359:
-        month_n_date="1224"
-    elif jday == 360:
-        month_n_date="1225"
-    elif jday == 361:
-        month_n_date="1226"
-    elif jday == 362:
-        month_n_date="1227"
-    elif jday == 363:
-        month_n_date="1228"
-    elif jday == 364:
-        month_n_date="1229"
-    elif jday == 365:
-        month_n_date="1230"
-    elif jday == 366:
-        month_n_date="1231"
-        #--------------------------
-        #--------------------------
-    #-=-=-=-=-=-=-=-=-=-=-=-=-=
-    else:
-    #-=-=-=-=-=-=-=-=-=-=-=-=-=
-        month_n_date="0000"
-    #-----------------------------------------------------------
-    # End of if block
-    #-----------------------------------------------------------
     #
+    # A day that is not a whole number [or NaN] is in no table entry.
+    #
+    if jday % 1 == 0:
+        month_n_date=LEAP_MMDD_TABLE[int(jday)]
+        #
     #
     return month_n_date
     #
@@ -1037,758 +314,12 @@ def Determine_mndate_from_jday(jday):
         # End of if block
         #----------------------------------------------------
 
-    if jday == 1:
-        month_n_date="0101"
-    elif jday == 2:
-        month_n_date="0102"
-    elif jday == 3:
-        month_n_date="0103"
-    elif jday == 4:
-        month_n_date="0104"
-    elif jday == 5:
-        month_n_date="0105"
-    elif jday == 6:
-        month_n_date="0106"
-    elif jday == 7:
-        month_n_date="0107"
-    elif jday == 8:
-        month_n_date="0108"
-    elif jday == 9:
-        month_n_date="0109"
-    elif jday == 10:
-        month_n_date="0110"
-    elif jday == 11:
-        month_n_date="0111"
-    elif jday == 12:
-        month_n_date="0112"
-    elif jday == 13:
-        month_n_date="0113"
-    elif jday == 14:
-        month_n_date="0114"
-    elif jday == 15:
-        month_n_date="0115"
-    elif jday == 16:
-        month_n_date="0116"
-    elif jday == 17:
-        month_n_date="0117"
-    elif jday == 18:
-        month_n_date="0118"
-    elif jday == 19:
-        month_n_date="0119"
-    elif jday == 20:
-        month_n_date="0120"
-    elif jday == 21:
-        month_n_date="0121"
-    elif jday == 22:
-        month_n_date="0122"
-    elif jday == 23:
-        month_n_date="0123"
-    elif jday == 24:
-        month_n_date="0124"
-    elif jday == 25:
-        month_n_date="0125"
-    elif jday == 26:
-        month_n_date="0126"
-    elif jday == 27:
-        month_n_date="0127"
-    elif jday == 28:
-        month_n_date="0128"
-    elif jday == 29:
-        month_n_date="0129"
-    elif jday == 30:
-        month_n_date="0130"
-    elif jday == 31:
-        month_n_date="0131"
-        #--------------------------
-    elif jday == 32:
-        month_n_date="0201"
-    elif jday == 33:
-        month_n_date="0202"
-    elif jday == 34:
-        month_n_date="0203"
-    elif jday == 35:
-        month_n_date="0204"
-    elif jday == 36:
-        month_n_date="0205"
-    elif jday == 37:
-        month_n_date="0206"
-    elif jday == 38:
-        month_n_date="0207"
-    elif jday == 39:
-        month_n_date="0208"
-    elif jday == 40:
-        month_n_date="0209"
-    elif jday == 41:
-        month_n_date="0210"
-    elif jday == 42:
-        month_n_date="0211"
-    elif jday == 43:
-        month_n_date="0212"
-    elif jday == 44:
-        month_n_date="0213"
-    elif jday == 45:
-        month_n_date="0214"
-    elif jday == 46:
-        month_n_date="0215"
-    elif jday == 47:
-        month_n_date="0216"
-    elif jday == 48:
-        month_n_date="0217"
-    elif jday == 49:
-        month_n_date="0218"
-    elif jday == 50:
-        month_n_date="0219"
-    elif jday == 51:
-        month_n_date="0220"
-    elif jday == 52:
-        month_n_date="0221"
-    elif jday == 53:
-        month_n_date="0222"
-    elif jday == 54:
-        month_n_date="0223"
-    elif jday == 55:
-        month_n_date="0224"
-    elif jday == 56:
-        month_n_date="0225"
-    elif jday == 57:
-        month_n_date="0226"
-    elif jday == 58:
-        month_n_date="0227"
-    elif jday == 59:
-        month_n_date="0228"
-        #--------------------------
-    elif jday == 60:
-        month_n_date="0301"
-    elif jday == 61:
-        month_n_date="0302"
-    elif jday == 62:
-        month_n_date="0303"
-    elif jday == 63:
-        month_n_date="0304"
-    elif jday == 64:
-        month_n_date="0305"
-    elif jday == 65:
-        month_n_date="0306"
-    elif jday == 66:
-        month_n_date="0307"
-    elif jday == 67:
-        month_n_date="0308"
-    elif jday == 68:
-        month_n_date="0309"
-    elif jday == 69:
-        month_n_date="0310"
-    elif jday == 70:
-        month_n_date="0311"
-    elif jday == 71:
-        month_n_date="0312"
-    elif jday == 72:
-        month_n_date="0313"
-    elif jday == 73:
-        month_n_date="0314"
-    elif jday == 74:
-        month_n_date="0315"
-    elif jday == 75:
-        month_n_date="0316"
-    elif jday == 76:
-        month_n_date="0317"
-    elif jday == 77:
-        month_n_date="0318"
-    elif jday == 78:
-        month_n_date="0319"
-    elif jday == 79:
-        month_n_date="0320"
-    elif jday == 80:
-        month_n_date="0321"
-    elif jday == 81:
-        month_n_date="0322"
-    elif jday == 82:
-        month_n_date="0323"
-    elif jday == 83:
-        month_n_date="0324"
-    elif jday == 84:
-        month_n_date="0325"
-    elif jday == 85:
-        month_n_date="0326"
-    elif jday == 86:
-        month_n_date="0327"
-    elif jday == 87:
-        month_n_date="0328"
-    elif jday == 88:
-        month_n_date="0329"
-    elif jday == 89:
-        month_n_date="0330"
-    elif jday == 90:
-        month_n_date="0331"
-        #--------------------------
-    elif jday == 91:
-        month_n_date="0401"
-    elif jday == 92:
-        month_n_date="0402"
-    elif jday == 93:
-        month_n_date="0403"
-    elif jday == 94:
-        month_n_date="0404"
-    elif jday == 95:
-        month_n_date="0405"
-    elif jday == 96:
-        month_n_date="0406"
-    elif jday == 97:
-        month_n_date="0407"
-    elif jday == 98:
-        month_n_date="0408"
-    elif jday == 99:
-        month_n_date="0409"
-    elif jday == 100:
-        month_n_date="0410"
-    elif jday == 101:
-        month_n_date="0411"
-    elif jday == 102:
-        month_n_date="0412"
-    elif jday == 103:
-        month_n_date="0413"
-    elif jday == 104:
-        month_n_date="0414"
-    elif jday == 105:
-        month_n_date="0415"
-    elif jday == 106:
-        month_n_date="0416"
-    elif jday == 107:
-        month_n_date="0417"
-    elif jday == 108:
-        month_n_date="0418"
-    elif jday == 109:
-        month_n_date="0419"
-    elif jday == 110:
-        month_n_date="0420"
-    elif jday == 111:
-        month_n_date="0421"
-    elif jday == 112:
-        month_n_date="0422"
-    elif jday == 113:
-        month_n_date="0423"
-    elif jday == 114:
-        month_n_date="0424"
-    elif jday == 115:
-        month_n_date="0425"
-    elif jday == 116:
-        month_n_date="0426"
-    elif jday == 117:
-        month_n_date="0427"
-    elif jday == 118:
-        month_n_date="0428"
-    elif jday == 119:
-        month_n_date="0429"
-    elif jday == 120:
-        month_n_date="0430"
-    #--------------------------
-    elif jday == 121:
-        month_n_date="0501"
-    elif jday == 122:
-        month_n_date="0502"
-    elif jday == 123:
-        month_n_date="0503"
-    elif jday == 124:
-        month_n_date="0504"
-    elif jday == 125:
-        month_n_date="0505"
-    elif jday == 126:
-        month_n_date="0506"
-    elif jday == 127:
-        month_n_date="0507"
-    elif jday == 128:
-        month_n_date="0508"
-    elif jday == 129:
-        month_n_date="0509"
-    elif jday == 130:
-        month_n_date="0510"
-    elif jday == 131:
-        month_n_date="0511"
-    elif jday == 132:
-        month_n_date="0512"
-    elif jday == 133:
-        month_n_date="0513"
-    elif jday == 134:
-        month_n_date="0514"
-    elif jday == 135:
-        month_n_date="0515"
-    elif jday == 136:
-        month_n_date="0516"
-    elif jday == 137:
-        month_n_date="0517"
-    elif jday == 138:
-        month_n_date="0518"
-    elif jday == 139:
-        month_n_date="0519"
-    elif jday == 140:
-        month_n_date="0520"
-    elif jday == 141:
-        month_n_date="0521"
-    elif jday == 142:
-        month_n_date="0522"
-    elif jday == 143:
-        month_n_date="0523"
-    elif jday == 144:
-        month_n_date="0524"
-    elif jday == 145:
-        month_n_date="0525"
-    elif jday == 146:
-        month_n_date="0526"
-    elif jday == 147:
-        month_n_date="0527"
-    elif jday == 148:
-        month_n_date="0528"
-    elif jday == 149:
-        month_n_date="0529"
-    elif jday == 150:
-        month_n_date="0530"
-    elif jday == 151:
-        month_n_date="0531"
-        #--------------------------
-        #--------------------------
-    elif jday == 152:
-        month_n_date="0601"
-    elif jday == 153:
-        month_n_date="0602"
-    elif jday == 154:
-        month_n_date="0603"
-    elif jday == 155:
-        month_n_date="0604"
-    elif jday == 156:
-        month_n_date="0605"
-    elif jday == 157:
-        month_n_date="0606"
-    elif jday == 158:
-        month_n_date="0607"
-    elif jday == 159:
-        month_n_date="0608"
-    elif jday == 160:
-        month_n_date="0609"
-    elif jday == 161:
-        month_n_date="0610"
-    elif jday == 162:
-        month_n_date="0611"
-    elif jday == 163:
-        month_n_date="0612"
-    elif jday == 164:
-        month_n_date="0613"
-    elif jday == 165:
-        month_n_date="0614"
-    elif jday == 166:
-        month_n_date="0615"
-    elif jday == 167:
-        month_n_date="0616"
-    elif jday == 168:
-        month_n_date="0617"
-    elif jday == 169:
-        month_n_date="0618"
-    elif jday == 170:
-        month_n_date="0619"
-    elif jday == 171:
-        month_n_date="0620"
-    elif jday == 172:
-        month_n_date="0621"
-    elif jday == 173:
-        month_n_date="0622"
-    elif jday == 174:
-        month_n_date="0623"
-    elif jday == 175:
-        month_n_date="0624"
-    elif jday == 176:
-        month_n_date="0625"
-    elif jday == 177:
-        month_n_date="0626"
-    elif jday == 178:
-        month_n_date="0627"
-    elif jday == 179:
-        month_n_date="0628"
-    elif jday == 180:
-        month_n_date="0629"
-    elif jday == 181:
-        month_n_date="0630"
-        #--------------------------
-    elif jday == 182:
-        month_n_date="0701"
-    elif jday == 183:
-        month_n_date="0702"
-    elif jday == 184:
-        month_n_date="0703"
-    elif jday == 185:
-        month_n_date="0704"
-    elif jday == 186:
-        month_n_date="0705"
-    elif jday == 187:
-        month_n_date="0706"
-    elif jday == 188:
-        month_n_date="0707"
-    elif jday == 189:
-        month_n_date="0708"
-    elif jday == 190:
-        month_n_date="0709"
-    elif jday == 191:
-        month_n_date="0710"
-    elif jday == 192:
-        month_n_date="0711"
-    elif jday == 193:
-        month_n_date="0712"
-    elif jday == 194:
-        month_n_date="0713"
-    elif jday == 195:
-        month_n_date="0714"
-    elif jday == 196:
-        month_n_date="0715"
-    elif jday == 197:
-        month_n_date="0716"
-    elif jday == 198:
-        month_n_date="0717"
-    elif jday == 199:
-        month_n_date="0718"
-    elif jday == 200:
-        month_n_date="0719"
-    elif jday == 201:
-        month_n_date="0720"
-    elif jday == 202:
-        month_n_date="0721"
-    elif jday == 203:
-        month_n_date="0722"
-    elif jday == 204:
-        month_n_date="0723"
-    elif jday == 205:
-        month_n_date="0724"
-    elif jday == 206:
-        month_n_date="0725"
-    elif jday == 207:
-        month_n_date="0726"
-    elif jday == 208:
-        month_n_date="0727"
-    elif jday == 209:
-        month_n_date="0728"
-    elif jday == 210:
-        month_n_date="0729"
-    elif jday == 211:
-        month_n_date="0730"
-    elif jday == 212:
-        month_n_date="0731"
-        #--------------------------
-    elif jday == 213:
-        month_n_date="0801"
-    elif jday == 214:
-        month_n_date="0802"
-    elif jday == 215:
-        month_n_date="0803"
-    elif jday == 216:
-        month_n_date="0804"
-    elif jday == 217:
-        month_n_date="0805"
-    elif jday == 218:
-        month_n_date="0806"
-    elif jday == 219:
-        month_n_date="0807"
-    elif jday == 220:
-        month_n_date="0808"
-    elif jday == 221:
-        month_n_date="0809"
-    elif jday == 222:
-        month_n_date="0810"
-    elif jday == 223:
-        month_n_date="0811"
-    elif jday == 224:
-        month_n_date="0812"
-    elif jday == 225:
-        month_n_date="0813"
-    elif jday == 226:
-        month_n_date="0814"
-    elif jday == 227:
-        month_n_date="0815"
-    elif jday == 228:
-        month_n_date="0816"
-    elif jday == 229:
-        month_n_date="0817"
-    elif jday == 230:
-        month_n_date="0818"
-    elif jday == 231:
-        month_n_date="0819"
-    elif jday == 232:
-        month_n_date="0820"
-    elif jday == 233:
-        month_n_date="0821"
-    elif jday == 234:
-        month_n_date="0822"
-    elif jday == 235:
-        month_n_date="0823"
-    elif jday == 236:
-        month_n_date="0824"
-    elif jday == 237:
-        month_n_date="0825"
-    elif jday == 238:
-        month_n_date="0826"
-    elif jday == 239:
-        month_n_date="0827"
-    elif jday == 240:
-        month_n_date="0828"
-    elif jday == 241:
-        month_n_date="0829"
-    elif jday == 242:
-        month_n_date="0830"
-    elif jday == 243:
-        month_n_date="0831"
-        #--------------------------
-    elif jday == 244:
-        month_n_date="0901"
-    elif jday == 245:
-        month_n_date="0902"
-    elif jday == 246:
-        month_n_date="0903"
-    elif jday == 247:
-        month_n_date="0904"
-    elif jday == 248:
-        month_n_date="0905"
-    elif jday == 249:
-        month_n_date="0906"
-    elif jday == 250:
-        month_n_date="0907"
-    elif jday == 251:
-        month_n_date="0908"
-    elif jday == 252:
-        month_n_date="0909"
-    elif jday == 253:
-        month_n_date="0910"
-    elif jday == 254:
-        month_n_date="0911"
-    elif jday == 255:
-        month_n_date="0912"
-    elif jday == 256:
-        month_n_date="0913"
-    elif jday == 257:
-        month_n_date="0914"
-    elif jday == 258:
-        month_n_date="0915"
-    elif jday == 259:
-        month_n_date="0916"
-    elif jday == 260:
-        month_n_date="0917"
-    elif jday == 261:
-        month_n_date="0918"
-    elif jday == 262:
-        month_n_date="0919"
-    elif jday == 263:
-        month_n_date="0920"
-    elif jday == 264:
-        month_n_date="0921"
-    elif jday == 265:
-        month_n_date="0922"
-    elif jday == 266:
-        month_n_date="0923"
-    elif jday == 267:
-        month_n_date="0924"
-    elif jday == 268:
-        month_n_date="0925"
-    elif jday == 269:
-        month_n_date="0926"
-    elif jday == 270:
-        month_n_date="0927"
-    elif jday == 271:
-        month_n_date="0928"
-    elif jday == 272:
-        month_n_date="0929"
-    elif jday == 273:
-        month_n_date="0930"
-        #--------------------------
-    elif jday == 274:
-        month_n_date="1001"
-    elif jday == 275:
-        month_n_date="1002"
-    elif jday == 276:
-        month_n_date="1003"
-    elif jday == 277:
-        month_n_date="1004"
-    elif jday == 278:
-        month_n_date="1005"
-    elif jday == 279:
-        month_n_date="1006"
-    elif jday == 280:
-        month_n_date="1007"
-    elif jday == 281:
-        month_n_date="1008"
-    elif jday == 282:
-        month_n_date="1009"
-    elif jday == 283:
-        month_n_date="1010"
-    elif jday == 284:
-        month_n_date="1011"
-    elif jday == 285:
-        month_n_date="1012"
-    elif jday == 286:
-        month_n_date="1013"
-    elif jday == 287:
-        month_n_date="1014"
-    elif jday == 288:
-        month_n_date="1015"
-    elif jday == 289:
-        month_n_date="1016"
-    elif jday == 290:
-        month_n_date="1017"
-    elif jday == 291:
-        month_n_date="1018"
-    elif jday == 292:
-        month_n_date="1019"
-    elif jday == 293:
-        month_n_date="1020"
-    elif jday == 294:
-        month_n_date="1021"
-    elif jday == 295:
-        month_n_date="1022"
-    elif jday == 296:
-        month_n_date="1023"
-    elif jday == 297:
-        month_n_date="1024"
-    elif jday == 298:
-        month_n_date="1025"
-    elif jday == 299:
-        month_n_date="1026"
-    elif jday == 300:
-        month_n_date="1027"
-    elif jday == 301:
-        month_n_date="1028"
-    elif jday == 302:
-        month_n_date="1029"
-    elif jday == 303:
-        month_n_date="1030"
-    elif jday == 304:
-        month_n_date="1031"
-        #--------------------------
-    elif jday == 305:
-        month_n_date="1101"
-    elif jday == 306:
-        month_n_date="1102"
-    elif jday == 307:
-        month_n_date="1103"
-    elif jday == 308:
-        month_n_date="1104"
-    elif jday == 309:
-        month_n_date="1105"
-    elif jday == 310:
-        month_n_date="1106"
-    elif jday == 311:
-        month_n_date="1107"
-    elif jday == 312:
-        month_n_date="1108"
-    elif jday == 313:
-        month_n_date="1109"
-    elif jday == 314:
-        month_n_date="1110"
-    elif jday == 315:
-        month_n_date="1111"
-    elif jday == 316:
-        month_n_date="1112"
-    elif jday == 317:
-        month_n_date="1113"
-    elif jday == 318:
-        month_n_date="1114"
-    elif jday == 319:
-        month_n_date="1115"
-    elif jday == 320:
-        month_n_date="1116"
-    elif jday == 321:
-        month_n_date="1117"
-    elif jday == 322:
-        month_n_date="1118"
-    elif jday == 323:
-        month_n_date="1119"
-    elif jday == 324:
-        month_n_date="1120"
-    elif jday == 325:
-        month_n_date="1121"
-    elif jday == 326:
-        month_n_date="1122"
-    elif jday == 327:
-        month_n_date="1123"
-    elif jday == 328:
-        month_n_date="1124"
-    elif jday == 329:
-        month_n_date="1125"
-    elif jday == 330:
-        month_n_date="1126"
-    elif jday == 331:
-        month_n_date="1127"
-    elif jday == 332:
-        month_n_date="1128"
-    elif jday == 333:
-        month_n_date="1129"
-    elif jday == 334:
-        month_n_date="1130"
-        #--------------------------
-    elif jday == 335:
-        month_n_date="1201"
-    elif jday == 336:
-        month_n_date="1202"
-    elif jday == 337:
-        month_n_date="1203"
-    elif jday == 338:
-        month_n_date="1204"
-    elif jday == 339:
-        month_n_date="1205"
-    elif jday == 340:
-        month_n_date="1206"
-    elif jday == 341:
-        month_n_date="1207"
-    elif jday == 342:
-        month_n_date="1208"
-    elif jday == 343:
-        month_n_date="1209"
-    elif jday == 344:
-        month_n_date="1210"
-    elif jday == 345:
-        month_n_date="1211"
-    elif jday == 346:
-        month_n_date="1212"
-    elif jday == 347:
-        month_n_date="1213"
-    elif jday == 348:
-        month_n_date="1214"
-    elif jday == 349:
-        month_n_date="1215"
-    elif jday == 350:
-        month_n_date="1216"
-    elif jday == 351:
-        month_n_date="1217"
-    elif jday == 352:
-        month_n_date="1218"
-    elif jday == 353:
-        month_n_date="1219"
-    elif jday == 354:
-        month_n_date="1220"
-    elif jday == 355:
-        month_n_date="1221"
-    elif jday == 356:
-        month_n_date="1222"
-    elif jday == 357:
-        month_n_date="1223"
-    elif jday == 358:
-        month_n_date="1224"
-    elif jday == 359:
-        month_n_date="1225"
-    elif jday == 360:
-        month_n_date="1226"
-    elif jday == 361:
-        month_n_date="1227"
-    elif jday == 362:
-        month_n_date="1228"
-    elif jday == 363:
-        month_n_date="1229"
-    elif jday == 364:
-        month_n_date="1230"
-    elif jday == 365:
-        month_n_date="1231"
-        #--------------------------
-        #--------------------------
-    #-=-=-=-=-=-=-=-=-=-=-=-=-=
-    else:
-    #-=-=-=-=-=-=-=-=-=-=-=-=-=
-        month_n_date="0000"
-    #-----------------------------------------------------------
-    # End of if block
-    #-----------------------------------------------------------
     #
+    # A day that is not a whole number [or NaN] is in no table entry.
+    #
+    if jday % 1 == 0:
+        month_n_date=MMDD_TABLE[int(jday)]
+        #
     #
     return month_n_date
     #
@@ -2152,6 +683,112 @@ def Compute_MLE_STRNG(datafromfile, MAX_data_Value):
     #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
     #### END OF Compute_MLE_STRNG FUNCTION
     #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Compute_MLE_STRNG_Array
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Compute_MLE_STRNG_Array(ambig_obj):
+    #
+    # Whole swath version of -Compute_MLE_STRNG- for the JPL -ambiguity_obj-
+    # array [row, cell, ambiguity].
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  The maximum of each WVC is found the way  -max(STR_AMBIG_OBJ)-  finds it:
+    #  a masked or NaN value never replaces the running maximum, and a masked
+    #  first value leaves the maximum masked. Every ambiguity is then scaled
+    #  as  exp((obj-max)/2)*30000 , truncated and zero padded to 5 characters.
+    #  A NaN or masked objective gives '---99', a NaN product gives '00nan'.
+    #
+    #  The values are worked in the same types as the per-cell code. The few
+    #  products that land within 1.0e-6 of a whole number are redone with
+    #  -MATH.exp- , so the truncation always agrees with -Compute_MLE_STRNG-.
+    #
+    #  Returns a String Array of the same [row, cell, ambiguity] shape.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    ambig_obj=N.ma.asarray(ambig_obj)
+    #
+    obj_mask=N.ma.getmaskarray(ambig_obj)
+    obj_data=N.ma.getdata(ambig_obj)
+    #
+    cell_type=type(obj_data.dtype.type(0)+0.0)
+    #
+    with N.errstate(invalid='ignore', over='ignore'):
+        #
+        #-----------------------------------------------------------
+        # Running maximum over the ambiguities.
+        #-----------------------------------------------------------
+        #
+        max_data=obj_data[..., 0].copy()
+        max_mask=obj_mask[..., 0].copy()
+        #
+        for k in range(1, obj_data.shape[-1]):
+            replace_max=(~obj_mask[..., k]) & (~max_mask) & (obj_data[..., k] > max_data)
+            max_data=N.where(replace_max, obj_data[..., k], max_data)
+            #
+        #
+        #-----------------------------------------------------------
+        # (obj-max)/2.0 , then exp, fabs and times 30000.0
+        #-----------------------------------------------------------
+        #
+        probability0=(obj_data-max_data[..., N.newaxis]).astype(cell_type)/cell_type(2.0)
+        probability0=N.where(max_mask[..., N.newaxis], N.nan, probability0)
+        #
+        Value_of_MLE_3K=N.fabs(N.exp(probability0.astype(N.float64)))*30000.0
+        #
+        near_whole=(Value_of_MLE_3K >= 0.5) & (N.fabs(Value_of_MLE_3K-N.around(Value_of_MLE_3K)) < 1.0e-6)
+        #
+        for k in N.flatnonzero(near_whole):
+            Value_of_MLE_3K.flat[k]=MATH.fabs(MATH.exp(probability0.flat[k]))*30000.0
+            #
+        #
+        mle_nan=N.isnan(Value_of_MLE_3K)
+        obj_nan=obj_mask | N.isnan(obj_data.astype(cell_type))
+        #
+    #
+    Value_of_MLE=N.trunc(N.where(mle_nan, 0.0, Value_of_MLE_3K)).astype(N.int64)
+    #
+    #-----------------------------------------------------------
+    # More than 5 digits: keep the first five [STR[0:5]].
+    #-----------------------------------------------------------
+    #
+    too_long=(Value_of_MLE >= 100000)
+    #
+    while N.any(too_long):
+        Value_of_MLE=N.where(too_long, Value_of_MLE//10, Value_of_MLE)
+        too_long=(Value_of_MLE >= 100000)
+        #
+    #
+    #-----------------------------------------------------------
+    # Zero padded 5 digit strings, built in a character buffer
+    # of the native string type ['S' python 2, 'U' python 3].
+    #-----------------------------------------------------------
+    #
+    str_char=N.dtype(N.str_).char
+    #
+    if str_char == 'S':
+        char_codes=N.empty(Value_of_MLE.shape+(5,), dtype=N.uint8)
+    else:
+        char_codes=N.empty(Value_of_MLE.shape+(5,), dtype=N.uint32)
+        #
+    #
+    for k in range(5):
+        char_codes[..., k]=48+(Value_of_MLE//10**(4-k))%10
+        #
+    #
+    STR_Value_of_MLE=char_codes.view(str_char+'5').reshape(Value_of_MLE.shape)
+    #
+    STR_Value_of_MLE=N.where(mle_nan, '00nan', STR_Value_of_MLE)
+    STR_Value_of_MLE=N.where(obj_nan, '---99', STR_Value_of_MLE)
+    #
+    return( STR_Value_of_MLE)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Compute_MLE_STRNG_Array FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
 
 #
 #xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
@@ -3779,6 +2416,14 @@ def main():
     #
     #
     #--------------------------------------------------------
+    # MLE codes of all the ambiguities [row, cell, ambiguity] at once.
+    # [Replaces max(STR_AMBIG_OBJ) and the four Compute_MLE_STRNG
+    #  calls of every WVC in the loop below]
+    #--------------------------------------------------------
+    #
+    STR_AMBIG_OBJ_MLE=Compute_MLE_STRNG_Array(data_ambig_obj)
+    #
+    #--------------------------------------------------------
     #Begin nested loop for printing out the data elements
     #--------------------------------------------------------
     #
@@ -4342,8 +2987,7 @@ def main():
             STR_AMBIG_OBJ=data_ambig_obj[i,j]
             #-----------------------------------
             #
-            MAX_STR_AMBIG_OBJ=0
-	    MAX_STR_AMBIG_OBJ=max(STR_AMBIG_OBJ)
+            ###MAX_STR_AMBIG_OBJ=max(STR_AMBIG_OBJ)  [see STR_AMBIG_OBJ_MLE]
             #
             #-----------------------------------
             #
@@ -4379,7 +3023,7 @@ def main():
             STR_AMBIG_DIR0_B=Determine_Wind_Direction(data_from_file)
             #
             datafromfile=STR_AMBIG_OBJ0_A
-	    STR_AMBIG_OBJ0_B=Compute_MLE_STRNG(datafromfile,MAX_STR_AMBIG_OBJ)
+	    STR_AMBIG_OBJ0_B=STR_AMBIG_OBJ_MLE[i,j,0]
 	    #STR_AMBIG_OBJ0_B=Compute_MLE_STRNG(datafromfile)
             #
             # Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z  
@@ -4399,7 +3043,7 @@ def main():
             STR_AMBIG_DIR1_B=Determine_Wind_Direction(data_from_file)
             #
             datafromfile=STR_AMBIG_OBJ1_A
-	    STR_AMBIG_OBJ1_B=Compute_MLE_STRNG(datafromfile,MAX_STR_AMBIG_OBJ)
+	    STR_AMBIG_OBJ1_B=STR_AMBIG_OBJ_MLE[i,j,1]
 	    #STR_AMBIG_OBJ1_B=Compute_MLE_STRNG(datafromfile)
             #
             #
@@ -4420,7 +3064,7 @@ def main():
             STR_AMBIG_DIR2_B=Determine_Wind_Direction(data_from_file)
             #
             datafromfile=STR_AMBIG_OBJ2_A
-	    STR_AMBIG_OBJ2_B=Compute_MLE_STRNG(datafromfile,MAX_STR_AMBIG_OBJ)
+	    STR_AMBIG_OBJ2_B=STR_AMBIG_OBJ_MLE[i,j,2]
 	    #STR_AMBIG_OBJ2_B=Compute_MLE_STRNG(datafromfile)
             #
             # Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z  
@@ -4440,7 +3084,7 @@ def main():
             STR_AMBIG_DIR3_B=Determine_Wind_Direction(data_from_file)
             #
             datafromfile=STR_AMBIG_OBJ3_A
-	    STR_AMBIG_OBJ3_B=Compute_MLE_STRNG(datafromfile,MAX_STR_AMBIG_OBJ)
+	    STR_AMBIG_OBJ3_B=STR_AMBIG_OBJ_MLE[i,j,3]
 	    #STR_AMBIG_OBJ3_B=Compute_MLE_STRNG(datafromfile)
             #
             # Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z Z  
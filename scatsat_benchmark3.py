@@ -0,0 +1,523 @@
+#!/satdat/python/sata/bin/python
+# -*- coding: utf-8 -*-
+#==============================================================
+#
+#==============================================================
+#
+#
+#==-FNMOC/N38DI PYTHON PROGRAM DEFINITION-==========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_benchmark3.py
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  PROGRAM OVERVIEW:
+#	(1) Throughput benchmark of the converters on synthetic level 2B
+#	    swaths [scatsat_core/synthetic_swaths.py], so a baseline can be
+#	    taken without a live KNMI push:
+#	        oscat_*  rapid_*  [KNMI]     rs_l2b_*  [JPL]
+#	        25 km [1624 x 72]  and  50 km [812 x 36]
+#	(2) Stage mode [the default] runs the converter steps in python, one
+#	    fresh process per case, and times each stage:
+#	        read      Open_NCDF_File, Read_Swath_Variables, Read_Time_Units
+#	        time      Get_Converted_Time_Array
+#	        format    ASCII_WRITERS [QSCAT, SATFOCUS]
+#	        write     ascii file written under a .part name and renamed
+#	        perl      the PERL adjust script [only with --perl]
+#	        distrib   Publish_File to the 7 targets of the fan-out
+#	    and reports cells per second and the peak RSS of the case.
+#	    Nothing outside the work directory is touched.
+#	    --readers netcdf4,mmap times each case with both NETCDF readers:
+#	    netCDF4, and the memory mapped netCDF3 reader [SCATSAT_NCDF_MMAP=1,
+#	    the KNMI files only: a JPL file is netCDF4 and reads the same].
+#	(3) End to end mode [--end-to-end] runs the two *3.py converters with
+#	    --all on an inbox of synthetic oscat_ files [XFER_BASEPATH] and a
+#	    KNMI tree in the work directory [KNMI_BASEPATH], and reports the wall
+#	    time, cells per second and the peak RSS of the converter.
+#	    ***  The alpha, beta and ops targets [ascii_aa, ascii_bb, ascii_oo]
+#	    ***  and /satdat/curr/scatsat_satfocus are hardcoded in the
+#	    ***  converters and get the synthetic files too. TEST MACHINES ONLY.
+#
+#  USAGE:
+#	python scatsat_benchmark3.py [--grid 25km|50km|all] [--products oscat,rapid,jpl]
+#	                             [--files N] [--repeat N] [--perl] [--end-to-end]
+#	                             [--readers netcdf4,mmap] [--workdir DIR]
+#
+# Programmer: Mr. Paul McCrone     02 February  2015 --Original Build for NASA RAPIDSCAT----
+#                                  13 September 2017 --New modified build for ISRO ScatSat--
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 First version.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.1, Dated 2026-Oct-17
+#                                 --readers [netcdf4, mmap: SCATSAT_NCDF_MMAP=1].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.2, Dated 2026-Oct-17
+#                                 The synthetic swaths come from scatsat_core.synthetic_swaths
+#                                 [no longer imported by the package].
+#========================================================================================
+#
+import os as OS
+import sys as SYS
+import time as TIME
+import shutil as SHUTIL
+import datetime
+import resource as RESOURCE
+import tempfile as TEMPFILE
+import subprocess as SUBPROCESS
+import concurrent.futures as FUTURES
+#
+#
+#----------------------------------------------------------------
+# scatsat_core is next to this script [${EXECDIR}].
+#----------------------------------------------------------------
+#
+SYS.path.insert(0, OS.path.dirname(OS.path.abspath(__file__)))
+#
+from scatsat_core import NCDF_READERS, Open_NCDF_File, Read_Swath_Variables, Read_Time_Units
+from scatsat_core import Get_Converted_Time_Array, ASCII_WRITERS, WRITER_SWATH_VARIABLES, Publish_File
+from scatsat_core.synthetic_swaths import SWATH_GRIDS, SYNTHETIC_PRODUCTS, Synthetic_NCDF_File_Name, Write_Synthetic_NCDF_File
+#
+#
+#----------------------------------------------------------------
+# The PERL adjust script of each writer [SCATSAT_PERL_ADJUST=1 mode].
+#----------------------------------------------------------------
+#
+PERL_ADJUST_SCRIPTS={'QSCAT':'rscat_wind_adjust_rscat_data.pl',
+                     'SATFOCUS':'rscat_knmi_adjust_satfocus_data.pl'}
+#
+CONVERTER_SCRIPTS={'QSCAT':'scatsat_knmi_convert_rscat_ncdf_2_qscat_ASCII3.py',
+                   'SATFOCUS':'scatsat_knmi_convert_rscat_ncdf_2_satfocus3.py'}
+#
+#----------------------------------------------------------------
+# The 7 targets of the ascii fan-out [orig, temp, aa, bb, oo, isis, bbp].
+#----------------------------------------------------------------
+#
+DISTRIBUTION_TARGETS=('ascii', 'ascii_temp', 'ascii_aa', 'ascii_bb', 'ascii_oo', 'ascii_2_isis', 'ascii_bbp')
+#
+KNMI_TREE=('graphic', 'ascii', 'ascii_temp', 'ascii_2_isis', 'Nutil', 'Nprocessed',
+           'satfocus', 'satfocus_ascii', 'satfocus_ascii_temp', 'Nprocessed_satfocus')
+#
+STAGE_NAMES=('read', 'time', 'format', 'write', 'perl', 'distrib')
+#
+#----------------------------------------------------------------
+# The NETCDF readers [--readers] and their SCATSAT_NCDF_MMAP setting.
+#----------------------------------------------------------------
+#
+NCDF_READER_MODES={'netcdf4':'0',
+                   'mmap':'1'}
+#
+BENCHMARK_START_TIME=datetime.datetime(2017, 2, 14, 8, 30, 58)
+#
+#
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#  LIST OF PYTHON FUNCTIONS:
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#  ==> Get_Option(option_name, default_value)
+#	--> option_name:String [--grid], Output: String
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Peak_RSS_MB(who)
+#	--> who:RESOURCE.RUSAGE_SELF or RUSAGE_CHILDREN, Output: Float [MB]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Make_Synthetic_Files(workdir, product, grid, number_of_files)
+#	--> Output: List of NETCDF file names
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Benchmark_Stages(nc_filename, product, writer_name, workdir, use_perl, reader_name)
+#	--> Output: Dictionary [cells, stage seconds, peak_rss]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Benchmark_End_To_End(writer_name, nc_filenames, workdir)
+#	--> Output: Dictionary [cells, total seconds, peak_rss, exit]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Print_Benchmark_Line(case_name, result)
+#	--> Output: None
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> main()
+#	--> Output: Integer [0 or 1]
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Option
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Option(option_name, default_value):
+    #
+    if option_name in SYS.argv[1:]:
+        return( SYS.argv[SYS.argv.index(option_name)+1])
+        #
+    #
+    return( default_value)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Option FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Peak_RSS_MB
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Peak_RSS_MB(who):
+    #
+    # ru_maxrss is in kilobytes on Linux [bytes on a Mac].
+    #
+    peak_rss=RESOURCE.getrusage(who).ru_maxrss
+    #
+    if SYS.platform == 'darwin':
+        peak_rss=peak_rss/1024.0
+        #
+    #
+    return( peak_rss/1024.0)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Peak_RSS_MB FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Make_Synthetic_Files
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Make_Synthetic_Files(workdir, product, grid, number_of_files):
+    #
+    # One orbit after the other, revs 02048, 02049, ...
+    #
+    nc_filenames=[]
+    #
+    for file_number in range(number_of_files):
+        #
+        start_time=BENCHMARK_START_TIME+datetime.timedelta(minutes=101*file_number)
+        nc_filename=OS.path.join(workdir, Synthetic_NCDF_File_Name(product, grid, start_time, 2048+file_number))
+        #
+        Write_Synthetic_NCDF_File(nc_filename, product, grid, start_time, seed=file_number)
+        nc_filenames.append(nc_filename)
+        #
+    #
+    return( nc_filenames)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Make_Synthetic_Files FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Benchmark_Stages
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Benchmark_Stages(nc_filename, product, writer_name, workdir, use_perl, reader_name):
+    #
+    # The steps of -main- for one file and one writer, each timed.
+    # Runs in a process of its own [see -main-], so the peak RSS is
+    # the one of this case, and SCATSAT_NCDF_MMAP [-reader_name-] is
+    # only set for it.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  With -use_perl- the records are built without the FNMOC
+    #  modifications and the PERL script makes them, as with
+    #  SCATSAT_PERL_ADJUST=1.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    result={'cells':0, 'perl_exit':0}
+    #
+    ncdf_reader=NCDF_READERS['JPL' if product == 'jpl' else 'KNMI']
+    OS.environ['SCATSAT_NCDF_MMAP']=NCDF_READER_MODES[reader_name]
+    #
+    start_clock=TIME.perf_counter()
+    #
+    fileobj=Open_NCDF_File(nc_filename)
+    swath=Read_Swath_Variables(fileobj, ncdf_reader, WRITER_SWATH_VARIABLES[writer_name])
+    time_units=Read_Time_Units(fileobj, ncdf_reader)
+    fileobj.close()
+    #
+    result['cells']=swath['lat'].size
+    result['read']=TIME.perf_counter()-start_clock
+    #
+    start_clock=TIME.perf_counter()
+    obs_time=Get_Converted_Time_Array(swath['time'], time_units)
+    result['time']=TIME.perf_counter()-start_clock
+    #
+    start_clock=TIME.perf_counter()
+    STR_ALL_LINES=ASCII_WRITERS[writer_name](obs_time, swath, '02048', not use_perl)
+    result['format']=TIME.perf_counter()-start_clock
+    #
+    case_dir=TEMPFILE.mkdtemp(prefix='case_', dir=workdir)
+    ascii_file_name=OS.path.join(case_dir, 'benchmark_'+writer_name.lower()+'.txt')
+    #
+    start_clock=TIME.perf_counter()
+    with open(ascii_file_name+'.part', 'w') as writefileobj:
+        writefileobj.write(STR_ALL_LINES)
+        #
+    #
+    OS.replace(ascii_file_name+'.part', ascii_file_name)
+    result['write']=TIME.perf_counter()-start_clock
+    #
+    result['perl']=0.0
+    #
+    if use_perl:
+        perl_script=OS.path.join(OS.path.dirname(OS.path.abspath(__file__)), PERL_ADJUST_SCRIPTS[writer_name])
+        #
+        start_clock=TIME.perf_counter()
+        result['perl_exit']=SUBPROCESS.call(['perl', perl_script, ascii_file_name],
+                                            stdout=SUBPROCESS.DEVNULL, stderr=SUBPROCESS.DEVNULL)
+        result['perl']=TIME.perf_counter()-start_clock
+        #
+    #
+    published_ascii_files={}
+    target_dirs=[OS.path.join(case_dir, target_name) for target_name in DISTRIBUTION_TARGETS]
+    #
+    for target_dir in target_dirs:
+        OS.mkdir(target_dir)
+        #
+    #
+    start_clock=TIME.perf_counter()
+    for target_dir in target_dirs:
+        Publish_File(ascii_file_name, target_dir, published_ascii_files)
+        #
+    #
+    result['distrib']=TIME.perf_counter()-start_clock
+    #
+    SHUTIL.rmtree(case_dir)
+    #
+    result['total']=sum(result[stage_name] for stage_name in STAGE_NAMES)
+    result['peak_rss']=Peak_RSS_MB(RESOURCE.RUSAGE_SELF)
+    #
+    return( result)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Benchmark_Stages FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Benchmark_End_To_End
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Benchmark_End_To_End(writer_name, nc_filenames, workdir):
+    #
+    # Runs the *3.py converter of -writer_name- with --all on a copy of
+    # -nc_filenames- . Its stdout is kept in the work directory
+    # [end_to_end_QSCAT.log, ...].
+    #
+    inbox=OS.path.join(workdir, 'inbox_'+writer_name.lower())
+    knmi_basepath=OS.path.join(workdir, 'KNMI')
+    #
+    OS.makedirs(inbox)
+    for tree_name in KNMI_TREE:
+        if not OS.path.isdir(OS.path.join(knmi_basepath, tree_name)):
+            OS.makedirs(OS.path.join(knmi_basepath, tree_name))
+            #
+        #
+    #
+    result={'cells':0}
+    #
+    for nc_filename in nc_filenames:
+        SHUTIL.copy(nc_filename, inbox)
+        fileobj=Open_NCDF_File(nc_filename)
+        result['cells']+=fileobj.variables['lat'].size
+        fileobj.close()
+        #
+    #
+    converter_env=dict(OS.environ, XFER_BASEPATH=inbox, KNMI_BASEPATH=knmi_basepath)
+    converter_script=OS.path.join(OS.path.dirname(OS.path.abspath(__file__)), CONVERTER_SCRIPTS[writer_name])
+    #
+    with open(OS.path.join(workdir, 'end_to_end_'+writer_name+'.log'), 'w') as logfileobj:
+        #
+        start_clock=TIME.perf_counter()
+        converter=SUBPROCESS.Popen([SYS.executable, converter_script, '--all'], env=converter_env,
+                                   cwd=OS.path.dirname(converter_script), stdout=logfileobj, stderr=SUBPROCESS.STDOUT)
+        #
+        # wait4 gives the rusage of this one child.
+        #
+        child_pid,child_status,child_rusage=OS.wait4(converter.pid, 0)
+        converter.returncode=OS.WEXITSTATUS(child_status) if OS.WIFEXITED(child_status) else -1
+        result['total']=TIME.perf_counter()-start_clock
+        #
+    #
+    result['exit']=converter.returncode
+    result['peak_rss']=child_rusage.ru_maxrss/1024.0
+    #
+    return( result)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Benchmark_End_To_End FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Print_Benchmark_Line
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Print_Benchmark_Line(case_name, result):
+    #
+    stage_times=' '.join('%8s' % ('%.3f' % result[stage_name] if stage_name in result else '-')
+                         for stage_name in STAGE_NAMES)
+    #
+    print('%-26s %9d %11.0f %s %8.3f %9.1f' % (case_name, result['cells'], result['cells']/max(result['total'], 1.0e-9),
+                                             stage_times, result['total'], result['peak_rss']))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Print_Benchmark_Line FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function main
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def main():
+    #
+    dadash="----------------------------------------------------------------"
+    #
+    grid_option=Get_Option('--grid', 'all')
+    grids=sorted(SWATH_GRIDS) if grid_option == 'all' else [grid_option]
+    products=Get_Option('--products', ','.join(SYNTHETIC_PRODUCTS)).split(',')
+    number_of_files=int(Get_Option('--files', '1'))
+    number_of_repeats=max(1, int(Get_Option('--repeat', '3')))
+    use_perl='--perl' in SYS.argv[1:]
+    end_to_end='--end-to-end' in SYS.argv[1:]
+    reader_names=Get_Option('--readers', 'netcdf4').split(',')
+    #
+    for name in reader_names:
+        if name not in NCDF_READER_MODES:
+            print("---Unknown reader "+name+", use one of: "+','.join(sorted(NCDF_READER_MODES)))
+            return( 1)
+            #
+        #
+    #
+    for name in grids:
+        if name not in SWATH_GRIDS:
+            print("---Unknown grid "+name+", use one of: "+', '.join(sorted(SWATH_GRIDS))+" or all")
+            return( 1)
+            #
+        #
+    #
+    for name in products:
+        if name not in SYNTHETIC_PRODUCTS:
+            print("---Unknown product "+name+", use one of: "+','.join(SYNTHETIC_PRODUCTS))
+            return( 1)
+            #
+        #
+    #
+    workdir=Get_Option('--workdir', '')
+    keep_workdir=(workdir != '')
+    #
+    if keep_workdir:
+        if not OS.path.isdir(workdir):
+            OS.makedirs(workdir)
+            #
+        #
+        workdir=TEMPFILE.mkdtemp(prefix='scatsat_benchmark_', dir=workdir)
+    else:
+        workdir=TEMPFILE.mkdtemp(prefix='scatsat_benchmark_')
+        #
+    #
+    print(dadash)
+    print("SCATSAT benchmark, work directory: "+workdir)
+    print("Grids: "+', '.join(grids)+"   Products: "+', '.join(products)+"   Files: "+str(number_of_files))
+    print("Stage mode: best of "+str(number_of_repeats)+" runs, PERL pass "+('on' if use_perl else 'off')+
+          ", readers: "+', '.join(reader_names))
+    print(dadash)
+    print('%-26s %9s %11s %s %8s %9s' % ('case', 'cells', 'cells/s', ' '.join('%8s' % stage_name for stage_name in STAGE_NAMES),
+                                         'total', 'rss_MB'))
+    #
+    for grid in grids:
+        for product in products:
+            #
+            nc_filenames=Make_Synthetic_Files(workdir, product, grid, number_of_files)
+            #
+            for writer_name in sorted(ASCII_WRITERS):
+                #
+                for reader_name in reader_names:
+                    #
+                    best_result=None
+                    #
+                    for repeat_number in range(number_of_repeats):
+                        #
+                        results=[]
+                        for nc_filename in nc_filenames:
+                            #
+                            # A fresh process for each case: its peak RSS is the case's own.
+                            #
+                            with FUTURES.ProcessPoolExecutor(max_workers=1) as executor:
+                                results.append(executor.submit(Benchmark_Stages, nc_filename, product,
+                                                               writer_name, workdir, use_perl, reader_name).result())
+                                #
+                            #
+                        #
+                        run_result=dict((stage_name, sum(result[stage_name] for result in results))
+                                        for stage_name in STAGE_NAMES+('cells', 'total'))
+                        run_result['peak_rss']=max(result['peak_rss'] for result in results)
+                        run_result['perl_exit']=max(result['perl_exit'] for result in results)
+                        #
+                        if best_result is None or run_result['total'] < best_result['total']:
+                            best_result=run_result
+                            #
+                        #
+                    #
+                    case_name=product+' '+grid+' '+writer_name
+                    if len(reader_names) > 1:
+                        case_name=case_name+' '+reader_name
+                        #
+                    #
+                    Print_Benchmark_Line(case_name, best_result)
+                    #
+                    if best_result['perl_exit'] != 0:
+                        print("   ---The PERL script exited with "+str(best_result['perl_exit']))
+                        #
+                    #
+                #
+            #
+            if end_to_end and product == 'oscat':
+                #
+                for writer_name in sorted(CONVERTER_SCRIPTS):
+                    result=Benchmark_End_To_End(writer_name, nc_filenames, OS.path.join(workdir, grid))
+                    Print_Benchmark_Line(product+' '+grid+' '+writer_name+' e2e', result)
+                    #
+                    if result['exit'] != 0:
+                        print("   ---The converter exited with "+str(result['exit'])+", see "+workdir)
+                        #
+                    #
+                #
+            #
+            for nc_filename in nc_filenames:
+                OS.remove(nc_filename)
+                #
+            #
+        #
+    #
+    print(dadash)
+    #
+    if not keep_workdir:
+        SHUTIL.rmtree(workdir)
+        #
+    #
+    return( 0)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF main FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+if __name__ == '__main__':
+    SYS.exit(main())
+    #
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+#==-FNMOC/N38DI PYTHON PACKAGE DEFINITION-==========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_core
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  PACKAGE OVERVIEW:
+#	(1) The converter code that used to be copied into every
+#	    *_convert_rscat_ncdf_2_*.py script. The converter scripts import it
+#	    from the directory they run in [${EXECDIR}].
+#	(2) A pluggable reader for the NETCDF variable names [NCDF_READERS:
+#	    KNMI, JPL] and a pluggable writer for the ascii records
+#	    [ASCII_WRITERS: QSCAT, SATFOCUS].
+#
+#	    jday_tables.py      Julian day to month and date [MMDD_TABLE, LEAP_MMDD_TABLE]
+#	    time_conversion.py  Wall clock and spacecraft time conversions
+#	    wind_strings.py     Value to string helpers
+#	    ncdf_readers.py     KNMI and JPL variable names, Open_NCDF_File [.nc, .nc.gz],
+#	                        Read_Swath_Variables, Read_Time_Units
+#	    ncdf3_mmap.py       Memory mapped netCDF3 reader [SCATSAT_NCDF_MMAP=1], masked
+#	                        and scaled as netCDF4 does, a block of rows at a time
+#	    ascii_writers.py    FGGE qscat and SATFOCUS records
+#	    packed_strings.py   Packed values [SCATSAT_PACKED_VALUES=1]: the fields
+#	                        formatted from the raw netCDF integers
+#	    backlog.py          Backlog mode [--all, --workers N], the execution code messages
+#	    inbox_watch.py      Watch mode [scatsat_knmi_daemon3.py]: inotify or polling of
+#	                        XFER_BASEPATH, each file converted as it arrives
+#	    streaming.py        Streaming conversion [SCATSAT_CHUNK_ROWS]: N scan rows
+#	                        read, formatted and appended at a time
+#	    pipeline.py         One decode, many outputs [scatsat_knmi_pipeline3.py]: the
+#	                        swath is read once for all the converters
+#	    file_ops.py         chmod, echo, cat, rm, ls, cp and gunzip without a subshell,
+#	                        hardlinked fan-out of the ascii file
+#	    run_log.py          LOGGER [SCATSAT_LOG_LEVEL] and the per-cell problem
+#	                        counters [RUN_COUNTS], the stage timers [STAGE_TIMES]
+#	    synthetic_swaths.py Synthetic oscat, rapid and rs_l2b files for the benchmark
+#	                        [scatsat_benchmark3.py]
+#	    scalar_writers.py   The reference i/j loop writers [SCALAR_ASCII_WRITERS] for
+#	                        the regression run [scatsat_regression3.py]
+#	    The last two are not imported here, so the converters do not load them:
+#	    the benchmark and the regression run import them from their modules.
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 First version.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.1, Dated 2026-Oct-17
+#                                 WRITER_SWATH_VARIABLES [selective NETCDF reads].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.2, Dated 2026-Oct-17
+#                                 Determine_Wind_SPEED_Array, Determine_Wind_Direction_Array.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.3, Dated 2026-Oct-17
+#                                 Compute_MLE_STRNG_Array.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.4, Dated 2026-Oct-17
+#                                 file_ops.py [Copy_File_Atomically moved there].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.5, Dated 2026-Oct-17
+#                                 Publish_File.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.6, Dated 2026-Oct-17
+#                                 Open_NCDF_File [.nc.gz read from memory].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.7, Dated 2026-Oct-17
+#                                 Get_Time90_Strings and TIME90_CACHE_COUNTS.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.8, Dated 2026-Oct-17
+#                                 run_log.py.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.9, Dated 2026-Oct-17
+#                                 MMDD_TABLE, LEAP_MMDD_TABLE and Determine_mndate_Array.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.10, Dated 2026-Oct-17
+#                                 Get_Converted_Time_Array, Get_Time_Units_Basis,
+#                                 TIME90_UNITS and Read_Time_Units.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.11, Dated 2026-Oct-17
+#                                 synthetic_swaths.py.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.12, Dated 2026-Oct-17
+#                                 scalar_writers.py.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.13, Dated 2026-Oct-17
+#                                 STAGE_TIMES, Reset_Stage_Times, Start_Stage_Clock,
+#                                 Stop_Stage_Clock and Report_Stage_Times.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.14, Dated 2026-Oct-17
+#                                 inbox_watch.py and Report_Execution_Code.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.15, Dated 2026-Oct-17
+#                                 pipeline.py.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.16, Dated 2026-Oct-17
+#                                 streaming.py, Read_Swath_Rows and Get_Swath_Variables.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.17, Dated 2026-Oct-17
+#                                 ncdf3_mmap.py.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.18, Dated 2026-Oct-17
+#                                 packed_strings.py, Read_Swath_Slice and the
+#                                 field string functions of ascii_writers.py.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.19, Dated 2026-Oct-17
+#                                 Run_Converter_Main [backlog.py].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.20, Dated 2026-Oct-17
+#                                 Get_Inbox_File_Stamp [inbox_watch.py].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.21, Dated 2026-Oct-17
+#                                 Get_Done_Marker_Name, Remove_Done_Markers
+#                                 [pipeline.py].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.22, Dated 2026-Oct-17
+#                                 Reserve_File_Name [file_ops.py].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.23, Dated 2026-Oct-17
+#                                 Get_Number_Of_Workers [backlog.py].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.24, Dated 2026-Oct-17
+#                                 synthetic_swaths.py and scalar_writers.py are no
+#                                 longer imported by the package.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.25, Dated 2026-Oct-17
+#                                 PIPELINE_MAX_TRIES, Count_Pipeline_Try,
+#                                 Keep_Failed_NCDF_File [pipeline.py].
+#                                 Remove_Done_Markers is now Remove_Pipeline_Markers.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.26, Dated 2026-Oct-17
+#                                 Get_NCDF3_Data_Size, Check_NCDF3_File_Size
+#                                 [ncdf3_mmap.py].
+#========================================================================================
+#
+from .run_log import LOGGER, RUN_COUNTS, Setup_Run_Logging, Count_Run_Event, Reset_Run_Counts, Report_Run_Counts
+from .run_log import STAGE_TIMES, Reset_Stage_Times, Start_Stage_Clock, Stop_Stage_Clock, Report_Stage_Times
+from .jday_tables import Determine_mndate_from_leapjday, Determine_mndate_from_jday
+from .jday_tables import MMDD_TABLE, LEAP_MMDD_TABLE, Determine_mndate_Array
+from .time_conversion import Print_Current_Time, Access_Current_Time, Get_Converted_Time90, Get_Converted_Time90_Array
+from .time_conversion import Get_Time90_Strings, TIME90_CACHE_COUNTS
+from .time_conversion import Get_Converted_Time_Array, Get_Time_Units_Basis, TIME90_UNITS
+from .wind_strings import Determine_Wind_SPEED, Determine_Wind_Direction, Compute_MLE_STRNG
+from .wind_strings import Determine_Wind_SPEED_Array, Determine_Wind_Direction_Array, Compute_MLE_STRNG_Array
+from .wind_strings import Get_Cell_Values, Get_Value_Strings, Slice_Value_Strings, Get_Digit_Strings
+from .ncdf_readers import KNMI_NCDF_VARIABLES, JPL_NCDF_VARIABLES, NCDF_READERS, Open_NCDF_File, Read_Swath_Variables, Read_Time_Units
+from .ncdf_readers import Read_Swath_Rows, Get_Swath_Variables, Read_Swath_Slice
+from .ncdf3_mmap import Use_Mapped_NCDF_Reader, Is_NCDF3_File, Open_Mapped_NCDF_File, Mapped_NCDF_File, Mapped_NCDF_Variable
+from .ncdf3_mmap import Get_NCDF3_Data_Size, Check_NCDF3_File_Size
+from .packed_strings import PACKED_DEGREES_SCALE, PACKED_STRING_TABLES, Use_Packed_Values, Get_Variable_Packing
+from .packed_strings import Unpack_Values, Unpack_Swath_Values, Get_Packed_Cell_Values, Is_Packed_Degrees
+from .packed_strings import Get_Packed_String_Table, Get_Field_Strings, Get_Fixed_Point_Strings
+from .packed_strings import Get_Packed_QSCAT_Latitude_Strings, Get_Packed_QSCAT_Longitude_Strings
+from .packed_strings import Get_Packed_SATFOCUS_Latitude_Strings, Get_Packed_SATFOCUS_Longitude_Strings
+from .ascii_writers import Format_QSCAT_Records, Format_SATFOCUS_Records, Write_QSCAT_Swath, Write_SATFOCUS_Swath, ASCII_WRITERS, WRITER_SWATH_VARIABLES
+from .ascii_writers import Get_QSCAT_Latitude_Strings, Get_QSCAT_Longitude_Strings, Get_QSCAT_Wind_Speed_Strings
+from .ascii_writers import Get_QSCAT_Wind_Direction_Strings, Get_QSCAT_Model_Speed_Strings, Get_QSCAT_Model_Direction_Strings
+from .ascii_writers import Get_SATFOCUS_Latitude_Strings, Get_SATFOCUS_Longitude_Strings
+from .ascii_writers import Get_SATFOCUS_Wind_Speed_Strings, Get_SATFOCUS_Wind_Direction_Strings
+from .backlog import Find_Pending_NCDF_Files, Run_Converter_Main, Convert_Pending_NCDF_File, Process_Pending_NCDF_Files
+from .backlog import Get_Number_Of_Workers, Report_Execution_Code
+from .inbox_watch import Open_Inbox_Watch, Close_Inbox_Watch, Get_Inbox_File_Stamp, Wait_For_Inbox_Files, Convert_Inbox_NCDF_File, Serve_Inbox_NCDF_Files
+from .streaming import Get_Chunk_Rows, Write_Swath_In_Chunks
+from .pipeline import Decode_NCDF_Swath, Close_Decoded_Swath, Get_Done_Marker_Name, Remove_Pipeline_Markers
+from .pipeline import PIPELINE_MAX_TRIES, Count_Pipeline_Try, Keep_Failed_NCDF_File, Convert_NCDF_File_Once
+from .file_ops import Change_File_Mode, Write_Text_File, Append_File, Remove_File, List_NCDF_Files
+from .file_ops import Gunzip_File, Copy_File_Atomically, Publish_File, Reserve_File_Name
+#
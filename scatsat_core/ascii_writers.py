@@ -0,0 +1,772 @@
+# -*- coding: utf-8 -*-
+#==-FNMOC/N38DI PYTHON MODULE DEFINITION-===========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_core/ascii_writers.py
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  MODULE OVERVIEW:
+#	(1) The record writers: the whole swath formatted as FGGE qscat
+#	    records or as SATFOCUS records, returned as one String.
+#	(2) ASCII_WRITERS maps a writer name [QSCAT, SATFOCUS] to a function
+#	    that takes the swath dictionary from -Read_Swath_Variables-.
+#	    WRITER_SWATH_VARIABLES holds the swath names each writer uses.
+#	(3) Each field of a record has its own string function [Get_QSCAT_*,
+#	    Get_SATFOCUS_*]. With SCATSAT_PACKED_VALUES=1 the swath holds the
+#	    raw packed integers and swath['packing'] their scaling: the field
+#	    is then formatted by -Get_Field_Strings- [packed_strings.py], to
+#	    the same strings.
+#
+# Programmer: Mr. Paul McCrone     02 February  2015 --Original Build for NASA RAPIDSCAT----
+#                                  13 September 2017 --New modified build for ISRO ScatSat--
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 Moved out of the converter scripts into the shared
+#                                 scatsat_core package.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.1, Dated 2026-Oct-17
+#                                 Each writer declares the swath variables it uses
+#                                 [WRITER_SWATH_VARIABLES], so only those are read.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.2, Dated 2026-Oct-17
+#                                 The model wind codes come from the whole swath
+#                                 versions of Determine_Wind_SPEED/Direction.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.3, Dated 2026-Oct-17
+#                                 The time strings are formatted once per distinct
+#                                 time [Get_Time90_Strings].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.4, Dated 2026-Oct-17
+#                                 The writers take a block of scan rows as well as the
+#                                 whole swath [first_row, for the streaming conversion].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.5, Dated 2026-Oct-17
+#                                 One string function per field, and the -packing- of
+#                                 the swath [SCATSAT_PACKED_VALUES=1]: the fields are
+#                                 formatted from the raw packed integers.
+#========================================================================================
+#
+import numpy as N
+#
+from .wind_strings import Determine_Wind_SPEED_Array, Determine_Wind_Direction_Array
+from .wind_strings import Get_Cell_Values, Get_Value_Strings, Slice_Value_Strings, Get_Digit_Strings
+from .time_conversion import Get_Time90_Strings
+from .packed_strings import Get_Field_Strings, Get_Packed_QSCAT_Latitude_Strings, Get_Packed_QSCAT_Longitude_Strings
+from .packed_strings import Get_Packed_SATFOCUS_Latitude_Strings, Get_Packed_SATFOCUS_Longitude_Strings
+#
+#
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#  LIST OF PYTHON FUNCTIONS:
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#  ==> Format_QSCAT_Records(obs_time, datalat, datalon, ..., rev_number, fnmoc_adjust, first_row=0, packing=None)
+#	--> Whole swath [or row block] arrays, Output: All FGGE qscat records as one String
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Format_SATFOCUS_Records(obs_time, datalat, datalon, datawspd, datawdir, fnmoc_adjust, packing=None)
+#	--> Whole swath arrays, Output: All SATFOCUS records as one String
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_QSCAT_Latitude_Strings(datalat, keep), Get_QSCAT_Longitude_Strings(datalon, keep)
+#  ==> Get_QSCAT_Wind_Speed_Strings(datawspd, keep), Get_QSCAT_Wind_Direction_Strings(datawdir, keep)
+#  ==> Get_QSCAT_Model_Speed_Strings(datamdlspd, keep), Get_QSCAT_Model_Direction_Strings(datamdldir, keep)
+#	--> Whole swath arrays, keep:Integer Array [the cells written], Output: Array of field strings
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_SATFOCUS_Latitude_Strings(datalat, keep, wuscr), Get_SATFOCUS_Longitude_Strings(datalon, keep, wuscr)
+#  ==> Get_SATFOCUS_Wind_Speed_Strings(datawspd, keep), Get_SATFOCUS_Wind_Direction_Strings(datawdir, keep)
+#	--> wuscr:String [the padding], Output: Array of field strings
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Write_QSCAT_Swath(obs_time, swath, rev_number, fnmoc_adjust, first_row=0)
+#	--> swath:Dictionary of Arrays, Output: All FGGE qscat records as one String
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Write_SATFOCUS_Swath(obs_time, swath, rev_number, fnmoc_adjust, first_row=0)
+#	--> swath:Dictionary of Arrays, Output: All SATFOCUS records as one String
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Format_QSCAT_Records
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Format_QSCAT_Records(obs_time, datalat, datalon, datawspd, datawdir, datamdlspd, datamdldir, datawvcqfl, rev_number, fnmoc_adjust, first_row=0, packing=None):
+    #
+    # Builds the FGGE qscat records for the whole swath at once.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  This replaces the old nested i/j loop in -main-, which built each record
+    #  from about 40 small strings. Every field is now made for the whole swath
+    #  as one numpy column, following the same if/elif ladders, and the columns
+    #  are joined into records in bulk. The records are byte for byte the same
+    #  as the ones the i/j loop wrote.
+    #
+    #  obs_time is the tuple returned by -Get_Converted_Time90_Array- .
+    #  All other arrays are the [row, cell] arrays read from the netCDF file.
+    #
+    #  fnmoc_adjust: When True, the ascii modifications required by the FNMOC
+    #                modeling group are made here, as each record is built:
+    #                every '+' becomes a space and the first three '---99'
+    #                of the record become '  -99'. These are the same changes
+    #                -rscat_wind_adjust_rscat_data.pl- makes to the finished file.
+    #                When False, the records are left for the PERL script.
+    #
+    #  first_row:    The swath row of the first row of the arrays, when they
+    #                are a block of scan rows [Write_Swath_In_Chunks]. Only the
+    #                ROW field of the records depends on it.
+    #
+    #  packing:      swath name : (scale_factor, add_offset) of the arrays that
+    #                hold the raw packed integers [SCATSAT_PACKED_VALUES=1, see
+    #                -Read_Swath_Variables- ]. None when every array is unpacked.
+    #
+    #  Returns all the records [each ending with a new line] as one string.
+    #  As before, a record is only written when the wind direction is not masked.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    MINUS99="-99"
+    #
+    packing=packing or {}
+    #
+    obs_year,obs_mnth,obs_date,obs_hour,obs__min,obs__sec=obs_time
+    #
+    shape_wspd=N.shape(datawspd)
+    #
+    wdir_mask=N.ma.getmaskarray(N.ma.asarray(datawdir)).ravel()
+    keep=N.flatnonzero(~wdir_mask)
+    #
+    if keep.size == 0:
+        return('')
+        #
+    #
+    #-----------------------------------------------------------
+    # TIME: MMDDhhmm
+    #-----------------------------------------------------------
+    #
+    STR_TIME=Get_Time90_Strings(obs_time, keep, '%(mnth)02d%(date)02d%(hour)02d%(min)02d')
+    #
+    #-----------------------------------------------------------
+    # LATITUDE [times 100], LONGITUDE [times 100, easting 0 to 360],
+    # WIND SPEED [times 10], WIND DIRECTION and the MODEL [NCEP] WIND
+    # SPEED AND DIRECTION, one column each. A packed field [-packing- ]
+    # is formatted from its raw integers [Get_Field_Strings].
+    #-----------------------------------------------------------
+    #
+    STR_LAT=Get_Field_Strings(datalat, keep, packing.get('lat'), Get_QSCAT_Latitude_Strings, (), Get_Packed_QSCAT_Latitude_Strings)
+    STR_LON=Get_Field_Strings(datalon, keep, packing.get('lon'), Get_QSCAT_Longitude_Strings, (), Get_Packed_QSCAT_Longitude_Strings)
+    STR_WSP=Get_Field_Strings(datawspd, keep, packing.get('wind_speed'), Get_QSCAT_Wind_Speed_Strings)
+    STR_WDR=Get_Field_Strings(datawdir, keep, packing.get('wind_dir'), Get_QSCAT_Wind_Direction_Strings)
+    #
+    STR_NCEP_WSPD=Get_Field_Strings(datamdlspd, keep, packing.get('model_speed'), Get_QSCAT_Model_Speed_Strings)
+    STR_NCEP_WDIR=Get_Field_Strings(datamdldir, keep, packing.get('model_dir'), Get_QSCAT_Model_Direction_Strings)
+    #
+    #-----------------------------------------------------------
+    # REV NUMBER [six characters]
+    #-----------------------------------------------------------
+    #
+    STR_REV_NUMBER=rev_number
+    #
+    if len(rev_number) == 5:
+        STR_REV_NUMBER='0'+rev_number
+    elif len(rev_number) == 4:
+        STR_REV_NUMBER='00'+rev_number
+        #
+        #-----------------------------------------------------------
+        # End of if block
+        #-----------------------------------------------------------
+    #
+    #-----------------------------------------------------------
+    # ROW [4 characters] and CELL [3 characters]
+    #-----------------------------------------------------------
+    #
+    row_index=first_row+keep//shape_wspd[1]
+    cel_index=keep%shape_wspd[1]
+    #
+    STR_ROW=N.where(row_index < 10000, Get_Digit_Strings(row_index, 4), '9999')
+    STR_CEL=N.where(cel_index < 1000, Get_Digit_Strings(cel_index, 3), '999')
+    #
+    #-----------------------------------------------------------
+    # WVC QUALITY FLAGS [6 characters]
+    #-----------------------------------------------------------
+    #
+    flg_value, flg_mask=Get_Cell_Values(datawvcqfl)
+    flg_value=flg_value[keep]
+    flg_nan=flg_mask[keep] | N.isnan(flg_value)
+    #
+    flg_strings=N.array(list(map(str, N.trunc(N.where(flg_nan, 0.0, flg_value)).astype(N.int64).tolist())), dtype=N.str_)
+    #
+    STR_WVC_FLAGS=N.where(flg_nan, '-99-99', N.char.rjust(flg_strings, 6, '0').astype('U6'))
+    #
+    #-----------------------------------------------------------
+    # Now put everything together as lines of data!
+    # Time to edge, the ambiguities etc. are not in the KNMI files.
+    #-----------------------------------------------------------
+    #
+    STR_LINE=N.char.add(STR_TIME, STR_LAT)
+    STR_LINE=N.char.add(STR_LINE, STR_LON)
+    STR_LINE=N.char.add(STR_LINE, STR_WSP)
+    STR_LINE=N.char.add(STR_LINE, STR_WDR)
+    STR_LINE=N.char.add(STR_LINE, STR_NCEP_WSPD)
+    STR_LINE=N.char.add(STR_LINE, STR_NCEP_WDIR)
+    STR_LINE=N.char.add(STR_LINE, MINUS99+MINUS99+STR_REV_NUMBER)
+    STR_LINE=N.char.add(STR_LINE, STR_ROW)
+    STR_LINE=N.char.add(STR_LINE, STR_CEL)
+    STR_LINE=N.char.add(STR_LINE, '-99-99')
+    STR_LINE=N.char.add(STR_LINE, STR_WVC_FLAGS)
+    #
+    STR_LINE=N.char.add(STR_LINE, (MINUS99+MINUS99+'---99')*3+MINUS99+MINUS99+'  -99')
+    #
+    #-----------------------------------------------------------
+    # Ascii data modifications required for FNMOC modeling group.
+    # [Formerly done by -rscat_wind_adjust_rscat_data.pl- ]
+    #-----------------------------------------------------------
+    #
+    if fnmoc_adjust:
+        STR_LINE=N.char.replace(STR_LINE, '+', ' ')
+        STR_LINE=N.char.replace(STR_LINE, '---99', '  -99', 3)
+        #
+        #-----------------------------------------------------------
+        # End of if block
+        #-----------------------------------------------------------
+    #
+    return( '\n'.join(STR_LINE.tolist())+'\n')
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Format_QSCAT_Records FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Format_SATFOCUS_Records
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Format_SATFOCUS_Records(obs_time, datalat, datalon, datawspd, datawdir, fnmoc_adjust, packing=None):
+    #
+    # Builds the SATFOCUS records for the whole swath at once.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  This replaces the old nested i/j loop in -main-. Each field is made for
+    #  the whole swath as one numpy column, following the same if/elif ladders,
+    #  and the columns are joined into records in bulk.
+    #
+    #  obs_time is the tuple returned by -Get_Converted_Time90_Array- .
+    #  All other arrays are the [row, cell] arrays read from the netCDF file.
+    #
+    #  fnmoc_adjust: When True, the records are written in their final form:
+    #                the fields are padded with spaces instead of underscores
+    #                and the first two '---99' of the record become '  -99'.
+    #                These are the same changes -rscat_knmi_adjust_satfocus_data.pl-
+    #                makes to the finished file.
+    #                When False, the underscore records are left for the PERL script.
+    #
+    #  packing:      As for -Format_QSCAT_Records- .
+    #
+    #  Returns all the records [each ending with a new line] as one string.
+    #  As before, a record is only written when the wind direction is not masked.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    MINUS99="-99"
+    #
+    if fnmoc_adjust:
+        wuscr=" "
+    else:
+        wuscr="_"
+        #
+        #----------------------------------------------------
+        # End of if block
+        #----------------------------------------------------
+    #
+    dwuscr=wuscr+wuscr
+    #
+    packing=packing or {}
+    #
+    obs_year,obs_mnth,obs_date,obs_hour,obs__min,obs__sec=obs_time
+    #
+    wdir_mask=N.ma.getmaskarray(N.ma.asarray(datawdir)).ravel()
+    keep=N.flatnonzero(~wdir_mask)
+    #
+    if keep.size == 0:
+        return('')
+        #
+    #
+    #-----------------------------------------------------------
+    # TIME: YYYY/MM/DD_hh:mm:ss
+    #-----------------------------------------------------------
+    #
+    STR_TIME=Get_Time90_Strings(obs_time, keep, '%(year)04d/%(mnth)02d/%(date)02d'+wuscr+'%(hour)02d:%(min)02d:%(sec)02d')
+    #
+    #-----------------------------------------------------------
+    # LATITUDE [six characters, padded on the right], LONGITUDE [-180 to
+    # 180, eight characters], WIND SPEED [knots] and WIND DIRECTION, one
+    # column each. A packed field [-packing- ] is formatted from its raw
+    # integers [Get_Field_Strings].
+    #-----------------------------------------------------------
+    #
+    STR_LAT=Get_Field_Strings(datalat, keep, packing.get('lat'), Get_SATFOCUS_Latitude_Strings, (wuscr,), Get_Packed_SATFOCUS_Latitude_Strings)
+    STR_LON=Get_Field_Strings(datalon, keep, packing.get('lon'), Get_SATFOCUS_Longitude_Strings, (wuscr,), Get_Packed_SATFOCUS_Longitude_Strings)
+    STR_WSP=Get_Field_Strings(datawspd, keep, packing.get('wind_speed'), Get_SATFOCUS_Wind_Speed_Strings)
+    STR_WDR=Get_Field_Strings(datawdir, keep, packing.get('wind_dir'), Get_SATFOCUS_Wind_Direction_Strings)
+    #
+    #-----------------------------------------------------------
+    # Join the columns into records.
+    #-----------------------------------------------------------
+    #
+    STR_THIS_LINE=N.char.add('SCT'+dwuscr, STR_LAT)
+    STR_THIS_LINE=N.char.add(N.char.add(STR_THIS_LINE, dwuscr), STR_LON)
+    STR_THIS_LINE=N.char.add(N.char.add(STR_THIS_LINE, dwuscr), STR_WDR)
+    STR_THIS_LINE=N.char.add(N.char.add(STR_THIS_LINE, dwuscr), STR_WSP)
+    STR_THIS_LINE=N.char.add(N.char.add(STR_THIS_LINE, wuscr+'0'+wuscr+'0'+wuscr), STR_TIME)
+    STR_THIS_LINE=N.char.add(STR_THIS_LINE, dwuscr+wuscr)
+    #
+    if fnmoc_adjust:
+        STR_THIS_LINE=N.char.replace(STR_THIS_LINE, '---99', '  -99', 2)
+        #
+        #----------------------------------------------------
+        # End of if block
+        #----------------------------------------------------
+    #
+    return('\n'.join(STR_THIS_LINE.tolist())+'\n')
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Format_SATFOCUS_Records FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_QSCAT_Latitude_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_QSCAT_Latitude_Strings(datalat, keep):
+    #
+    # The latitude field [times 100, 5 characters] of the cells -keep-
+    # of the flat swath.
+    #
+    MINUS99="-99"
+    #
+    lat_value, lat_mask=Get_Cell_Values(datalat)
+    lat_value=lat_value[keep]
+    lat_mask=lat_mask[keep]
+    lat_x100c=Get_Value_Strings(lat_value, lat_mask, 100.0)
+    #
+    a=N.where(lat_mask, N.nan, lat_value)
+    #
+    STR_LAT=N.select(
+        [(a >= 0.0) & (a < 0.1),
+         (a > -0.1) & (a < 0.0),
+         (a >= 0.1) & (a < 1.0),
+         (a >= 1.0) & (a < 10.0),
+         (a >= 10.0) & (a < 89.9),
+         (a >= -89.9) & (a < -10.0),
+         (a > -10.0) & (a <= -1.0),
+         (a > -1.0) & (a <= -0.1),
+         (a >= -0.01) & (a <= 0.01),
+         a <= -90.0,
+         a >= 90.0],
+        [N.char.add('+ 00', Slice_Value_Strings(lat_x100c, 0, 1)),
+         N.char.add('- 00', Slice_Value_Strings(lat_x100c, 1, 2)),
+         N.char.add('+ 0', Slice_Value_Strings(lat_x100c, 0, 2)),
+         N.char.add('+ ', Slice_Value_Strings(lat_x100c, 0, 3)),
+         N.char.add(' ', Slice_Value_Strings(lat_x100c, 0, 4)),
+         N.char.add('-', Slice_Value_Strings(lat_x100c, 1, 5)),
+         N.char.add('- ', Slice_Value_Strings(lat_x100c, 1, 4)),
+         N.char.add('- 0', Slice_Value_Strings(lat_x100c, 1, 3)),
+         ' 0000',
+         '  '+MINUS99,
+         '  '+MINUS99],
+        N.char.add(' ', Slice_Value_Strings(lat_x100c, 0, 4)))
+    #
+    return( STR_LAT)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_QSCAT_Latitude_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_QSCAT_Longitude_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_QSCAT_Longitude_Strings(datalon, keep):
+    #
+    # The longitude field [times 100, easting 0 to 360, 5 characters] of
+    # the cells -keep- of the flat swath.
+    #
+    MINUS99="-99"
+    #
+    lon_value, lon_mask=Get_Cell_Values(datalon)
+    lon_value=lon_value[keep]
+    lon_mask=lon_mask[keep]
+    lon_x100c=Get_Value_Strings(lon_value, lon_mask, 100.0)
+    #
+    a=N.where(lon_mask, N.nan, lon_value)
+    #
+    STR_LON=N.select(
+        [a < 0.0,
+         a == 0.0,
+         a >= 360.0,
+         (a >= 100.0) & (a < 360.0),
+         (a >= 10.0) & (a < 100.0),
+         (a >= 1.0) & (a < 10.0),
+         (a >= 0.1) & (a < 1.0),
+         (a >= 0.01) & (a < 0.1)],
+        ['  '+MINUS99,
+         '00000',
+         '  '+MINUS99,
+         Slice_Value_Strings(lon_x100c, 0, 5),
+         N.char.add(' ', Slice_Value_Strings(lon_x100c, 0, 4)),
+         N.char.add('+0', Slice_Value_Strings(lon_x100c, 0, 3)),
+         N.char.add('+00', Slice_Value_Strings(lon_x100c, 0, 2)),
+         N.char.add('+000', Slice_Value_Strings(lon_x100c, 0, 1))],
+        Slice_Value_Strings(lon_x100c, 0, 5))
+    #
+    return( STR_LON)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_QSCAT_Longitude_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_QSCAT_Wind_Speed_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_QSCAT_Wind_Speed_Strings(datawspd, keep):
+    #
+    # The wind speed field [times 10, 3 characters] of the cells -keep-
+    # of the flat swath.
+    # NOTE: A NaN wind speed is written as 'nan' [as it always was].
+    #
+    MINUS99="-99"
+    #
+    wsp_value, wsp_mask=Get_Cell_Values(datawspd)
+    wsp_value=wsp_value[keep]
+    wsp_mask=wsp_mask[keep]
+    wsp_x10c=Get_Value_Strings(wsp_value, wsp_mask, 10.0)
+    #
+    a=N.where(wsp_mask, N.nan, wsp_value)
+    #
+    STR_WSP=N.select(
+        [wsp_mask | (a < 0.0),
+         (a >= 0.0) & (a < 0.1),
+         (a >= 0.1) & (a < 1.0),
+         (a >= 1.0) & (a < 10.0)],
+        [MINUS99,
+         '000',
+         N.char.add('+0', Slice_Value_Strings(wsp_x10c, 0, 1)),
+         N.char.add('+', Slice_Value_Strings(wsp_x10c, 0, 2))],
+        Slice_Value_Strings(wsp_x10c, 0, 3))
+    #
+    return( STR_WSP)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_QSCAT_Wind_Speed_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_QSCAT_Wind_Direction_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_QSCAT_Wind_Direction_Strings(datawdir, keep):
+    #
+    # The wind direction field [3 characters] of the cells -keep- of the
+    # flat swath.
+    #=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-==
+    # KNMI WINDS are stated in OCEANOGRAPHIC DIRECTIONS, so we ADD 180
+    # to the wind direction UNLESS the wind direction is 180 or more,
+    # in which case we SUBTRACT 180. [PJMC Sept 24 2015]
+    #=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-==
+    #
+    MINUS99="-99"
+    #
+    wdr_value, wdr_mask=Get_Cell_Values(datawdir)
+    wdr_value=wdr_value[keep]
+    wdr_mask=wdr_mask[keep]
+    wdr_value=N.where(wdr_value >= 180.0, wdr_value-wdr_value.dtype.type(180.0), wdr_value+wdr_value.dtype.type(180.0))
+    wdr_x1c=Get_Value_Strings(wdr_value, wdr_mask, 1.0)
+    #
+    a=N.where(wdr_mask, N.nan, wdr_value)
+    #
+    STR_WDR=N.select(
+        [N.isnan(a) | (a < 0.0),
+         (a >= 0.0) & (a < 1.0),
+         (a >= 1.0) & (a < 10.0),
+         (a >= 10.0) & (a < 100.0)],
+        [MINUS99,
+         '000',
+         N.char.add('00', Slice_Value_Strings(wdr_x1c, 0, 1)),
+         N.char.add('0', Slice_Value_Strings(wdr_x1c, 0, 2))],
+        Slice_Value_Strings(wdr_x1c, 0, 3))
+    #
+    return( STR_WDR)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_QSCAT_Wind_Direction_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_QSCAT_Model_Speed_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_QSCAT_Model_Speed_Strings(datamdlspd, keep):
+    #
+    # The model [NCEP] wind speed field of the cells -keep- of the flat swath.
+    #
+    return( Determine_Wind_SPEED_Array(N.ma.asarray(datamdlspd).ravel()[keep]))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_QSCAT_Model_Speed_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_QSCAT_Model_Direction_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_QSCAT_Model_Direction_Strings(datamdldir, keep):
+    #
+    # The model [NCEP] wind direction field of the cells -keep- of the flat swath.
+    #
+    return( Determine_Wind_Direction_Array(N.ma.asarray(datamdldir).ravel()[keep]))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_QSCAT_Model_Direction_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_SATFOCUS_Latitude_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_SATFOCUS_Latitude_Strings(datalat, keep, wuscr):
+    #
+    # The latitude field [six characters, padded on the right with -wuscr- ]
+    # of the cells -keep- of the flat swath.
+    #
+    MINUS99="-99"
+    #
+    dwuscr=wuscr+wuscr
+    #
+    lat_value, lat_mask=Get_Cell_Values(datalat)
+    lat_value=lat_value[keep]
+    lat_mask=lat_mask[keep]
+    lat_x1c=Get_Value_Strings(lat_value, lat_mask, 1.0)
+    #
+    a=N.where(lat_mask, N.nan, lat_value)
+    #
+    lat_x1c0=N.char.add(lat_x1c, '0')
+    #
+    STR_LAT=N.select(
+        [(a >= 0.0) & (a < 0.1),
+         (a > -0.1) & (a < 0.0),
+         (a >= 0.1) & (a < 1.0),
+         (a >= 1.0) & (a < 10.0),
+         (a >= 10.0) & (a < 89.9),
+         (a >= -89.9) & (a < -10.0),
+         (a > -10.0) & (a <= -1.0),
+         (a > -1.0) & (a <= -0.1),
+         (a >= -0.01) & (a <= 0.01),
+         a <= -90.0,
+         a >= 90.0],
+        [N.char.add(dwuscr, lat_x1c0),
+         N.char.add(wuscr, lat_x1c0),
+         N.char.add(dwuscr, lat_x1c0),
+         N.char.add(dwuscr, lat_x1c0),
+         N.char.add(wuscr, lat_x1c0),
+         N.char.add(Slice_Value_Strings(lat_x1c, 0, 6), '0'),
+         N.char.add(wuscr, lat_x1c0),
+         N.char.add(wuscr, lat_x1c0),
+         N.char.add(wuscr, lat_x1c0),
+         MINUS99,
+         MINUS99],
+        Slice_Value_Strings(lat_x1c, 0, 7))
+    #
+    STR_LAT=Slice_Value_Strings(N.char.ljust(STR_LAT, 6, wuscr), 0, 6)
+    #
+    return( STR_LAT)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_SATFOCUS_Latitude_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_SATFOCUS_Longitude_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_SATFOCUS_Longitude_Strings(datalon, keep, wuscr):
+    #
+    # The longitude field [-180 to 180, eight characters] of the cells
+    # -keep- of the flat swath.
+    # A masked longitude is formatted as NaN [as it always was].
+    #
+    dwuscr=wuscr+wuscr
+    #
+    lon_value, lon_mask=Get_Cell_Values(datalon)
+    lon_value=lon_value[keep]
+    lon_mask=lon_mask[keep]
+    #
+    a=N.where(lon_mask, N.nan, lon_value)
+    #
+    lon_aa=N.where(a >= 180.0, (a.dtype.type(360.0)-a)*a.dtype.type(-1.0), a)
+    #
+    STR_LON=N.array(['%8.3f' % x for x in lon_aa.tolist()], dtype=N.str_)
+    #
+    STR_LON=N.select(
+        [a >= 360.0,
+         a == 180.0,
+         a == 0.0],
+        ['-99999999',
+         wuscr+'180.000',
+         dwuscr+'0.0000'],
+        STR_LON)
+    #
+    return( STR_LON)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_SATFOCUS_Longitude_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_SATFOCUS_Wind_Speed_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_SATFOCUS_Wind_Speed_Strings(datawspd, keep):
+    #
+    # The wind speed field [knots, '%6.3f'] of the cells -keep- of the
+    # flat swath.
+    #
+    MINUS99="-99"
+    #
+    CONVERT_MPS_2_KNOTS=1.943844492
+    #
+    wsp_value, wsp_mask=Get_Cell_Values(datawspd)
+    wsp_value=wsp_value[keep]*wsp_value.dtype.type(CONVERT_MPS_2_KNOTS)
+    wsp_mask=wsp_mask[keep]
+    #
+    a=N.where(wsp_mask, N.nan, wsp_value)
+    #
+    STR_WSP=N.array(['%6.3f' % x for x in a.tolist()], dtype=N.str_)
+    #
+    STR_WSP=N.select(
+        [wsp_mask | (a < 0.0),
+         N.isnan(a)],
+        ['-99999',
+         MINUS99],
+        STR_WSP)
+    #
+    return( STR_WSP)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_SATFOCUS_Wind_Speed_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_SATFOCUS_Wind_Direction_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_SATFOCUS_Wind_Direction_Strings(datawdir, keep):
+    #
+    # The wind direction field ['%7.3f'] of the cells -keep- of the flat
+    # swath.
+    #=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-==
+    # KNMI WINDS are stated in OCEANOGRAPHIC DIRECTIONS, so we ADD 180
+    # to the wind direction UNLESS the wind direction is 180 or more,
+    # in which case we SUBTRACT 180. [PJMC Sept 24 2015]
+    #=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-==
+    #
+    wdr_value, wdr_mask=Get_Cell_Values(datawdir)
+    wdr_value=wdr_value[keep]
+    a=N.where(wdr_value >= 180.0, wdr_value-wdr_value.dtype.type(180.0), wdr_value+wdr_value.dtype.type(180.0))
+    #
+    STR_WDR=N.array(['%7.3f' % x for x in a.tolist()], dtype=N.str_)
+    #
+    STR_WDR=N.where(N.isnan(a) | (a < 0.0), '-999999', STR_WDR)
+    #
+    return( STR_WDR)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_SATFOCUS_Wind_Direction_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Write_QSCAT_Swath
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Write_QSCAT_Swath(obs_time, swath, rev_number, fnmoc_adjust, first_row=0):
+    #
+    # FGGE qscat writer. -swath- is the dictionary from -Read_Swath_Variables-
+    # [the same names for the KNMI and the JPL files], or a block of its rows
+    # from -Read_Swath_Rows- starting at swath row -first_row- .
+    #
+    return( Format_QSCAT_Records(obs_time, swath['lat'], swath['lon'], swath['wind_speed'], swath['wind_dir'], swath['model_speed'], swath['model_dir'], swath['wvc_quality_flag'], rev_number, fnmoc_adjust, first_row, swath.get('packing')))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Write_QSCAT_Swath FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Write_SATFOCUS_Swath
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Write_SATFOCUS_Swath(obs_time, swath, rev_number, fnmoc_adjust, first_row=0):
+    #
+    # SATFOCUS writer. The SATFOCUS records carry no rev number or row, they
+    # are only taken so every writer is called the same way.
+    #
+    return( Format_SATFOCUS_Records(obs_time, swath['lat'], swath['lon'], swath['wind_speed'], swath['wind_dir'], fnmoc_adjust, swath.get('packing')))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Write_SATFOCUS_Swath FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#----------------------------------------------------------------
+# The record writers by name:
+#     ASCII_WRITERS['QSCAT']     FGGE qscat records [ascii, ascii_aa, bb, oo, isis]
+#     ASCII_WRITERS['SATFOCUS']  SATFOCUS records
+#----------------------------------------------------------------
+#
+ASCII_WRITERS={'QSCAT':Write_QSCAT_Swath,
+               'SATFOCUS':Write_SATFOCUS_Swath}
+#
+#----------------------------------------------------------------
+# The swath variables each writer uses. These are the only ones
+# -Read_Swath_Variables- reads from the NETCDF file.
+#----------------------------------------------------------------
+#
+WRITER_SWATH_VARIABLES={'QSCAT':('wind_speed', 'wind_dir', 'lat', 'lon', 'time', 'model_speed', 'model_dir', 'wvc_quality_flag'),
+                        'SATFOCUS':('wind_speed', 'wind_dir', 'lat', 'lon', 'time')}
+#
@@ -0,0 +1,419 @@
+# -*- coding: utf-8 -*-
+#==-FNMOC/N38DI PYTHON MODULE DEFINITION-===========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_core/backlog.py
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  MODULE OVERVIEW:
+#	(1) Backlog mode [--all, --workers N]: every pending NETCDF file in
+#	    XFER_BASEPATH is converted in one run by the -main- function of
+#	    the converter script.
+#	(2) The message printed for each execution code [1, 55, 90, 97].
+#
+# Programmer: Mr. Paul McCrone     02 February  2015 --Original Build for NASA RAPIDSCAT----
+#                                  13 September 2017 --New modified build for ISRO ScatSat--
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 Moved out of the converter scripts into the shared
+#                                 scatsat_core package.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.1, Dated 2026-Oct-17
+#                                 Copy_File_Atomically moved to file_ops.py. The
+#                                 gunzip and the XFER_BASEPATH lookup no longer run
+#                                 a subshell.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.2, Dated 2026-Oct-17
+#                                 The .nc.gz files are pending files too. They are
+#                                 read from memory by the converter [Open_NCDF_File],
+#                                 not gunzipped at the start of each round.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.3, Dated 2026-Oct-17
+#                                 Report_Execution_Code moved here from the end of
+#                                 the converter scripts, for the watch mode
+#                                 [scatsat_knmi_daemon3.py].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.4, Dated 2026-Oct-17
+#                                 A file that stops -main- with an exception no longer
+#                                 ends a one worker backlog run [Execution Code 0].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.5, Dated 2026-Oct-17
+#                                 Run_Converter_Main: the same handling of an exception
+#                                 for one worker and for a pool of workers.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.6, Dated 2026-Oct-17
+#                                 A file that stopped with an exception [Execution
+#                                 Code 0] fails the whole run, as in the pipeline.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.7, Dated 2026-Oct-17
+#                                 Get_Number_Of_Workers: one parser of --workers N for
+#                                 the converters and the pipeline.
+#========================================================================================
+#
+import os as OS
+import sys as SYS
+import io as IO
+import contextlib as CONTEXTLIB
+import traceback as TRACEBACK
+import concurrent.futures as FUTURES
+#
+dadash="-------------------------------------"
+#
+#
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#  LIST OF PYTHON FUNCTIONS:
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#  ==> Find_Pending_NCDF_Files(datapath, file_prefixes)
+#	--> datapath:String, Output: List of NETCDF files sorted by orbit and time
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Run_Converter_Main(main_function, nc_filename)
+#	--> nc_filename:String, Output: Execution code [0 if -main- raised]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Convert_Pending_NCDF_File(main_function, nc_filename)
+#	--> nc_filename:String, Output: Tuple of file name, execution code and log
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_Number_Of_Workers(argv)
+#	--> argv:List of String [SYS.argv], Output: Integer [N, 1 without --workers, 0 if N is bad]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Process_Pending_NCDF_Files(main_function, file_prefixes, number_of_workers)
+#	--> file_prefixes:Tuple of String, Output: Execution code for the whole backlog
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Report_Execution_Code(my_execution)
+#	--> my_execution:Integer, Output: None [the message for the execution code]
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Find_Pending_NCDF_Files
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Find_Pending_NCDF_Files(datapath, file_prefixes):
+    #
+    # Returns every pending NETCDF file [full path] in -datapath- whose name
+    # starts with one of -file_prefixes- and ends with '.nc' or '.nc.gz'.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  The files are sorted by the orbit [rev number, characters 29 to 34]
+    #  and then by the start time [YYYYMMDD_hhmmss, characters 6 to 21]
+    #  in the filename, so a backlog is converted oldest orbit first.
+    #     oscat_20170214_083058_scasa1_02048_o_250_ovw_l2.nc
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    pending_files=[]
+    #
+    with OS.scandir(datapath) as dir_entries:
+        for dir_entry in dir_entries:
+            #
+            if dir_entry.name.startswith(file_prefixes) and dir_entry.name.endswith(('.nc', '.nc.gz')) and dir_entry.is_file():
+                pending_files.append(dir_entry.name)
+                #
+                #----------------------------------------------------
+                # End of if block
+                #----------------------------------------------------
+            #
+    #
+    pending_files.sort(key=lambda name: (name[29:34], name[6:21], name))
+    #
+    return( [datapath+name for name in pending_files])
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Find_Pending_NCDF_Files FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Run_Converter_Main
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Run_Converter_Main(main_function, nc_filename):
+    #
+    # Runs -main_function- [the -main- of the converter script] for one
+    # backlog file and returns its execution code. An exception is printed
+    # [traceback] and gives the Execution Code 0, so one bad file does not
+    # stop the others. The same for one worker and for a pool of workers.
+    #
+    try:
+        return( main_function(nc_filename))
+    except Exception:
+        TRACEBACK.print_exc(file=SYS.stdout)
+        return( 0)
+        #
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Run_Converter_Main FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Convert_Pending_NCDF_File
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Convert_Pending_NCDF_File(main_function, nc_filename):
+    #
+    # Runs -main_function- [the -main- of the converter script] for one
+    # backlog file inside a worker process.
+    # Everything -main- prints is kept and handed back with the execution
+    # code, so the log shows each file in one piece instead of the output
+    # of all the workers mixed together.
+    #
+    worker_log=IO.StringIO()
+    #
+    with CONTEXTLIB.redirect_stdout(worker_log):
+        this_execution=Run_Converter_Main(main_function, nc_filename)
+        #
+    #
+    return( nc_filename, this_execution, worker_log.getvalue())
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Convert_Pending_NCDF_File FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Number_Of_Workers
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Number_Of_Workers(argv):
+    #
+    # The N of the --workers N option in -argv- [SYS.argv], 1 without the
+    # option. A missing N, or one that is not a whole number of 1 or more,
+    # prints the usage line and gives 0: the caller then ends with the
+    # Execution Code 90 instead of a traceback.
+    #
+    if '--workers' not in argv[1:]:
+        return( 1)
+        #
+    #
+    option_index=argv.index('--workers')
+    #
+    try:
+        number_of_workers=int(argv[option_index+1])
+    except (IndexError, ValueError):
+        number_of_workers=0
+        #
+    #
+    if number_of_workers < 1:
+        print("---USAGE: "+OS.path.basename(argv[0])+" [--all] [--workers N]   N is the number of files converted at a time [1 or more]")
+        return( 0)
+        #
+    #
+    return( number_of_workers)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Number_Of_Workers FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Process_Pending_NCDF_Files
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Process_Pending_NCDF_Files(main_function, file_prefixes, number_of_workers):
+    #
+    # Backlog mode [--all]: converts every pending NETCDF file in XFER_BASEPATH
+    # in this one process, instead of only the most recent one.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  -main_function- [the -main- of the converter script] is called once
+    #  for each file, oldest orbit first. The directory is scanned again
+    #  after each round, so files that arrive while the backlog is being
+    #  converted are picked up too. A file is never tried twice.
+    #
+    #  number_of_workers [--workers N]: With more than one worker, the files
+    #  of a round are spread over a pool of N processes [each half orbit file
+    #  is independent]. With one worker the files are converted one at a time.
+    #  A file whose -main- stops with an exception is given the Execution
+    #  Code 0 [the traceback is printed] and the run goes on with the others.
+    #
+    #  Ends with one summary of the execution codes and returns the code for
+    #  the whole run:
+    #     90 if any file hit a path problem [no new round is started],
+    #      0 if any file stopped with an exception,
+    #     97 if any file had a problem with the operating system,
+    #      1 if at least one file was converted,
+    #     55 if there was nothing to convert.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    infromlinux = OS.environ.get('XFER_BASEPATH', '')
+    #
+    my_XFER_BASEPATH=infromlinux
+    #
+    if my_XFER_BASEPATH== '':
+        my_XFER_BASEPATH='/satdat/curr/scatsat_knmi'
+        #
+    #
+    datapath=my_XFER_BASEPATH+'/'
+    #
+    if not OS.path.exists(datapath):
+        print("-------The datapath is INVALID! NEED TO CHECK THIS!!!!!!!! -----------------")
+        return( 90)
+        #
+    #
+    tried_files=[]
+    file_executions=[]
+    #
+    while 90 not in file_executions:
+        #
+        pending_files=[x for x in Find_Pending_NCDF_Files(datapath, file_prefixes) if x not in tried_files]
+        #
+        if len(pending_files) == 0:
+            break
+            #
+        #
+        if number_of_workers > 1:
+            #
+            print(dadash+dadash)
+            print("---BACKLOG: "+str(len(pending_files))+" file(s) over "+str(number_of_workers)+" workers")
+            print(dadash+dadash)
+            #
+            tried_files.extend(pending_files)
+            #
+            with FUTURES.ProcessPoolExecutor(max_workers=number_of_workers) as worker_pool:
+                for nc_filename, this_execution, worker_log in worker_pool.map(Convert_Pending_NCDF_File, [main_function]*len(pending_files), pending_files):
+                    #
+                    print(worker_log)
+                    print(dadash+dadash)
+                    print("---BACKLOG: Execution Code "+str(this_execution)+" for "+nc_filename)
+                    print(dadash+dadash)
+                    file_executions.append(this_execution)
+                    #
+                #
+            #
+        else:
+            #
+            nc_filename=pending_files[0]
+            tried_files.append(nc_filename)
+            #
+            print(dadash+dadash)
+            print("---BACKLOG: file "+str(len(tried_files))+" ["+str(len(pending_files)-1)+" more pending]: "+nc_filename)
+            print(dadash+dadash)
+            #
+            this_execution=Run_Converter_Main(main_function, nc_filename)
+            file_executions.append(this_execution)
+            #
+            print(dadash+dadash)
+            print("---BACKLOG: Execution Code "+str(this_execution)+" for "+nc_filename)
+            print(dadash+dadash)
+            #
+            #----------------------------------------------------
+            # End of if block
+            #----------------------------------------------------
+        #
+    #
+    #-----------------------------------------------------------
+    # One summary of the execution codes for the whole run.
+    #-----------------------------------------------------------
+    #
+    print(dadash+dadash)
+    print("---BACKLOG SUMMARY: "+str(len(file_executions))+" file(s) tried")
+    #
+    for exec_code in sorted(set(file_executions)):
+        print("---   Execution Code "+str(exec_code)+" : "+str(file_executions.count(exec_code))+" file(s)")
+        for nc_filename, this_execution in zip(tried_files, file_executions):
+            if (this_execution == exec_code) and (exec_code != 1):
+                print("---        "+nc_filename)
+                #
+            #
+        #
+    print(dadash+dadash)
+    #
+    for exec_code in (90, 0, 97, 1):
+        if exec_code in file_executions:
+            return( exec_code)
+            #
+        #
+    #
+    return( 55)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Process_Pending_NCDF_Files FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Report_Execution_Code
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Report_Execution_Code(my_execution):
+    #
+    # Let me know if the program executed successfully.
+    # Otherwise, give me a --helpful-- error message!
+    # [The text sat_mon and the operators look for in the job log.]
+    #
+    if my_execution == 1:
+        print("--------------------------------------------------------------------------------")
+        print("-------Program Executed SUCCESSFULLY, No Errors were detected! -----------------")
+        print("--------------------------------------------------------------------------------")
+        #
+    elif my_execution == 55:
+        #
+        print("NNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNN")
+        print("------Program Execution Code....."+str(my_execution))
+        print("_________________________________________________________________________________")
+        print("------There were or was no NETCDF file(s) available to be processed! ------------")
+        print("------If there are no valid NETCDF files- the process just ends!  ---------------")
+        print("------PLEASE CHECK PREVIOUS log entries for possible ERROR MESSAGES!!!!!!!! -----")
+        print("------POSSILBE DPS or BFT problem! POSSIBLE SYSTEM OPERATING SYSTEM PROBLEM!-----")
+        print("------POSSIBLE GPFS FILE SYSTEM PROBLEM!-----------------------------------------")
+        print("NNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNN")
+        #
+    elif my_execution == 90:
+        #
+        print("PPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPP")
+        print("-------Program Execution Code....."+str(my_execution))
+        print("_________________________________________________________________________________")
+        print("-----There were or was a problem with PYTHON getting access to a PATH! ----------")
+        print("-----In other words--- the software could not access a subdirectory it needs!  --")
+        print("-----The software cant get to a data path either to read or write etc!  ---------")
+        print("-----PLEASE CHECK PREVIOUS log entries for possible ERROR MESSAGES!!!!!!!! ------")
+        print("-----POSSIBLE LINUX OPERATING SYSTEM PROBLEM! POSSIBLE GPFS FILE SYSTEM PROBLEM!-")
+        print("PPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPPP")
+        #
+        #
+    elif my_execution == 97:
+        #
+        print("FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF")
+        print("-------Program Execution Code....."+str(my_execution))
+        print("________________________________________________________________________________")
+        print("-------Data conversion executed successfully (an ASCII file was made)....-------")
+        print("-------but ....there were issues interfacing with the operating system! --------")
+        print("-------Issues with the operating system could include......... -----------------")
+        print("-------file copy- file move- file rename--- file permissions- etc.  ------------")
+        print("-------PLEASE CHECK PREVIOUS log entries for possible ERROR MESSAGES!!!!! ------")
+        print("-------POSSILBE DPS or BFT problem! POSSIBLE SYSTEM OS PROBLEM!          -------")
+        print("FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF")
+        #
+    else:
+        #
+        print("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx")
+        print("-------Program Execution Code....."+str(my_execution))
+        print("________________________________________________________________________________")
+        print("-------It appears that the program did not execute properly!!!!!!!! ------------")
+        print("-------The software exited with an unexpected error code!!!!!!!!!!! ------------")
+        print("-------PLEASE CHECK PREVIOUS log entries for ERROR MESSAGES!!!!!!!! ------------")
+        print("xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx")
+        #-----------------------------------------------------------
+        #-----------------------------------------------------------
+        # End of if block
+        #-----------------------------------------------------------
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Report_Execution_Code FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
@@ -0,0 +1,438 @@
+# -*- coding: utf-8 -*-
+#==-FNMOC/N38DI PYTHON MODULE DEFINITION-===========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_core/file_ops.py
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  MODULE OVERVIEW:
+#	(1) The file management steps of the converters [touch, chmod, echo >,
+#	    cat >>, rm -rf, ls, cp, gunzip] done with os, shutil and gzip
+#	    inside the python process, instead of an -OS.system- subshell for
+#	    each one. A fork of the converter, which is holding the swath
+#	    arrays, is slow on a loaded host and has been killed for memory.
+#	(2) Every function returns 0 on success and 1 on failure [like
+#	    -OS.system- did], and prints the error. The converters turn a
+#	    failure into the Execution Code 97.
+#
+# Programmer: Mr. Paul McCrone     02 February  2015 --Original Build for NASA RAPIDSCAT----
+#                                  13 September 2017 --New modified build for ISRO ScatSat--
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 First version. Copy_File_Atomically moved here
+#                                 from backlog.py.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.1, Dated 2026-Oct-17
+#                                 Publish_File [hardlinked fan-out of the ascii file].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.2, Dated 2026-Oct-17
+#                                 The .nc.gz files are read as they are [see
+#                                 Open_NCDF_File]: List_NCDF_Files lists them too,
+#                                 Gunzip_NCDF_Files is gone and Gunzip_File can
+#                                 write to another place [dest_name].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.3, Dated 2026-Oct-17
+#                                 Publish_File is for the internal archive locations
+#                                 only; the converters copy to the external ones.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.4, Dated 2026-Oct-17
+#                                 Reserve_File_Name [a free ascii file name, taken
+#                                 with O_EXCL, for files converted in the same minute].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.5, Dated 2026-Oct-17
+#                                 Publish_File is again for every location of the
+#                                 fan-out; the published file is read only.
+#========================================================================================
+#
+import os as OS
+import shutil as SHUTIL
+import gzip as GZIP
+import zlib as ZLIB
+#
+#
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#  LIST OF PYTHON FUNCTIONS:
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#  ==> Change_File_Mode(file_name, file_mode)
+#	--> file_mode:Integer [0o776], Output: 0 on success, 1 on failure
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Write_Text_File(file_name, text_string, file_mode)
+#	--> text_string:String, Output: 0 on success, 1 on failure
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Append_File(source_file, dest_name, file_mode)
+#	--> source_file:String, Output: 0 on success, 1 on failure
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Remove_File(file_name)
+#	--> file_name:String, Output: 0 on success, 1 on failure
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> List_NCDF_Files(datapath, file_prefix)
+#	--> datapath:String, Output: Sorted List of NETCDF files [full path]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Gunzip_File(gz_file_name, dest_name)
+#	--> gz_file_name:String, Output: 0 on success, 1 on failure
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Copy_File_Atomically(source_file, dest_name)
+#	--> source_file:String, Output: 0 on success, 1 on failure
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Publish_File(source_file, dest_name, published_files)
+#	--> published_files:Dictionary [filesystem -> file], Output: 0 on success, 1 on failure
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Reserve_File_Name(file_path, file_names, taken_paths)
+#	--> file_names:List of String [in order of preference], Output: String ['' if none is free]
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Change_File_Mode
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Change_File_Mode(file_name, file_mode):
+    #
+    # Same as -chmod 776 file_name- [file_mode=0o776].
+    #
+    try:
+        OS.chmod(file_name, file_mode)
+    except OSError as chmod_error:
+        print("---CHMOD FAILED: "+str(chmod_error))
+        return( 1)
+        #
+    #
+    return( 0)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Change_File_Mode FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Write_Text_File
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Write_Text_File(file_name, text_string, file_mode=None):
+    #
+    # Same as -echo text_string > file_name- [the file is created or
+    # emptied first], followed by -chmod- when -file_mode- is given.
+    #
+    try:
+        with open(file_name, "w") as text_file:
+            text_file.write(text_string)
+            #
+        #
+    except (OSError, IOError) as write_error:
+        print("---WRITE FAILED: "+str(write_error))
+        return( 1)
+        #
+    #
+    if file_mode is not None:
+        return( Change_File_Mode(file_name, file_mode))
+        #
+    #
+    return( 0)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Write_Text_File FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Append_File
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Append_File(source_file, dest_name, file_mode=None):
+    #
+    # Same as -touch dest_name; chmod; cat source_file >> dest_name-.
+    # -dest_name- is created when it does not exist yet.
+    #
+    try:
+        with open(source_file, "rb") as source_obj, open(dest_name, "ab") as dest_obj:
+            SHUTIL.copyfileobj(source_obj, dest_obj)
+            #
+        #
+    except (OSError, IOError) as append_error:
+        print("---APPEND FAILED: "+str(append_error))
+        return( 1)
+        #
+    #
+    if file_mode is not None:
+        return( Change_File_Mode(dest_name, file_mode))
+        #
+    #
+    return( 0)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Append_File FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Remove_File
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Remove_File(file_name):
+    #
+    # Same as -rm -rf file_name- for a file: a file that is
+    # already gone is not an error.
+    #
+    try:
+        OS.remove(file_name)
+    except OSError as remove_error:
+        if OS.path.lexists(file_name):
+            print("---REMOVE FAILED: "+str(remove_error))
+            return( 1)
+            #
+        #
+    #
+    return( 0)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Remove_File FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function List_NCDF_Files
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def List_NCDF_Files(datapath, file_prefix):
+    #
+    # Same as -ls -1 datapath/file_prefix*.nc*-: the NETCDF files
+    # [full path, NAME.nc or NAME.nc.gz] in name order, so the last
+    # one is the most recent.
+    #
+    return( [datapath+name for name in sorted(OS.listdir(datapath))
+             if name.startswith(file_prefix) and name.endswith(('.nc', '.nc.gz')) and OS.path.isfile(datapath+name)])
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF List_NCDF_Files FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Gunzip_File
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Gunzip_File(gz_file_name, dest_name=None):
+    #
+    # Same as -gunzip gz_file_name-: NAME.gz is replaced by NAME,
+    # with the permissions and time stamp of NAME.gz.
+    # With -dest_name- [a file name, or a directory] it is the same as
+    # -gunzip -c gz_file_name > dest_name- instead, and NAME.gz is kept.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  The data is written to a private temp name [.NAME.PID.part] and renamed
+    #  into place, so the NETCDF file is never seen half written. The .gz file
+    #  is only removed once NAME is complete.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    nc_file_name=gz_file_name[:-len('.gz')]
+    #
+    if dest_name is not None:
+        nc_file_name=dest_name
+        if OS.path.isdir(dest_name):
+            nc_file_name=OS.path.join(dest_name, OS.path.basename(gz_file_name[:-len('.gz')]))
+            #
+        #
+    #
+    temp_name=OS.path.join(OS.path.dirname(nc_file_name), '.'+OS.path.basename(nc_file_name)+'.'+str(OS.getpid())+'.part')
+    #
+    try:
+        with GZIP.open(gz_file_name, "rb") as gz_obj, open(temp_name, "wb") as nc_obj:
+            SHUTIL.copyfileobj(gz_obj, nc_obj, 1024*1024)
+            #
+        #
+        SHUTIL.copystat(gz_file_name, temp_name)
+        OS.replace(temp_name, nc_file_name)
+        if dest_name is None:
+            OS.remove(gz_file_name)
+            #
+        #
+    except (OSError, IOError, EOFError, ZLIB.error) as gunzip_error:
+        print("---GUNZIP FAILED: "+gz_file_name+" "+str(gunzip_error))
+        if OS.path.exists(temp_name):
+            OS.remove(temp_name)
+            #
+        return( 1)
+        #
+    #
+    return( 0)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Gunzip_File FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Copy_File_Atomically
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Copy_File_Atomically(source_file, dest_name):
+    #
+    # Copies -source_file- to -dest_name- [a file name, or a directory].
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  The copy is first written to a private temp name [.NAME.PID.part] in the
+    #  destination directory and then renamed into place. The rename is atomic,
+    #  so DPS, the modelers and the satfocus converter never pick up a half
+    #  written file, even when several workers publish files at the same time.
+    #
+    #  Returns 0 on success and 1 on failure [like -OS.system('cp ...')- did].
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    if OS.path.isdir(dest_name):
+        dest_name=OS.path.join(dest_name, OS.path.basename(source_file))
+        #
+    #
+    temp_name=OS.path.join(OS.path.dirname(dest_name), '.'+OS.path.basename(dest_name)+'.'+str(OS.getpid())+'.part')
+    #
+    try:
+        SHUTIL.copy(source_file, temp_name)
+        OS.replace(temp_name, dest_name)
+    except OSError as copy_error:
+        print("---COPY FAILED: "+str(copy_error))
+        if OS.path.exists(temp_name):
+            OS.remove(temp_name)
+            #
+        return( 1)
+        #
+    #
+    return( 0)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Copy_File_Atomically FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Publish_File
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Publish_File(source_file, dest_name, published_files):
+    #
+    # Publishes -source_file- as -dest_name- [a file name, or a directory]
+    # for one target of a fan-out [ascii_orig, ascii_aa, ascii_bb, ...].
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  -published_files- is kept by the caller for the whole fan-out and maps
+    #  each filesystem [st_dev] to a file already holding the data there:
+    #     -a- A target on a filesystem in -published_files- gets a hardlink
+    #         of that file [no data is written, only a directory entry].
+    #     -b- Otherwise the data is copied once, and the copy is what the
+    #         next targets on that filesystem are linked to.
+    #  The source filesystem is added on the first call, so the targets next
+    #  to the temp ascii file are all hardlinks of it. If the link is refused
+    #  [a filesystem without hardlinks] the data is copied instead.
+    #
+    #  Like -Copy_File_Atomically-, the target is first made under a private
+    #  temp name [.NAME.PID.part] and renamed into place.
+    #  The targets share one inode [and its mode], so an edit in place of
+    #  one of them would change all of them. The caller makes -source_file-
+    #  read only [555] before the first call: the links, and the copies,
+    #  which keep the mode, can then be read, renamed or removed by the
+    #  consumers, but not written to.
+    #
+    #  Returns 0 on success and 1 on failure.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    if OS.path.isdir(dest_name):
+        dest_name=OS.path.join(dest_name, OS.path.basename(source_file))
+        #
+    #
+    temp_name=OS.path.join(OS.path.dirname(dest_name), '.'+OS.path.basename(dest_name)+'.'+str(OS.getpid())+'.part')
+    #
+    try:
+        if len(published_files) == 0:
+            published_files[OS.stat(source_file).st_dev]=source_file
+            #
+        #
+        dest_device=OS.stat(OS.path.dirname(dest_name) or '.').st_dev
+        #
+        if dest_device in published_files:
+            try:
+                OS.link(published_files[dest_device], temp_name)
+            except OSError:
+                SHUTIL.copy(source_file, temp_name)
+                #
+            #
+        else:
+            SHUTIL.copy(source_file, temp_name)
+            #
+        #
+        OS.replace(temp_name, dest_name)
+        published_files.setdefault(dest_device, dest_name)
+    except OSError as publish_error:
+        print("---PUBLISH FAILED: "+str(publish_error))
+        if OS.path.exists(temp_name):
+            OS.remove(temp_name)
+            #
+        return( 1)
+        #
+    #
+    return( 0)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Publish_File FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Reserve_File_Name
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Reserve_File_Name(file_path, file_names, taken_paths):
+    #
+    # Creates [empty] the first of -file_names- that is free in -file_path-
+    # and in none of -taken_paths- [the locations the file is published to],
+    # and returns it. Returns '' when every name is taken.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  The name is taken with O_CREAT|O_EXCL, so two workers converting in
+    #  the same minute never get the same name: only one of them creates it.
+    #  A name already published [an earlier file of the same minute, which
+    #  is gone from -file_path-] is given back and the next one is tried.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    for file_name in file_names:
+        #
+        try:
+            OS.close(OS.open(OS.path.join(file_path, file_name), OS.O_WRONLY|OS.O_CREAT|OS.O_EXCL, 0o664))
+        except FileExistsError:
+            continue
+        except OSError as reserve_error:
+            print("---RESERVE FAILED: "+str(reserve_error))
+            return( '')
+            #
+        #
+        if any(OS.path.lexists(OS.path.join(x, file_name)) for x in taken_paths):
+            Remove_File(OS.path.join(file_path, file_name))
+            continue
+            #
+        #
+        return( file_name)
+        #
+    #
+    return( '')
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Reserve_File_Name FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
@@ -0,0 +1,525 @@
+# -*- coding: utf-8 -*-
+#==-FNMOC/N38DI PYTHON MODULE DEFINITION-===========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_core/inbox_watch.py
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  MODULE OVERVIEW:
+#	(1) Watch mode [scatsat_knmi_daemon3.py]: XFER_BASEPATH is watched by
+#	    one long running process and each NETCDF file is converted by the
+#	    -main- functions of the converter scripts as soon as it has been
+#	    written, without the job, ksh and python start-up for every file.
+#	    Each converter reads its own inbox, as with the ksh scripts
+#	    [scatsat_knmi for QSCAT, scatsat_satfocus for SATFOCUS].
+#	(2) The inbox is watched with Linux inotify [IN_CLOSE_WRITE and
+#	    IN_MOVED_TO, through ctypes and the C library]. Where inotify is
+#	    not available the inbox is polled instead: a file is taken once
+#	    its size and time stamp are the same on two scans in a row.
+#
+# Programmer: Mr. Paul McCrone     02 February  2015 --Original Build for NASA RAPIDSCAT----
+#                                  13 September 2017 --New modified build for ISRO ScatSat--
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 First version.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.1, Dated 2026-Oct-17
+#                                 The poll keys the files it tried on their size and
+#                                 time stamp [Get_Inbox_File_Stamp], so a new delivery
+#                                 under the same name is converted, and forgets the
+#                                 files that left the inbox.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.2, Dated 2026-Oct-17
+#                                 The NAME.done.WRITER markers of the pipeline go
+#                                 with the file [Remove_Done_Markers].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.3, Dated 2026-Oct-17
+#                                 So does the NAME.tries count
+#                                 [Remove_Pipeline_Markers].
+#========================================================================================
+#
+import os as OS
+import sys as SYS
+import time as TIME
+import select as SELECT
+import struct as STRUCT
+import ctypes as CTYPES
+import ctypes.util
+import traceback as TRACEBACK
+#
+from .backlog import Find_Pending_NCDF_Files, Report_Execution_Code
+from .file_ops import Remove_File
+from .pipeline import Remove_Pipeline_Markers
+#
+dadash="-------------------------------------"
+#
+#----------------------------------------------------------------
+# inotify event masks [/usr/include/sys/inotify.h] and the fixed part
+# of a -struct inotify_event- [wd, mask, cookie, len], followed by
+# -len- bytes of the NUL padded file name.
+#----------------------------------------------------------------
+#
+IN_CLOSE_WRITE=0x00000008
+IN_MOVED_TO=0x00000080
+IN_Q_OVERFLOW=0x00004000
+IN_IGNORED=0x00008000
+#
+INOTIFY_EVENT=STRUCT.Struct('iIII')
+#
+#
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#  LIST OF PYTHON FUNCTIONS:
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#  ==> Open_Inbox_Watch(datapath, use_inotify=True)
+#	--> datapath:String, Output: Dictionary of the watch [mode, fd, ...]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Close_Inbox_Watch(inbox_watch)
+#	--> inbox_watch:Dictionary, Output: None
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Read_Inotify_Names(watch_fd)
+#	--> watch_fd:Integer, Output: Tuple of the set of file names and the masks seen
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_Inbox_File_Stamp(nc_filename)
+#	--> nc_filename:String, Output: Tuple of size and time stamp [None if gone]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Wait_For_Inbox_Files(inbox_watch, file_prefixes, poll_seconds)
+#	--> poll_seconds:Float, Output: List of the NETCDF files ready to convert
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Convert_Inbox_NCDF_File(converters, file_name)
+#	--> converters:List of (name, main function, XFER_BASEPATH), Output: List of execution codes
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Serve_Inbox_NCDF_Files(converters, file_prefixes, poll_seconds, use_inotify, stop_request)
+#	--> stop_request:Dictionary, Output: Execution code for the whole run
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Open_Inbox_Watch
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Open_Inbox_Watch(datapath, use_inotify=True):
+    #
+    # Returns the watch of -datapath- as a dictionary:
+    #     mode      'inotify' or 'poll'
+    #     fd        the inotify file descriptor [-1 when polling]
+    #     stats     size and time stamp of each file on the last poll
+    #     rescan    True when the whole inbox must be scanned on the next
+    #               wait [at the start, and when inotify lost events]
+    #
+    inbox_watch={'datapath':datapath, 'mode':'poll', 'fd':-1, 'stats':{}, 'rescan':True}
+    #
+    if use_inotify:
+        try:
+            libc=CTYPES.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            watch_fd=libc.inotify_init1(OS.O_CLOEXEC)
+            #
+            if watch_fd >= 0:
+                if libc.inotify_add_watch(watch_fd, OS.fsencode(datapath), IN_CLOSE_WRITE | IN_MOVED_TO) >= 0:
+                    inbox_watch['mode']='inotify'
+                    inbox_watch['fd']=watch_fd
+                else:
+                    OS.close(watch_fd)
+                    #
+                #
+            #
+        except (OSError, AttributeError):
+            pass
+            #
+        #
+    #
+    if inbox_watch['mode'] == 'inotify':
+        print("---WATCH: inotify watch on "+datapath)
+    else:
+        print("---WATCH: polling "+datapath+" [inotify is not used]")
+        #
+    #
+    return( inbox_watch)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Open_Inbox_Watch FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Close_Inbox_Watch
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Close_Inbox_Watch(inbox_watch):
+    #
+    if inbox_watch['fd'] >= 0:
+        OS.close(inbox_watch['fd'])
+        inbox_watch['fd']=-1
+        #
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Close_Inbox_Watch FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Read_Inotify_Names
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Read_Inotify_Names(watch_fd):
+    #
+    # Reads the waiting inotify events and returns the names of the
+    # files written or moved into the inbox, with the OR of all the
+    # event masks [to see IN_Q_OVERFLOW and IN_IGNORED].
+    #
+    event_buffer=OS.read(watch_fd, 64*1024)
+    #
+    file_names=set()
+    event_masks=0
+    offset=0
+    #
+    while offset+INOTIFY_EVENT.size <= len(event_buffer):
+        #
+        watch_wd,event_mask,event_cookie,name_length=INOTIFY_EVENT.unpack_from(event_buffer, offset)
+        offset+=INOTIFY_EVENT.size
+        #
+        event_masks|=event_mask
+        #
+        if name_length > 0:
+            file_names.add(OS.fsdecode(event_buffer[offset:offset+name_length].rstrip(b'\0')))
+            #
+        #
+        offset+=name_length
+        #
+    #
+    return( file_names, event_masks)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Read_Inotify_Names FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Inbox_File_Stamp
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Inbox_File_Stamp(nc_filename):
+    #
+    # The (size, time stamp) of an inbox file, None once it is gone. A new
+    # delivery under the same name has a new stamp.
+    #
+    try:
+        file_stat=OS.stat(nc_filename)
+    except OSError:
+        return( None)
+        #
+    #
+    return( (file_stat.st_size, file_stat.st_mtime))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Inbox_File_Stamp FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Wait_For_Inbox_Files
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Wait_For_Inbox_Files(inbox_watch, file_prefixes, poll_seconds):
+    #
+    # Waits at most -poll_seconds- and returns the NETCDF files of the inbox
+    # that are ready to be converted, in the backlog order [oldest orbit
+    # first, see -Find_Pending_NCDF_Files-]. An empty list when none are.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  The first wait returns every file already in the inbox, as --all
+    #  does. After that:
+    #     inotify   the files closed after writing or moved into the inbox
+    #               since the last wait. The inbox is scanned again if
+    #               the kernel queue overflowed. If the watch is lost
+    #               [the directory was removed], the inbox is polled.
+    #     poll      the files whose size and time stamp did not change
+    #               since the last scan.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    datapath=inbox_watch['datapath']
+    #
+    if inbox_watch['rescan']:
+        inbox_watch['rescan']=False
+        return( Find_Pending_NCDF_Files(datapath, file_prefixes))
+        #
+    #
+    if inbox_watch['mode'] == 'inotify':
+        #
+        readable_fds,writable_fds,error_fds=SELECT.select([inbox_watch['fd']], [], [], poll_seconds)
+        #
+        if len(readable_fds) == 0:
+            return( [])
+            #
+        #
+        file_names,event_masks=Read_Inotify_Names(inbox_watch['fd'])
+        #
+        if event_masks & IN_Q_OVERFLOW:
+            print("---WATCH: inotify queue overflow, the inbox is scanned again")
+            return( Find_Pending_NCDF_Files(datapath, file_prefixes))
+            #
+        #
+        if event_masks & IN_IGNORED:
+            print("---WATCH: the inotify watch was removed, polling "+datapath)
+            Close_Inbox_Watch(inbox_watch)
+            inbox_watch['mode']='poll'
+            #
+        #
+        return( [x for x in Find_Pending_NCDF_Files(datapath, file_prefixes) if OS.path.basename(x) in file_names])
+        #
+    #
+    TIME.sleep(poll_seconds)
+    #
+    if not OS.path.isdir(datapath):
+        return( [])
+        #
+    #
+    ready_files=[]
+    file_stats={}
+    #
+    for nc_filename in Find_Pending_NCDF_Files(datapath, file_prefixes):
+        file_stats[nc_filename]=Get_Inbox_File_Stamp(nc_filename)
+        #
+        if file_stats[nc_filename] is None:
+            continue
+            #
+        #
+        if inbox_watch['stats'].get(nc_filename) == file_stats[nc_filename]:
+            ready_files.append(nc_filename)
+            #
+        #
+    #
+    inbox_watch['stats']=file_stats
+    #
+    return( ready_files)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Wait_For_Inbox_Files FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Convert_Inbox_NCDF_File
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Convert_Inbox_NCDF_File(converters, file_name):
+    #
+    # Converts one delivered file the way the SMS task does [scatsat_knmi.fcn].
+    # -converters- is a list of (name, main function, XFER_BASEPATH), in order:
+    #     QSCAT      reads XFER_BASEPATH [scatsat_knmi] and copies the file
+    #                to the SATFOCUS inbox [scatsat_satfocus]
+    #     SATFOCUS   reads scatsat_satfocus, copies the file to NRL and
+    #                removes it
+    # Each -main- runs with XFER_BASEPATH set to its own inbox, as the
+    # *_ncdf.ksh scripts export it, and is followed by the message for its
+    # execution code. A converter whose inbox does not have the file is skipped.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  A file still in an inbox afterwards is removed, as the -rm -rf
+    #  oscat_*.nc*- at the end of the ksh scripts does, unless its converter
+    #  stopped with an exception [Execution Code 0]. Then it is kept as
+    #  FAILED_NAME for examination, as -analyze_run_scatsat_knmi_exit_code-
+    #  does. Either way its NAME.done.WRITER markers and NAME.tries count
+    #  [pipeline] are removed.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    converter_executions=[]
+    #
+    saved_XFER_BASEPATH=OS.environ.get('XFER_BASEPATH')
+    #
+    for converter_name, main_function, xfer_basepath in converters:
+        #
+        nc_filename=xfer_basepath+'/'+file_name
+        #
+        if not OS.path.isfile(nc_filename):
+            print("---WATCH: "+converter_name+" skipped, there is no "+nc_filename)
+            continue
+            #
+        #
+        print(dadash+dadash)
+        print("---WATCH: "+converter_name+" conversion of "+nc_filename)
+        print(dadash+dadash)
+        #
+        OS.environ['XFER_BASEPATH']=xfer_basepath
+        #
+        try:
+            this_execution=main_function(nc_filename)
+        except Exception:
+            TRACEBACK.print_exc(file=SYS.stdout)
+            this_execution=0
+            #
+        #
+        Report_Execution_Code(this_execution)
+        converter_executions.append(this_execution)
+        #
+        print(dadash+dadash)
+        print("---WATCH: "+converter_name+" Execution Code "+str(this_execution)+" for "+nc_filename)
+        print(dadash+dadash)
+        #
+        if not OS.path.isfile(nc_filename):
+            continue
+            #
+        #
+        if this_execution == 0:
+            failed_nc_filename=xfer_basepath+'/FAILED_'+file_name
+            print("---WATCH: keeping the file as "+failed_nc_filename)
+            #
+            try:
+                OS.replace(nc_filename, failed_nc_filename)
+            except OSError as move_error:
+                print("---MOVE FAILED: "+str(move_error))
+                converter_executions.append(97)
+                #
+            #
+        elif Remove_File(nc_filename) != 0:
+            converter_executions.append(97)
+            #
+        #
+        Remove_Pipeline_Markers(nc_filename)
+        #
+    #
+    if saved_XFER_BASEPATH is None:
+        OS.environ.pop('XFER_BASEPATH', None)
+    else:
+        OS.environ['XFER_BASEPATH']=saved_XFER_BASEPATH
+        #
+    #
+    SYS.stdout.flush()
+    #
+    return( converter_executions)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Convert_Inbox_NCDF_File FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Serve_Inbox_NCDF_Files
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Serve_Inbox_NCDF_Files(converters, file_prefixes, poll_seconds, use_inotify, stop_request):
+    #
+    # Watch mode: converts each NETCDF file that arrives in the inbox of the
+    # first converter [see -Convert_Inbox_NCDF_File-] until stop_request['stop']
+    # is set [SIGTERM or SIGINT in scatsat_knmi_daemon3.py]. The file being
+    # converted is always finished first.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  At the start, the files left in the inbox of a later converter [a run
+    #  stopped between QSCAT and SATFOCUS] are converted from there on.
+    #
+    #  Returns the code for the whole run, with the precedence of the
+    #  backlog mode [-Process_Pending_NCDF_Files-]:
+    #     90 if any file hit a path problem, or an inbox is gone
+    #        [the watch stops at once: the paths need an operator],
+    #     97 if any file had a problem with the operating system,
+    #      1 if at least one file was converted,
+    #     55 if nothing arrived.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    for converter_name, main_function, xfer_basepath in converters:
+        if not OS.path.isdir(xfer_basepath):
+            print("-------The datapath is INVALID! NEED TO CHECK THIS!!!!!!!! -----------------")
+            print("-------"+converter_name+" inbox: "+xfer_basepath)
+            return( 90)
+            #
+        #
+    #
+    datapath=converters[0][2]+'/'
+    #
+    tried_files={}
+    file_executions=[]
+    #
+    for converter_index in range(1, len(converters)):
+        #
+        first_inbox_files=[OS.path.basename(x) for x in Find_Pending_NCDF_Files(datapath, file_prefixes)]
+        #
+        for nc_filename in Find_Pending_NCDF_Files(converters[converter_index][2]+'/', file_prefixes):
+            if OS.path.basename(nc_filename) not in first_inbox_files:
+                file_executions.extend(Convert_Inbox_NCDF_File(converters[converter_index:], OS.path.basename(nc_filename)))
+                #
+            #
+        #
+    #
+    inbox_watch=Open_Inbox_Watch(datapath, use_inotify)
+    SYS.stdout.flush()
+    #
+    try:
+        while (not stop_request['stop']) and (90 not in file_executions):
+            #
+            if not OS.path.exists(datapath):
+                print("-------The datapath is INVALID! NEED TO CHECK THIS!!!!!!!! -----------------")
+                file_executions.append(90)
+                break
+                #
+            #
+            ready_files=Wait_For_Inbox_Files(inbox_watch, file_prefixes, poll_seconds)
+            #
+            # A file that left the inbox is forgotten, so -tried_files- only
+            # holds the files still there [ones that could not be removed].
+            #
+            tried_files=dict((x, tried_files[x]) for x in tried_files if OS.path.exists(x))
+            #
+            for nc_filename in ready_files:
+                #
+                if stop_request['stop'] or (90 in file_executions):
+                    break
+                    #
+                #
+                # A file that comes back under the same name after it was
+                # converted is a new delivery for inotify. The poll does not
+                # try the same file twice, but a file with a new size or
+                # time stamp under the same name is a new delivery.
+                #
+                file_stamp=Get_Inbox_File_Stamp(nc_filename)
+                #
+                if (inbox_watch['mode'] == 'poll') and (tried_files.get(nc_filename) == file_stamp):
+                    continue
+                    #
+                #
+                tried_files[nc_filename]=file_stamp
+                file_executions.extend(Convert_Inbox_NCDF_File(converters, OS.path.basename(nc_filename)))
+                #
+            #
+        #
+    finally:
+        Close_Inbox_Watch(inbox_watch)
+        #
+    #
+    print(dadash+dadash)
+    print("---WATCH SUMMARY: "+str(len(file_executions))+" conversion(s)")
+    #
+    for exec_code in sorted(set(file_executions)):
+        print("---   Execution Code "+str(exec_code)+" : "+str(file_executions.count(exec_code))+" time(s)")
+        #
+    print(dadash+dadash)
+    #
+    if 90 in file_executions:
+        return( 90)
+    elif 97 in file_executions:
+        return( 97)
+    elif 1 in file_executions:
+        return( 1)
+        #
+    #
+    return( 55)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Serve_Inbox_NCDF_Files FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
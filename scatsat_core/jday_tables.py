@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+#==-FNMOC/N38DI PYTHON MODULE DEFINITION-===========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_core/jday_tables.py
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  MODULE OVERVIEW:
+#	(1) Month and date [MMDD] of a Julian day, for leap years and for
+#	    non-leap years. Used by -Get_Converted_Time90-.
+#	(2) The same for a whole array of Julian days [Determine_mndate_Array].
+#
+# Programmer: Mr. Paul McCrone     02 February  2015 --Original Build for NASA RAPIDSCAT----
+#                                  13 September 2017 --New modified build for ISRO ScatSat--
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 Moved out of the converter scripts into the shared
+#                                 scatsat_core package.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.1, Dated 2026-Oct-17
+#                                 The Julian days outside the tables are logged at
+#                                 DEBUG and counted [RUN_COUNTS bad_jday_cells].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.2, Dated 2026-Oct-17
+#                                 The -elif jday == N- chains [366 and 365 branches]
+#                                 are replaced by the lookup tables MMDD_TABLE and
+#                                 LEAP_MMDD_TABLE, built once from the datetime
+#                                 calendar. Determine_mndate_Array.
+#========================================================================================
+#
+import numpy as N
+import datetime
+#
+from .run_log import LOGGER, Count_Run_Event
+#
+#----------------------------------------------------------------
+# MMDD of every Julian day, indexed by the Julian day [1-365 on a
+# non-leap year, 1-366 on a leap year]. Entry 0 is "0000", the
+# answer for a day that is not in the year.
+#----------------------------------------------------------------
+#
+MMDD_TABLE=["0000"]+[(datetime.date(2017, 1, 1)+datetime.timedelta(days=jday-1)).strftime("%m%d")
+                     for jday in range(1, 366)]
+#
+LEAP_MMDD_TABLE=["0000"]+[(datetime.date(2016, 1, 1)+datetime.timedelta(days=jday-1)).strftime("%m%d")
+                          for jday in range(1, 367)]
+#
+#
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#  LIST OF PYTHON FUNCTIONS:
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#  ==> Determine_mndate_from_leapjday(jday)
+#	--> Determine the month and date from Julian day (on leap years)
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Determine_mndate_from_jday(jday)
+#	--> Determine the month and date from Julian day (on non-leap years)
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Determine_mndate_Array(jday, leap_year)
+#	--> jday:Array of Integer, leap_year:Boolean or Array of Boolean,
+#	    Output: String Array of MMDD
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Determine_mndate_from_leapjday
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Determine_mndate_from_leapjday(jday):
+    #
+    #-----#-----#-----#-----#-----
+    #
+
+    month_n_date="0000"
+
+    if jday < 1:
+        Count_Run_Event('bad_jday_cells')
+        LOGGER.debug("ERROR==>Input Jday cannot be less than 0.")
+        return month_n_date
+        #
+        #----------------------------------------------------
+        # End of if block
+        #----------------------------------------------------
+
+    if jday > 366:
+        Count_Run_Event('bad_jday_cells')
+        LOGGER.debug("ERROR==>Input Jday cannot exceed 366.")
+        return month_n_date
+        #
+        #----------------------------------------------------
+        # End of if block
+        #----------------------------------------------------
+
+    #
+    # A day that is not a whole number [or NaN] is in no table entry.
+    #
+    if jday % 1 == 0:
+        month_n_date=LEAP_MMDD_TABLE[int(jday)]
+        #
+    #
+    return month_n_date
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Determine_mndate_from_leapjday
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Determine_mndate_from_jday
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Determine_mndate_from_jday(jday):
+    #
+    #-----#-----#-----#-----#-----
+    #
+
+    month_n_date="0000"
+
+    if jday < 1:
+        Count_Run_Event('bad_jday_cells')
+        LOGGER.debug("ERROR==>Input Jday cannot be less than 0.")
+        return month_n_date
+        #
+        #----------------------------------------------------
+        # End of if block
+        #----------------------------------------------------
+
+    if jday > 365:
+        Count_Run_Event('bad_jday_cells')
+        LOGGER.debug("ERROR==>Input Jday cannot exceed 365.")
+        return month_n_date
+        #
+        #----------------------------------------------------
+        # End of if block
+        #----------------------------------------------------
+
+    #
+    # A day that is not a whole number [or NaN] is in no table entry.
+    #
+    if jday % 1 == 0:
+        month_n_date=MMDD_TABLE[int(jday)]
+        #
+    #
+    return month_n_date
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Determine_mndate_from_jday
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Determine_mndate_Array
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Determine_mndate_Array(jday, leap_year):
+    #
+    # Whole array version of -Determine_mndate_from_jday- and
+    # -Determine_mndate_from_leapjday- : one table lookup per day.
+    # -leap_year- is one Boolean for all the days, or an array of the
+    # same shape as -jday- . A day outside its year gives "0000" and is
+    # counted [RUN_COUNTS bad_jday_cells].
+    #
+    jday=N.asarray(jday)
+    #
+    day_index=N.zeros(jday.shape, dtype=N.int64)
+    #
+    with N.errstate(invalid='ignore'):
+        #
+        last_day=N.where(leap_year, 366, 365)
+        good_day=(jday >= 1) & (jday <= last_day) & (jday % 1 == 0)
+        #
+    #
+    day_index[good_day]=jday[good_day]
+    #
+    Count_Run_Event('bad_jday_cells', jday.size-N.count_nonzero(good_day))
+    #
+    month_n_date=N.where(leap_year, N.array(LEAP_MMDD_TABLE)[day_index],
+                         N.array(MMDD_TABLE+["0000"])[day_index])
+    #
+    return( month_n_date)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Determine_mndate_Array FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
@@ -0,0 +1,515 @@
+# -*- coding: utf-8 -*-
+#==-FNMOC/N38DI PYTHON MODULE DEFINITION-===========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_core/ncdf3_mmap.py
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  MODULE OVERVIEW:
+#	(1) A memory mapped reader for the netCDF3 classic files of KNMI
+#	    [oscat_*.nc, rapid_*.nc], on scipy.io.netcdf_file [mmap=True].
+#	    The file is mapped, not read: only the rows of the variables the
+#	    record writer asks for are paged in, once.
+#	(2) The file and variable objects answer the calls the converters make
+#	    on a netCDF4 Dataset [title, stop_date, dimensions, variables,
+#	    shape, units, [first_row:end_row], close], and the arrays are the
+#	    ones netCDF4 gives:
+#	        masked where the packed value is the _FillValue [the default
+#	        netCDF fill value without one], a missing_value, or outside
+#	        valid_range / valid_min / valid_max,
+#	        then times scale_factor, plus add_offset,
+#	    applied to the rows read only, when they are read.
+#	(3) SCATSAT_NCDF_MMAP=1 selects it in -Open_NCDF_File- . A file that
+#	    is not netCDF3 [the netCDF4/HDF5 JPL files], or one scipy can not
+#	    parse [record variables whose last record is not padded], is read
+#	    with netCDF4.
+#	(4) The size a netCDF3 file must have, from its header
+#	    [Get_NCDF3_Data_Size]. A copy cut short still opens with netCDF4,
+#	    which fills the missing rows, so -Open_NCDF_File- checks the size
+#	    before the swath goes to the writers [Check_NCDF3_File_Size].
+#
+# Programmer: Mr. Paul McCrone     02 February  2015 --Original Build for NASA RAPIDSCAT----
+#                                  13 September 2017 --New modified build for ISRO ScatSat--
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 First version.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.1, Dated 2026-Oct-17
+#                                 set_auto_scale [the packed values, for
+#                                 SCATSAT_PACKED_VALUES=1].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.2, Dated 2026-Oct-17
+#                                 Get_NCDF3_Data_Size, Check_NCDF3_File_Size [see (4)].
+#========================================================================================
+#
+import io as IO
+import os as OS
+import struct as STRUCT
+import numpy as N
+import scipy.io as SIO
+#
+#
+#----------------------------------------------------------------
+# The netCDF default fill values [netCDF4.default_fillvals], used to
+# mask a variable that has no _FillValue, as netCDF4 does.
+#----------------------------------------------------------------
+#
+NCDF3_DEFAULT_FILLS={'i1':-127,
+                     'i2':-32767,
+                     'i4':-2147483647,
+                     'f4':9.969209968386869e+36,
+                     'f8':9.969209968386869e+36}
+#
+#----------------------------------------------------------------
+# The bytes of each netCDF3 type [NC_BYTE, NC_CHAR, NC_SHORT, NC_INT,
+# NC_FLOAT, NC_DOUBLE].
+#----------------------------------------------------------------
+#
+NCDF3_TYPE_SIZES={1:1, 2:1, 3:2, 4:4, 5:4, 6:8}
+#
+#
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#  LIST OF PYTHON FUNCTIONS:
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#  ==> Use_Mapped_NCDF_Reader()
+#	--> Output: Boolean [SCATSAT_NCDF_MMAP=1]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Is_NCDF3_File(nc_bytes)
+#	--> nc_bytes:the first bytes of the file, Output: Boolean
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Read_NCDF3_Header_Values(nc_obj, value_format)
+#	--> value_format:String [struct, big endian], Output: Tuple
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Skip_NCDF3_Attributes(nc_obj)
+#	--> nc_obj:binary file at an attribute list, Output: None
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_NCDF3_Data_Size(nc_obj)
+#	--> nc_obj:binary file at its start, Output: Integer [bytes]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Check_NCDF3_File_Size(nc_filename, nc_obj, file_size)
+#	--> file_size:Integer [bytes], Output: None [ValueError when too short]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Decode_NCDF_Attribute(att_value)
+#	--> att_value:bytes or number, Output: String or number
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Open_Mapped_NCDF_File(nc_filename, nc_bytes=None)
+#	--> nc_filename:String, Output: Mapped_NCDF_File
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> class Mapped_NCDF_File, class Mapped_NCDF_Variable
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Use_Mapped_NCDF_Reader
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Use_Mapped_NCDF_Reader():
+    #
+    return( OS.environ.get('SCATSAT_NCDF_MMAP', '') == '1')
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Use_Mapped_NCDF_Reader FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Is_NCDF3_File
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Is_NCDF3_File(nc_bytes):
+    #
+    # A netCDF3 file starts with CDF\x01 [classic] or CDF\x02 [64 bit
+    # offset]. A netCDF4 file is an HDF5 file [\x89HDF].
+    #
+    return( nc_bytes[:3] == b'CDF' and nc_bytes[3:4] in (b'\x01', b'\x02'))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Is_NCDF3_File FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Read_NCDF3_Header_Values
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Read_NCDF3_Header_Values(nc_obj, value_format):
+    #
+    # The next values of the header, or a ValueError when the file ends
+    # first.
+    #
+    value_size=STRUCT.calcsize(value_format)
+    value_bytes=nc_obj.read(value_size)
+    #
+    if len(value_bytes) != value_size:
+        raise ValueError("the netCDF3 header ends at byte "+str(nc_obj.tell()))
+        #
+    #
+    return( STRUCT.unpack(value_format, value_bytes))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Read_NCDF3_Header_Values FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Skip_NCDF3_Attributes
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Skip_NCDF3_Attributes(nc_obj):
+    #
+    # An attribute list: tag, count, then name, type, count and values of
+    # each attribute, the names and values padded to 4 bytes.
+    #
+    att_tag,number_of_atts=Read_NCDF3_Header_Values(nc_obj, '>ii')
+    #
+    for k in range(number_of_atts):
+        name_length,=Read_NCDF3_Header_Values(nc_obj, '>i')
+        Read_NCDF3_Header_Values(nc_obj, '>%ds' % ((name_length+3)//4*4))
+        #
+        nc_type,number_of_values=Read_NCDF3_Header_Values(nc_obj, '>ii')
+        #
+        if nc_type not in NCDF3_TYPE_SIZES:
+            raise ValueError("the netCDF3 header has an attribute of type "+str(nc_type))
+            #
+        #
+        Read_NCDF3_Header_Values(nc_obj, '>%ds' % ((number_of_values*NCDF3_TYPE_SIZES[nc_type]+3)//4*4))
+        #
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Skip_NCDF3_Attributes FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_NCDF3_Data_Size
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_NCDF3_Data_Size(nc_obj):
+    #
+    # The bytes a complete netCDF3 file [classic or 64 bit offset] holds,
+    # from its header: the end of the last fixed size variable, or of the
+    # last record variable in the last record. Only the header is read.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  The last variable is not padded at the end of the file. A record is
+    #  the padded sizes [vsize] of all the record variables, or the exact
+    #  size when there is only one. A file still being written [numrecs
+    #  STREAMING] is checked for its fixed size variables only.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    nc_magic,number_of_records=Read_NCDF3_Header_Values(nc_obj, '>4si')
+    #
+    if not Is_NCDF3_File(nc_magic):
+        raise ValueError("not a netCDF3 file")
+        #
+    #
+    begin_format='>i' if nc_magic[3:4] == b'\x01' else '>q'
+    number_of_records=max(number_of_records, 0)
+    #
+    dim_tag,number_of_dims=Read_NCDF3_Header_Values(nc_obj, '>ii')
+    dim_lengths=[]
+    #
+    for k in range(number_of_dims):
+        name_length,=Read_NCDF3_Header_Values(nc_obj, '>i')
+        Read_NCDF3_Header_Values(nc_obj, '>%ds' % ((name_length+3)//4*4))
+        dim_lengths.extend(Read_NCDF3_Header_Values(nc_obj, '>i'))
+        #
+    #
+    Skip_NCDF3_Attributes(nc_obj)
+    #
+    var_tag,number_of_vars=Read_NCDF3_Header_Values(nc_obj, '>ii')
+    variables=[]
+    #
+    for k in range(number_of_vars):
+        name_length,=Read_NCDF3_Header_Values(nc_obj, '>i')
+        Read_NCDF3_Header_Values(nc_obj, '>%ds' % ((name_length+3)//4*4))
+        #
+        var_rank,=Read_NCDF3_Header_Values(nc_obj, '>i')
+        var_dims=Read_NCDF3_Header_Values(nc_obj, '>%di' % var_rank)
+        #
+        Skip_NCDF3_Attributes(nc_obj)
+        #
+        nc_type,var_vsize=Read_NCDF3_Header_Values(nc_obj, '>ii')
+        var_begin,=Read_NCDF3_Header_Values(nc_obj, begin_format)
+        #
+        if nc_type not in NCDF3_TYPE_SIZES or [x for x in var_dims if x < 0 or x >= len(dim_lengths)]:
+            raise ValueError("the netCDF3 header has a variable of type "+str(nc_type)+" on dimensions "+str(var_dims))
+            #
+        #
+        is_record=var_rank > 0 and dim_lengths[var_dims[0]] == 0
+        var_size=NCDF3_TYPE_SIZES[nc_type]
+        #
+        for dim_id in var_dims[1 if is_record else 0:]:
+            var_size*=dim_lengths[dim_id]
+            #
+        #
+        variables.append((var_begin, var_size, var_vsize, is_record))
+        #
+    #
+    record_vars=[x for x in variables if x[3]]
+    #
+    if len(record_vars) == 1:
+        record_size=record_vars[0][1]
+    else:
+        record_size=sum(x[2] for x in record_vars)
+        #
+    #
+    data_size=nc_obj.tell()
+    #
+    for var_begin, var_size, var_vsize, is_record in variables:
+        #
+        if not is_record:
+            data_size=max(data_size, var_begin+var_size)
+        elif number_of_records > 0:
+            data_size=max(data_size, var_begin+(number_of_records-1)*record_size+var_size)
+            #
+        #
+    #
+    return( data_size)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_NCDF3_Data_Size FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Check_NCDF3_File_Size
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Check_NCDF3_File_Size(nc_filename, nc_obj, file_size):
+    #
+    # Raises a ValueError when the netCDF3 file -nc_filename- [open as
+    # -nc_obj-, or its decompressed bytes] is shorter than its header says:
+    # a copy cut short, whose missing rows netCDF4 would read as fill.
+    #
+    data_size=Get_NCDF3_Data_Size(nc_obj)
+    #
+    if file_size < data_size:
+        raise ValueError(nc_filename+" is truncated: "+str(file_size)+" bytes, the netCDF3 header needs "+str(data_size))
+        #
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Check_NCDF3_File_Size FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Decode_NCDF_Attribute
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Decode_NCDF_Attribute(att_value):
+    #
+    # scipy gives the text attributes as bytes, netCDF4 as strings
+    # [STR_END_DATE=str(fileobj.stop_date) needs the string].
+    #
+    if isinstance(att_value, bytes):
+        return( att_value.decode('utf-8', 'replace'))
+        #
+    #
+    return( att_value)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Decode_NCDF_Attribute FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#----------------------------------------------------------------
+# One variable of a mapped file. Nothing is read until it is indexed:
+#     variable[:]                    the whole variable
+#     variable[first_row:end_row]    a block of scan rows
+# The rows are copied out of the map [native byte order], masked, then
+# scaled, as netCDF4 does it:
+#     the masked cells keep their packed value in .data, .fill_value is
+#     a missing_value found in the rows, or else the _FillValue [the
+#     default fill without one], and nothing masked gives a plain
+#     masked_array [mask=nomask].
+# set_auto_scale(False) leaves out the scaling [the raw packed values,
+# masked, as netCDF4 gives them after the same call].
+#----------------------------------------------------------------
+#
+class Mapped_NCDF_Variable(object):
+    #
+    def __init__(self, name, scipy_variable):
+        self.name=name
+        self.dimensions=tuple(scipy_variable.dimensions)
+        self.shape=tuple(scipy_variable.shape)
+        self.dtype=scipy_variable.data.dtype.newbyteorder('=')
+        self._variable=scipy_variable
+        self._auto_scale=True
+        self._attributes=dict((att_name, Decode_NCDF_Attribute(att_value))
+                              for att_name, att_value in scipy_variable._attributes.items())
+    #
+    def __getattr__(self, att_name):
+        if att_name.startswith('_') or att_name not in self._attributes:
+            raise AttributeError(att_name)
+        return( self._attributes[att_name])
+    #
+    def __repr__(self):
+        return( '<mapped netCDF3 variable '+self.name+' '+str(self.dtype)+' '+str(self.dimensions)+' '+str(self.shape)+'>')
+    #
+    def ncattrs(self):
+        return( list(self._attributes))
+    #
+    @property
+    def size(self):
+        return( int(N.prod(self.shape)))
+    #
+    def set_auto_scale(self, auto_scale):
+        self._auto_scale=bool(auto_scale)
+    #
+    def __getitem__(self, elem):
+        #
+        packed=self._variable.data[elem].astype(self.dtype)
+        #
+        if self.dtype.kind not in 'iuf':
+            return( packed)
+            #
+        #
+        masked=N.zeros(packed.shape, dtype=bool)
+        fill_value=None
+        #
+        # A missing_value found in the rows is also their fill_value.
+        #
+        if 'missing_value' in self._attributes:
+            for missing_value in N.atleast_1d(N.array(self._attributes['missing_value'], self.dtype)):
+                missing_cells=N.isnan(packed) if N.isnan(missing_value) else (packed == missing_value)
+                if missing_cells.any():
+                    masked|=missing_cells
+                    if fill_value is None:
+                        fill_value=missing_value
+                        #
+                    #
+                #
+            #
+        #
+        if '_FillValue' in self._attributes:
+            nc_fill=N.array(self._attributes['_FillValue'], self.dtype)
+        else:
+            nc_fill=N.array(NCDF3_DEFAULT_FILLS[self.dtype.str[1:]], self.dtype)
+            #
+        #
+        masked|=N.isnan(packed) if N.isnan(nc_fill) else (packed == nc_fill)
+        #
+        if fill_value is None:
+            fill_value=nc_fill
+            #
+        #
+        # valid_range, otherwise valid_min and valid_max.
+        #
+        valid_min=self._attributes.get('valid_min', None)
+        valid_max=self._attributes.get('valid_max', None)
+        #
+        if 'valid_range' in self._attributes:
+            valid_min,valid_max=self._attributes['valid_range'][0],self._attributes['valid_range'][1]
+            #
+        if valid_min is not None:
+            masked|=(packed < valid_min)
+            #
+        if valid_max is not None:
+            masked|=(packed > valid_max)
+            #
+        #
+        if masked.any():
+            data=N.ma.masked_array(packed, mask=masked, fill_value=fill_value)
+        else:
+            data=N.ma.masked_array(packed)
+            #
+        #
+        if not self._auto_scale:
+            return( data)
+            #
+        #
+        if 'scale_factor' in self._attributes:
+            data=data*self._attributes['scale_factor']
+            #
+        if 'add_offset' in self._attributes:
+            data=data+self._attributes['add_offset']
+            #
+        #
+        return( data)
+    #
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#----------------------------------------------------------------
+# A mapped netCDF3 file: the global attributes [title, stop_date,
+# stop_time, ...] as strings, -dimensions- as name : length [None for
+# the record dimension] and -variables- as name : Mapped_NCDF_Variable.
+#----------------------------------------------------------------
+#
+class Mapped_NCDF_File(object):
+    #
+    def __init__(self, nc_filename, scipy_file):
+        self.filepath=nc_filename
+        self.file_format='NETCDF3_64BIT_OFFSET' if scipy_file.version_byte == 2 else 'NETCDF3_CLASSIC'
+        self.dimensions=dict(scipy_file.dimensions)
+        self.variables=dict((name, Mapped_NCDF_Variable(name, scipy_variable))
+                            for name, scipy_variable in scipy_file.variables.items())
+        self._file=scipy_file
+        self._attributes=dict((att_name, Decode_NCDF_Attribute(att_value))
+                              for att_name, att_value in scipy_file._attributes.items())
+    #
+    def __getattr__(self, att_name):
+        if att_name.startswith('_') or att_name not in self._attributes:
+            raise AttributeError(att_name)
+        return( self._attributes[att_name])
+    #
+    def ncattrs(self):
+        return( list(self._attributes))
+    #
+    def close(self):
+        #
+        # The map is only released once nothing refers to it. The arrays
+        # handed out are copies, so only the variables have to let go.
+        #
+        for variable in self.variables.values():
+            variable._variable=None
+            #
+        #
+        self._file.close()
+    #
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Open_Mapped_NCDF_File
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Open_Mapped_NCDF_File(nc_filename, nc_bytes=None):
+    #
+    # Maps the netCDF3 file -nc_filename- . With -nc_bytes- [a .nc.gz file
+    # already decompressed by Open_NCDF_File] the file is read from memory
+    # instead, with the same masking and scaling.
+    #
+    if nc_bytes is not None:
+        return( Mapped_NCDF_File(nc_filename, SIO.netcdf_file(IO.BytesIO(nc_bytes), 'r', mmap=False, maskandscale=False)))
+        #
+    #
+    return( Mapped_NCDF_File(nc_filename, SIO.netcdf_file(nc_filename, 'r', mmap=True, maskandscale=False)))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Open_Mapped_NCDF_File FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
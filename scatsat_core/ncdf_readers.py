@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+#==-FNMOC/N38DI PYTHON MODULE DEFINITION-===========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_core/ncdf_readers.py
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  MODULE OVERVIEW:
+#	(1) The reader for the level 2B NETCDF swath files. The KNMI files
+#	    [SCATSAT-1, RapidScat] and the JPL files [rscat_wind] store the
+#	    same fields under different variable names.
+#	(2) NCDF_READERS maps a reader name [KNMI, JPL] to a table of
+#	    swath name : NETCDF variable name. -Read_Swath_Variables- reads
+#	    the table into a dictionary keyed by the swath names, so the record
+#	    writers never see the file variable names.
+#	(3) -Open_NCDF_File- opens a NETCDF file, or a gzipped one [NAME.nc.gz]
+#	    straight from memory. With SCATSAT_NCDF_MMAP=1 a netCDF3 file is
+#	    memory mapped [scatsat_core/ncdf3_mmap.py] instead of opened with
+#	    netCDF4. The other readers work on either.
+#	(4) With SCATSAT_PACKED_VALUES=1 the scaled integer variables are read
+#	    as their raw integers [masked, not scaled], and swath['packing']
+#	    holds the scale_factor and add_offset of each of them
+#	    [scatsat_core/packed_strings.py].
+#
+# Programmer: Mr. Paul McCrone     02 February  2015 --Original Build for NASA RAPIDSCAT----
+#                                  13 September 2017 --New modified build for ISRO ScatSat--
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 The KNMI and JPL variable names in one place, for
+#                                 the shared scatsat_core package.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.1, Dated 2026-Oct-17
+#                                 Read_Swath_Variables only reads the swath names it is
+#                                 asked for [the variables the record writer uses].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.2, Dated 2026-Oct-17
+#                                 Open_NCDF_File [.nc.gz files are read without
+#                                 gunzipping them on disk].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.3, Dated 2026-Oct-17
+#                                 Read_Time_Units [the -units- of the -time- variable,
+#                                 for Get_Converted_Time_Array].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.4, Dated 2026-Oct-17
+#                                 Read_Swath_Rows [a block of scan rows] and
+#                                 Get_Swath_Variables [nothing read], for the
+#                                 streaming conversion.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.5, Dated 2026-Oct-17
+#                                 SCATSAT_NCDF_MMAP=1: Open_NCDF_File maps a netCDF3
+#                                 file [Open_Mapped_NCDF_File] instead of netCDF4.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.6, Dated 2026-Oct-17
+#                                 SCATSAT_PACKED_VALUES=1: the packed variables are
+#                                 read as raw integers [Read_Swath_Slice].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.7, Dated 2026-Oct-17
+#                                 Open_NCDF_File raises a ValueError for a netCDF3
+#                                 file shorter than its header says [Check_NCDF3_File_Size].
+#========================================================================================
+#
+import io as IO
+import os as OS
+import gzip as GZIP
+import netCDF4 as NCF
+#
+from .ncdf3_mmap import Use_Mapped_NCDF_Reader, Is_NCDF3_File, Open_Mapped_NCDF_File, Check_NCDF3_File_Size
+from .packed_strings import Use_Packed_Values, Get_Variable_Packing
+from .run_log import LOGGER
+#
+#
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#  LIST OF PYTHON FUNCTIONS:
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#  ==> Open_NCDF_File(nc_filename)
+#	--> nc_filename:String [NAME.nc or NAME.nc.gz], Output: netCDF4 Dataset
+#	    [Mapped_NCDF_File with SCATSAT_NCDF_MMAP=1]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Read_Swath_Variables(fileobj, ncdf_reader, swath_names)
+#	--> fileobj:netCDF4 Dataset, Output: Dictionary of swath name : Masked Array
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_Swath_Variables(fileobj, ncdf_reader, swath_names)
+#	--> fileobj:netCDF4 Dataset, Output: Dictionary of swath name : netCDF4 Variable
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Read_Swath_Rows(fileobj, ncdf_reader, swath_names, first_row, end_row)
+#	--> first_row, end_row:Integer, Output: Dictionary of swath name : Masked Array
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Read_Swath_Slice(fileobj, ncdf_reader, swath_names, row_slice)
+#	--> row_slice:slice [of scan rows], Output: Dictionary of swath name : Masked Array
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Read_Time_Units(fileobj, ncdf_reader)
+#	--> fileobj:netCDF4 Dataset, Output: String [the -units- of -time-]
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#
+#----------------------------------------------------------------
+# KNMI level 2B files  [oscat_*.nc, rapid_*.nc]
+#----------------------------------------------------------------
+#
+KNMI_NCDF_VARIABLES={'wind_speed':'wind_speed',
+                     'wind_dir':'wind_dir',
+                     'lat':'lat',
+                     'lon':'lon',
+                     'time':'time',
+                     'wvc_index':'wvc_index',
+                     'model_speed':'model_speed',
+                     'model_dir':'model_dir',
+                     'ice_prob':'ice_prob',
+                     'ice_age':'ice_age',
+                     'wvc_quality_flag':'wvc_quality_flag',
+                     'bs_distance':'bs_distance'}
+#
+#----------------------------------------------------------------
+# JPL level 2B files  [rs_l2b_v1_*.nc]
+#   The NCEP nudge winds stand in for the KNMI model winds and the
+#   JPL -flags- for the KNMI -wvc_quality_flag-.
+#----------------------------------------------------------------
+#
+JPL_NCDF_VARIABLES={'wind_speed':'retrieved_wind_speed',
+                    'wind_dir':'retrieved_wind_direction',
+                    'lat':'lat',
+                    'lon':'lon',
+                    'time':'time',
+                    'model_speed':'nudge_wind_speed',
+                    'model_dir':'nudge_wind_direction',
+                    'wvc_quality_flag':'flags',
+                    'rain_impact':'rain_impact',
+                    'eflags':'eflags',
+                    'wind_speed_uncorrected':'retrieved_wind_speed_uncorrected',
+                    'cross_track_wind_speed_bias':'cross_track_wind_speed_bias',
+                    'atmospheric_speed_bias':'atmospheric_speed_bias',
+                    'num_ambiguities':'num_ambiguities',
+                    'wind_obj':'wind_obj',
+                    'ambiguity_speed':'ambiguity_speed',
+                    'ambiguity_direction':'ambiguity_direction',
+                    'ambiguity_obj':'ambiguity_obj',
+                    'number_in_fore':'number_in_fore',
+                    'number_in_aft':'number_in_aft',
+                    'number_out_fore':'number_out_fore',
+                    'number_out_aft':'number_out_aft'}
+#
+NCDF_READERS={'KNMI':KNMI_NCDF_VARIABLES,
+              'JPL':JPL_NCDF_VARIABLES}
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Open_NCDF_File
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Open_NCDF_File(nc_filename):
+    #
+    # Opens -nc_filename- for reading.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  A gzipped file [NAME.nc.gz] is decompressed into memory and the
+    #  Dataset is opened from there [netCDF4 memory=], so nothing is
+    #  written to the inbox. A burst of .nc.gz files is then converted
+    #  one at a time, instead of all of them being gunzipped first.
+    #  SCATSAT_NCDF_MMAP=1 maps a netCDF3 file [the KNMI files] with
+    #  scipy, and reads a .nc.gz one from memory the same way. A netCDF4
+    #  file [JPL] is still opened with netCDF4.
+    #  A netCDF3 file shorter than its header says [a copy cut short] raises
+    #  a ValueError [Check_NCDF3_File_Size], since netCDF4 would give its
+    #  missing rows as fill and the writers would publish them.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    use_mmap=Use_Mapped_NCDF_Reader()
+    #
+    if nc_filename.endswith('.gz'):
+        with GZIP.open(nc_filename, "rb") as gz_obj:
+            nc_bytes=gz_obj.read()
+            #
+        #
+        if Is_NCDF3_File(nc_bytes[:4]):
+            Check_NCDF3_File_Size(nc_filename, IO.BytesIO(nc_bytes), len(nc_bytes))
+            #
+        #
+        if use_mmap and Is_NCDF3_File(nc_bytes[:4]):
+            try:
+                return( Open_Mapped_NCDF_File(nc_filename[:-len('.gz')], nc_bytes))
+            except (TypeError, ValueError) as mmap_error:
+                LOGGER.warning("SCATSAT_NCDF_MMAP: %s not read by scipy [%s], opened with netCDF4", nc_filename, mmap_error)
+                #
+            #
+        #
+        return( NCF.Dataset(nc_filename[:-len('.gz')], mode='r', memory=nc_bytes))
+        #
+    #
+    with open(nc_filename, "rb") as nc_obj:
+        nc_magic=nc_obj.read(4)
+        #
+        if Is_NCDF3_File(nc_magic):
+            nc_obj.seek(0)
+            Check_NCDF3_File_Size(nc_filename, nc_obj, OS.fstat(nc_obj.fileno()).st_size)
+            #
+        #
+    #
+    if use_mmap:
+        if not Is_NCDF3_File(nc_magic):
+            LOGGER.debug("SCATSAT_NCDF_MMAP: %s is not a netCDF3 file, opened with netCDF4", nc_filename)
+        else:
+            try:
+                return( Open_Mapped_NCDF_File(nc_filename))
+            except (TypeError, ValueError) as mmap_error:
+                LOGGER.warning("SCATSAT_NCDF_MMAP: %s not read by scipy [%s], opened with netCDF4", nc_filename, mmap_error)
+                #
+            #
+        #
+    #
+    return( NCF.Dataset(nc_filename, mode='r'))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Open_NCDF_File FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Read_Swath_Variables
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Read_Swath_Variables(fileobj, ncdf_reader, swath_names):
+    #
+    # Reads the variables -swath_names- of -ncdf_reader- [KNMI_NCDF_VARIABLES
+    # or JPL_NCDF_VARIABLES] from the open NETCDF file -fileobj-.
+    # Returns a dictionary of swath name : masked array, e.g.
+    #     swath['wind_speed'] is -wind_speed- in a KNMI file and
+    #     -retrieved_wind_speed- in a JPL file.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  -swath_names- is normally WRITER_SWATH_VARIABLES[writer name], the
+    #  variables the record writer uses. Nothing else is read from the file
+    #  [the 3-D ambiguity arrays of a JPL file are never touched], and each
+    #  variable is read in one piece.
+    #  With SCATSAT_PACKED_VALUES=1 the packed ones are raw integers, see
+    #  -Read_Swath_Slice- .
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    return( Read_Swath_Slice(fileobj, ncdf_reader, swath_names, slice(None)))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Read_Swath_Variables FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Swath_Variables
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Swath_Variables(fileobj, ncdf_reader, swath_names):
+    #
+    # Same dictionary as -Read_Swath_Variables-, but of the netCDF4 Variables
+    # themselves: nothing is read from the file. Their shape is in the file
+    # header, and -Read_Swath_Rows- reads them a block of rows at a time.
+    #
+    return( dict((swath_name, fileobj.variables[ncdf_reader[swath_name]]) for swath_name in swath_names))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Swath_Variables FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Read_Swath_Rows
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Read_Swath_Rows(fileobj, ncdf_reader, swath_names, first_row, end_row):
+    #
+    # Same as -Read_Swath_Variables-, for the scan rows first_row to
+    # end_row-1 only [the first dimension of each variable]. The same
+    # scaling and masking is applied to the rows as to the whole variable.
+    #
+    return( Read_Swath_Slice(fileobj, ncdf_reader, swath_names, slice(first_row, end_row)))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Read_Swath_Rows FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Read_Swath_Slice
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Read_Swath_Slice(fileobj, ncdf_reader, swath_names, row_slice):
+    #
+    # The read of -Read_Swath_Variables- [slice(None)] and -Read_Swath_Rows-
+    # [slice(first_row, end_row)].
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  With SCATSAT_PACKED_VALUES=1 a packed variable [Get_Variable_Packing]
+    #  is read with auto scaling off: the raw integers [int16, int32], masked
+    #  the same as the unpacked read. Its (scale_factor, add_offset) goes in
+    #  swath['packing'], which the record writers hand to -Get_Field_Strings-.
+    #  Unpack_Swath_Values gives the unpacked array back.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    use_packed=Use_Packed_Values()
+    #
+    swath={}
+    packing={}
+    #
+    for swath_name in swath_names:
+        #
+        ncdf_variable=fileobj.variables[ncdf_reader[swath_name]]
+        #
+        if use_packed:
+            variable_packing=Get_Variable_Packing(ncdf_variable)
+        else:
+            variable_packing=None
+            #
+        #
+        if variable_packing is None:
+            swath[swath_name]=ncdf_variable[row_slice]
+        else:
+            ncdf_variable.set_auto_scale(False)
+            try:
+                swath[swath_name]=ncdf_variable[row_slice]
+            finally:
+                ncdf_variable.set_auto_scale(True)
+                #
+            #
+            packing[swath_name]=variable_packing
+            #
+        #
+    #
+    if use_packed:
+        swath['packing']=packing
+        #
+    #
+    return( swath)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Read_Swath_Slice FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Read_Time_Units
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Read_Time_Units(fileobj, ncdf_reader):
+    #
+    # The -units- attribute of the -time- variable of -ncdf_reader- , e.g.
+    # 'seconds since 1990-01-01 00:00:00' [KNMI] or 'seconds since 1999-1-1
+    # 0:0:0' [JPL]. An empty string when the variable has no units.
+    #
+    return( getattr(fileobj.variables[ncdf_reader['time']], 'units', ''))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Read_Time_Units FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
@@ -0,0 +1,584 @@
+# -*- coding: utf-8 -*-
+#==-FNMOC/N38DI PYTHON MODULE DEFINITION-===========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_core/packed_strings.py
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  MODULE OVERVIEW:
+#	(1) Packed values: the KNMI variables are stored as scaled integers
+#	    [lat, lon: int32 times 1.0e-5; wind_speed, model_speed: int16 times
+#	    0.01; wind_dir, model_dir: int16 times 0.1]. With
+#	    SCATSAT_PACKED_VALUES=1 they are read as those raw integers
+#	    [auto scaling off, masking on] instead of float64 arrays, 2 to 4
+#	    times less memory, and the record fields are made from them here.
+#	(2) The record fields are the same, character for character, as the
+#	    ones the writers make from the unpacked values:
+#	        lat, lon [int32, 1.0e-5]   digits by integer arithmetic. The few
+#	                                   cells whose text only the float value
+#	                                   gives [a repr in exponent form, a '%.3f'
+#	                                   half way tie] are formatted from it.
+#	        int16 and int8 fields      a table of the field for every raw
+#	                                   value, made once by the writer's own
+#	                                   field function from the unpacked value,
+#	                                   then looked up by the raw integer.
+#	    A field packed any other way is unpacked and formatted as before.
+#	(3) -Unpack_Values- gives back the array netCDF4 returns [the masked
+#	    cells keep their raw value], for the statistics the converters print.
+#
+# Programmer: Mr. Paul McCrone     02 February  2015 --Original Build for NASA RAPIDSCAT----
+#                                  13 September 2017 --New modified build for ISRO ScatSat--
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 First version.
+#========================================================================================
+#
+import os as OS
+import numpy as N
+#
+from .wind_strings import Slice_Value_Strings, Get_Digit_Strings
+#
+#
+#----------------------------------------------------------------
+# The scale factor of the KNMI lat and lon [int32], the one the integer
+# arithmetic of the lat and lon fields is written for.
+#----------------------------------------------------------------
+#
+PACKED_DEGREES_SCALE=1.0e-5
+#
+#----------------------------------------------------------------
+# The field tables, by (field function, its arguments, raw type,
+# scale_factor, add_offset). Made on first use, kept for the run.
+#----------------------------------------------------------------
+#
+PACKED_STRING_TABLES={}
+#
+#
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#  LIST OF PYTHON FUNCTIONS:
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#  ==> Use_Packed_Values()
+#	--> Output: Boolean [SCATSAT_PACKED_VALUES=1]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_Variable_Packing(ncdf_variable)
+#	--> ncdf_variable:netCDF4 Variable, Output: (scale_factor, add_offset) or None
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Unpack_Values(data_array, field_packing)
+#	--> data_array:raw Masked Array, Output: Masked Array [as netCDF4 unpacks it]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Unpack_Swath_Values(swath, swath_name)
+#	--> swath:Dictionary of Arrays, Output: Masked Array
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_Packed_Cell_Values(data_array, keep)
+#	--> keep:Integer Array [flat cells], Output: (Integer Array, Boolean Array)
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Is_Packed_Degrees(data_array, field_packing)
+#	--> Output: Boolean [int32 times PACKED_DEGREES_SCALE]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_Packed_String_Table(raw_type, field_packing, field_function, field_args)
+#	--> raw_type:numpy dtype [int8, int16], Output: (String Array, String)
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_Field_Strings(data_array, keep, field_packing, field_function,
+#                        field_args=(), packed_function=None)
+#	--> Output: String Array [one record field per cell of -keep-]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_Fixed_Point_Strings(int_values, negative, num_decimals, num_chars)
+#	--> int_values:Integer Array [the value times 10**num_decimals], Output: String Array
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_Packed_QSCAT_Latitude_Strings(datalat, keep)
+#  ==> Get_Packed_QSCAT_Longitude_Strings(datalon, keep)
+#  ==> Get_Packed_SATFOCUS_Latitude_Strings(datalat, keep, wuscr)
+#  ==> Get_Packed_SATFOCUS_Longitude_Strings(datalon, keep, wuscr)
+#	--> Raw int32 Arrays, Output: (String Array, cells left to the float value)
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Use_Packed_Values
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Use_Packed_Values():
+    #
+    # True when SCATSAT_PACKED_VALUES=1 [the scaled integer variables are
+    # read and formatted as raw integers].
+    #
+    return( OS.environ.get('SCATSAT_PACKED_VALUES', '') == '1')
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Use_Packed_Values FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Variable_Packing
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Variable_Packing(ncdf_variable):
+    #
+    # (scale_factor, add_offset) of an integer variable that has either
+    # attribute [None for the one it does not have]. None for a variable
+    # that is not packed [time, wvc_quality_flag, the float JPL variables].
+    #
+    if ncdf_variable.dtype.kind != 'i':
+        return( None)
+        #
+    #
+    scale_factor=getattr(ncdf_variable, 'scale_factor', None)
+    add_offset=getattr(ncdf_variable, 'add_offset', None)
+    #
+    if scale_factor is None and add_offset is None:
+        return( None)
+        #
+    #
+    return( (scale_factor, add_offset))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Variable_Packing FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Unpack_Values
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Unpack_Values(data_array, field_packing):
+    #
+    # The raw masked array times scale_factor, plus add_offset: the same
+    # operations on the same masked array as netCDF4 [and the mapped reader]
+    # make, so the values are the ones an unpacked read gives.
+    #
+    data_array=N.ma.asarray(data_array)
+    #
+    if field_packing is None:
+        return( data_array)
+        #
+    #
+    scale_factor,add_offset=field_packing
+    #
+    if scale_factor is not None:
+        data_array=data_array*scale_factor
+        #
+    if add_offset is not None:
+        data_array=data_array+add_offset
+        #
+    #
+    return( data_array)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Unpack_Values FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Unpack_Swath_Values
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Unpack_Swath_Values(swath, swath_name):
+    #
+    # swath[swath_name] as netCDF4 would have read it: unpacked when it is
+    # in swath['packing'], as it is otherwise.
+    #
+    return( Unpack_Values(swath[swath_name], swath.get('packing', {}).get(swath_name)))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Unpack_Swath_Values FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Packed_Cell_Values
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Packed_Cell_Values(data_array, keep):
+    #
+    # The raw value [as int64] and the mask of the cells -keep- of the flat
+    # swath. Same as -Get_Cell_Values- , without the cast to float.
+    #
+    data_array=N.ma.asarray(data_array)
+    #
+    cell_mask=N.ma.getmaskarray(data_array).ravel()[keep]
+    cell_value=N.ma.getdata(data_array).ravel()[keep].astype(N.int64)
+    #
+    return( cell_value, cell_mask)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Packed_Cell_Values FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Is_Packed_Degrees
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Is_Packed_Degrees(data_array, field_packing):
+    #
+    # True for an int32 field times PACKED_DEGREES_SCALE with no add_offset
+    # [the KNMI lat and lon], the packing the integer lat and lon fields
+    # below are written for.
+    #
+    scale_factor,add_offset=field_packing
+    #
+    if N.ma.asarray(data_array).dtype != N.int32 or scale_factor is None:
+        return( False)
+        #
+    #
+    return( float(scale_factor) == PACKED_DEGREES_SCALE and (add_offset is None or float(add_offset) == 0.0))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Is_Packed_Degrees FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Packed_String_Table
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Packed_String_Table(raw_type, field_packing, field_function, field_args):
+    #
+    # The record field of every raw value of -raw_type- [int8: 256, int16:
+    # 65536 values], made by -field_function- from the unpacked values, and
+    # the field of a masked cell. Kept in PACKED_STRING_TABLES, so a run makes
+    # each table once.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  The table is the float path itself, run once over the whole raw range,
+    #  so a field looked up in it is the one the unpacked value gives.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    table_key=(field_function.__name__, field_args, N.dtype(raw_type).str, repr(field_packing))
+    #
+    if table_key not in PACKED_STRING_TABLES:
+        raw_info=N.iinfo(raw_type)
+        raw_values=N.arange(raw_info.min, raw_info.max+1).astype(raw_type)
+        #
+        unpacked_values=Unpack_Values(N.ma.masked_array(raw_values), field_packing)
+        masked_value=Unpack_Values(N.ma.masked_array(raw_values[:1], mask=[True]), field_packing)
+        #
+        field_table=field_function(unpacked_values, N.arange(raw_values.size), *field_args)
+        masked_field=field_function(masked_value, N.arange(1), *field_args)[0]
+        #
+        PACKED_STRING_TABLES[table_key]=(field_table, masked_field)
+        #
+    #
+    return( PACKED_STRING_TABLES[table_key])
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Packed_String_Table FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Field_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Field_Strings(data_array, keep, field_packing, field_function, field_args=(), packed_function=None):
+    #
+    # One record field for the cells -keep- of the flat swath.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  field_function(data_array, keep, *field_args) is the writer's field
+    #  function for an unpacked array. -field_packing- is None for an unpacked
+    #  array, which is then handed to it as it is. A packed one is made:
+    #     by -packed_function- [same arguments], for an int32 field times
+    #        PACKED_DEGREES_SCALE. It returns the fields and the cells it
+    #        leaves to the float value, which field_function formats from
+    #        the unpacked value of those cells only,
+    #     by a look up in the table of -Get_Packed_String_Table- , for an
+    #        int8 or int16 field,
+    #     otherwise by field_function, from the unpacked array.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    if field_packing is None:
+        return( field_function(data_array, keep, *field_args))
+        #
+    #
+    raw_type=N.ma.asarray(data_array).dtype
+    #
+    if packed_function is not None and Is_Packed_Degrees(data_array, field_packing):
+        #
+        field_strings, float_cells=packed_function(data_array, keep, *field_args)
+        #
+        if float_cells.size > 0:
+            cell_value, cell_mask=Get_Packed_Cell_Values(data_array, keep[float_cells])
+            float_value=Unpack_Values(N.ma.masked_array(cell_value.astype(raw_type), mask=cell_mask), field_packing)
+            float_strings=field_function(float_value, N.arange(float_cells.size), *field_args)
+            #
+            field_strings=field_strings.astype('U%d' % (max(field_strings.dtype.itemsize, float_strings.dtype.itemsize)//4))
+            field_strings[float_cells]=float_strings
+            #
+        #
+        return( field_strings)
+        #
+    #
+    if raw_type.kind == 'i' and raw_type.itemsize <= 2:
+        #
+        field_table, masked_field=Get_Packed_String_Table(raw_type, field_packing, field_function, field_args)
+        #
+        cell_value, cell_mask=Get_Packed_Cell_Values(data_array, keep)
+        #
+        return( N.where(cell_mask, masked_field, field_table[cell_value-N.iinfo(raw_type).min]))
+        #
+    #
+    return( field_function(Unpack_Values(data_array, field_packing), keep, *field_args))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Field_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Fixed_Point_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Fixed_Point_Strings(int_values, negative, num_decimals, num_chars):
+    #
+    # The column version of  '%<num_chars>.<num_decimals>f'  for values
+    # held as whole numbers of 10**-num_decimals [-int_values- , not
+    # negative], with a '-' where -negative- is True [also for a value that
+    # rounded to 0, as '%.3f' % -0.0001 gives '-0.000'].
+    # Built directly into a character buffer, right justified. The value
+    # must fit in -num_chars- [it is not widened as '%f' would].
+    #
+    int_values=N.asarray(int_values, dtype=N.int64).ravel()
+    negative=N.asarray(negative, dtype=bool).ravel()
+    #
+    int_part=int_values//(10**num_decimals)
+    #
+    char_codes=N.full((int_values.size, num_chars), 32, dtype=N.uint32)
+    #
+    for k in range(num_decimals):
+        char_codes[:, num_chars-1-k]=48+(int_values//(10**k))%10
+        #
+    #
+    char_codes[:, num_chars-1-num_decimals]=46
+    #
+    # The whole part: its digits from the units up, then the sign.
+    #
+    remaining=int_part.copy()
+    sign_placed=~negative
+    #
+    for k in range(num_chars-1-num_decimals-1, -1, -1):
+        #
+        is_digit=(remaining > 0) | (k == num_chars-1-num_decimals-1)
+        char_codes[:, k]=N.where(is_digit, 48+remaining%10, N.where(sign_placed, 32, 45))
+        sign_placed|=~is_digit
+        remaining//=10
+        #
+    #
+    return( char_codes.view('U%d' % num_chars).ravel())
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Fixed_Point_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Packed_QSCAT_Latitude_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Packed_QSCAT_Latitude_Strings(datalat, keep):
+    #
+    # The FGGE qscat latitude [times 100] from the raw latitude [times 1.0e5]:
+    # the digits are |raw|//1000, and the ladder of -Get_QSCAT_Latitude_Strings-
+    # is taken on the raw values [89.9 is 8990000, 10.0 is 1000000].
+    #     + 0.0 to 10.0    '+ ddd'        - 0.0 to -10.0    '- ddd'
+    #     + 10.0 to 90.0   ' dddd'        -10.0 to -89.9    '-dddd'
+    #                                     -89.9 to -90.0    ' -ddd' [first 3]
+    #                                     and -10.0 itself  [no branch of the
+    #                                                       ladder takes it]
+    #     90 or more       '  -99'        masked            ' --'
+    # No cell is left to the float value.
+    #
+    MINUS99="-99"
+    #
+    lat_raw, lat_mask=Get_Packed_Cell_Values(datalat, keep)
+    #
+    lat_x100d=Get_Digit_Strings(N.minimum(N.abs(lat_raw)//1000, 9999), 4)
+    #
+    STR_LAT=N.select(
+        [lat_mask,
+         (lat_raw >= 9000000) | (lat_raw <= -9000000),
+         (lat_raw >= 0) & (lat_raw < 1000000),
+         lat_raw >= 1000000,
+         lat_raw > -1000000,
+         (lat_raw < -1000000) & (lat_raw >= -8990000)],
+        [' --',
+         '  '+MINUS99,
+         N.char.add('+ ', Slice_Value_Strings(lat_x100d, 1, 4)),
+         N.char.add(' ', lat_x100d),
+         N.char.add('- ', Slice_Value_Strings(lat_x100d, 1, 4)),
+         N.char.add('-', lat_x100d)],
+        N.char.add(' -', Slice_Value_Strings(lat_x100d, 0, 3)))
+    #
+    return( STR_LAT, N.zeros(0, dtype=N.int64))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Packed_QSCAT_Latitude_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Packed_QSCAT_Longitude_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Packed_QSCAT_Longitude_Strings(datalon, keep):
+    #
+    # The FGGE qscat longitude [times 100] from the raw longitude [times
+    # 1.0e5], as -Get_QSCAT_Longitude_Strings- :
+    #     0.01 to 10.0      '+dddd'     0.0                   '00000'
+    #     10.0 to 100.0     ' dddd'     negative, 360 or more '  -99'
+    #     100.0 to 360.0    'ddddd'     masked                '--'
+    # Below 0.01 [raw 1 to 999] the field is the repr of the float value
+    # [e.g. '0.001'], so those cells are left to it.
+    #
+    MINUS99="-99"
+    #
+    lon_raw, lon_mask=Get_Packed_Cell_Values(datalon, keep)
+    #
+    lon_x100=N.clip(lon_raw//1000, 0, 99999)
+    lon_x100d=Get_Digit_Strings(lon_x100, 5)
+    #
+    STR_LON=N.select(
+        [lon_mask,
+         (lon_raw < 0) | (lon_raw >= 36000000),
+         lon_raw == 0,
+         lon_x100 < 1000,
+         lon_x100 < 10000],
+        ['--',
+         '  '+MINUS99,
+         '00000',
+         N.char.add('+', Slice_Value_Strings(lon_x100d, 1, 5)),
+         N.char.add(' ', Slice_Value_Strings(lon_x100d, 1, 5))],
+        lon_x100d)
+    #
+    return( STR_LON, N.flatnonzero(~lon_mask & (lon_raw > 0) & (lon_raw < 1000)))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Packed_QSCAT_Longitude_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Packed_SATFOCUS_Latitude_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Packed_SATFOCUS_Latitude_Strings(datalat, keep, wuscr):
+    #
+    # The SATFOCUS latitude [six characters] from the raw latitude [times
+    # 1.0e5]. -Get_SATFOCUS_Latitude_Strings- writes the repr of the value
+    # after one or two -wuscr- and cuts it to six characters, i.e.
+    #     wuscr wuscr d.ddd / wuscr dd.dd / wuscr -d.dd / -dd.dd
+    # which is the sign, |raw|//100000, '.' and the 5 digits of |raw|%100000
+    # cut the same way. Between 89.9 and 90 [either sign], and at -10.0
+    # itself, the repr is not padded and its last digits show [89.91 may
+    # come out as 89.910, the product being 89.91000000000001], and below
+    # 1.0e-4 [raw -9 to 9, not 0] it is in exponent form ['5e-05'], so
+    # those cells are left to the float value.
+    #
+    MINUS99="-99"
+    #
+    dwuscr=wuscr+wuscr
+    #
+    lat_raw, lat_mask=Get_Packed_Cell_Values(datalat, keep)
+    #
+    lat_abs=N.minimum(N.abs(lat_raw), 9999999)
+    lat_x1d=N.char.add(N.char.add(N.where(lat_raw < 0, '-', ''), (lat_abs//100000).astype('U2')), '.')
+    lat_frac=Get_Digit_Strings(lat_abs%100000, 5)
+    #
+    lat_x1c=N.char.add(lat_x1d, lat_frac)
+    #
+    STR_LAT=N.select(
+        [lat_mask,
+         (lat_raw >= 9000000) | (lat_raw <= -9000000),
+         (lat_raw >= 0) & (lat_raw < 1000000),
+         (lat_raw >= 0) & (lat_raw < 8990000),
+         (lat_raw < 0) & (lat_raw > -1000000),
+         (lat_raw < -1000000) & (lat_raw >= -8990000)],
+        ['--',
+         MINUS99,
+         N.char.add(dwuscr, lat_x1c),
+         N.char.add(wuscr, lat_x1c),
+         N.char.add(wuscr, lat_x1c),
+         lat_x1c],
+        '')
+    #
+    STR_LAT=Slice_Value_Strings(N.char.ljust(STR_LAT, 6, wuscr), 0, 6)
+    #
+    float_cells=~lat_mask & ((N.abs(lat_raw) >= 8990000) & (N.abs(lat_raw) < 9000000) | (lat_raw == -1000000) | (lat_raw != 0) & (N.abs(lat_raw) < 10))
+    #
+    return( STR_LAT, N.flatnonzero(float_cells))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Packed_SATFOCUS_Latitude_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Packed_SATFOCUS_Longitude_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Packed_SATFOCUS_Longitude_Strings(datalon, keep, wuscr):
+    #
+    # The SATFOCUS longitude ['%8.3f' of -180 to 180] from the raw longitude
+    # [times 1.0e5]: 180 to 360 becomes raw-36000000, and the value is
+    # rounded to thousandths by integer arithmetic [(|raw|+50)//100].
+    # A raw value ending in 50 is half way between two thousandths, and
+    # '%8.3f' rounds the float value there [which may sit either side of
+    # it], so those cells are left to the float value, as is a value too
+    # wide for 8 characters. 18000000 times 1.0e-5 is 180.00000000000003,
+    # not 180.0, so a packed 180 is written -180.000 as the float path
+    # does [its wuscr+'180.000' never takes it].
+    #
+    dwuscr=wuscr+wuscr
+    #
+    lon_raw, lon_mask=Get_Packed_Cell_Values(datalon, keep)
+    #
+    lon_aa=N.where(lon_raw >= 18000000, lon_raw-36000000, lon_raw)
+    lon_x1000=(N.abs(lon_aa)+50)//100
+    #
+    STR_LON=N.select(
+        [lon_mask,
+         lon_raw >= 36000000,
+         lon_raw == 0],
+        ['     nan',
+         '-99999999',
+         dwuscr+'0.0000'],
+        Get_Fixed_Point_Strings(N.minimum(lon_x1000, 9999999), lon_aa < 0, 3, 8))
+    #
+    float_cells=~lon_mask & (lon_raw < 36000000) & ((N.abs(lon_aa)%100 == 50) | (lon_x1000 > 9999999) | ((lon_aa < 0) & (lon_x1000 > 999999)))
+    #
+    return( STR_LON, N.flatnonzero(float_cells))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Packed_SATFOCUS_Longitude_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
@@ -0,0 +1,428 @@
+# -*- coding: utf-8 -*-
+#==-FNMOC/N38DI PYTHON MODULE DEFINITION-===========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_core/pipeline.py
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  MODULE OVERVIEW:
+#	(1) One decode, many outputs: each NETCDF file is opened once, the
+#	    swath variables every writer needs are read once and the -time-
+#	    array is converted once [Decode_NCDF_Swath].
+#	(2) The decoded swath is handed to the -main- of each registered
+#	    converter [FGGE qscat, SATFOCUS, ...] in turn, as its
+#	    -decoded_swath- argument [Convert_NCDF_File_Once].
+#	(3) With SCATSAT_CHUNK_ROWS set [streaming conversion] the file is
+#	    still opened once, but nothing is read up front: each converter
+#	    reads its variables a block of rows at a time.
+#	(4) The NETCDF file is removed only after every converter made its
+#	    product [Execution Code 1 or 97]. Otherwise it stays in the inbox,
+#	    with a NAME.done.WRITER marker for each converter that did, so the
+#	    next run does not publish its product again. A file that cannot be
+#	    decoded, or is still kept after PIPELINE_MAX_TRIES runs, is kept as
+#	    FAILED_NAME, out of the way of the next run.
+#
+# Programmer: Mr. Paul McCrone     02 February  2015 --Original Build for NASA RAPIDSCAT----
+#                                  13 September 2017 --New modified build for ISRO ScatSat--
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 First version.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.1, Dated 2026-Oct-17
+#                                 Nothing is read up front when streaming
+#                                 [SCATSAT_CHUNK_ROWS].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.2, Dated 2026-Oct-17
+#                                 The cell counts start before the decode
+#                                 [Reset_Run_Counts].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.3, Dated 2026-Oct-17
+#                                 A converter that succeeded is not run again on a
+#                                 kept file [NAME.done.WRITER, Remove_Done_Markers]
+#                                 and a file that cannot be decoded is kept as
+#                                 FAILED_NAME.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.4, Dated 2026-Oct-17
+#                                 A converter that returned 97 made its product and
+#                                 is marked done too. A file still kept after
+#                                 PIPELINE_MAX_TRIES runs is kept as FAILED_NAME
+#                                 [NAME.tries, Count_Pipeline_Try,
+#                                 Keep_Failed_NCDF_File]. Remove_Done_Markers is
+#                                 now Remove_Pipeline_Markers.
+#========================================================================================
+#
+import os as OS
+import sys as SYS
+import glob as GLOB
+import time as TIME
+import traceback as TRACEBACK
+#
+from .ncdf_readers import Open_NCDF_File, Read_Swath_Variables, Get_Swath_Variables, Read_Time_Units
+from .ascii_writers import WRITER_SWATH_VARIABLES
+from .time_conversion import Get_Converted_Time_Array
+from .file_ops import Write_Text_File, Remove_File
+from .run_log import Reset_Run_Counts, Reset_Stage_Times, Start_Stage_Clock, Stop_Stage_Clock, Report_Stage_Times
+from .streaming import Get_Chunk_Rows
+#
+dadash="-------------------------------------"
+#
+# The runs a kept NETCDF file gets before it is kept as FAILED_NAME.
+#
+PIPELINE_MAX_TRIES=3
+#
+#
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#  LIST OF PYTHON FUNCTIONS:
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#  ==> Decode_NCDF_Swath(nc_filename, ncdf_reader, writer_names)
+#	--> nc_filename:String, Output: Dictionary [fileobj, swath, time_units, obs_time]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Close_Decoded_Swath(decoded_swath)
+#	--> decoded_swath:Dictionary, Output: None
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_Done_Marker_Name(nc_filename, writer_name)
+#	--> writer_name:String, Output: String [NAME.done.WRITER]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Count_Pipeline_Try(nc_filename)
+#	--> nc_filename:String, Output: Integer [runs of the file so far, NAME.tries]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Remove_Pipeline_Markers(nc_filename)
+#	--> nc_filename:String, Output: 0 on success, 1 on failure
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Keep_Failed_NCDF_File(nc_filename)
+#	--> nc_filename:String, Output: 0 on success, 97 on failure
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Convert_NCDF_File_Once(nc_filename, ncdf_reader, pipeline_writers)
+#	--> pipeline_writers:List of (writer name, main function), Output: Execution code
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Decode_NCDF_Swath
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Decode_NCDF_Swath(nc_filename, ncdf_reader, writer_names):
+    #
+    # Opens -nc_filename- [NAME.nc or NAME.nc.gz] and reads the swath
+    # variables of all the writers in -writer_names- [keys of
+    # WRITER_SWATH_VARIABLES], each variable once. The -time- array is
+    # converted once with the basis of its -units- attribute.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  The file stays open, since the converters print its header and look
+    #  up the shapes of the variables they do not read. -Close_Decoded_Swath-
+    #  closes it once the last converter is done.
+    #  The arrays are shared: the record writers only read them.
+    #  When streaming [SCATSAT_CHUNK_ROWS], -swath- holds the unread netCDF4
+    #  Variables [Get_Swath_Variables] and -obs_time- is None.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    swath_names=[]
+    #
+    for writer_name in writer_names:
+        swath_names.extend([x for x in WRITER_SWATH_VARIABLES[writer_name] if x not in swath_names])
+        #
+    #
+    Start_Stage_Clock()
+    fileobj=Open_NCDF_File(nc_filename)
+    Stop_Stage_Clock('open')
+    #
+    if Get_Chunk_Rows() > 0:
+        swath=Get_Swath_Variables(fileobj, ncdf_reader, swath_names)
+        time_units=Read_Time_Units(fileobj, ncdf_reader)
+        #
+        return( {'fileobj':fileobj, 'swath':swath, 'time_units':time_units, 'obs_time':None})
+        #
+    #
+    swath=Read_Swath_Variables(fileobj, ncdf_reader, swath_names)
+    time_units=Read_Time_Units(fileobj, ncdf_reader)
+    Stop_Stage_Clock('read')
+    #
+    obs_time=Get_Converted_Time_Array(swath['time'], time_units)
+    Stop_Stage_Clock('time')
+    #
+    return( {'fileobj':fileobj, 'swath':swath, 'time_units':time_units, 'obs_time':obs_time})
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Decode_NCDF_Swath FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Close_Decoded_Swath
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Close_Decoded_Swath(decoded_swath):
+    #
+    decoded_swath['fileobj'].close()
+    decoded_swath['swath'].clear()
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Close_Decoded_Swath FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Done_Marker_Name
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Done_Marker_Name(nc_filename, writer_name):
+    #
+    # The marker left next to a kept NETCDF file by a converter that
+    # made its product from it [NAME.nc.done.QSCAT]. It does not end with
+    # '.nc' or '.nc.gz', so it is never taken for a pending file.
+    #
+    return( nc_filename+'.done.'+writer_name)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Done_Marker_Name FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Count_Pipeline_Try
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Count_Pipeline_Try(nc_filename):
+    #
+    # Adds one to the runs of a kept NETCDF file, counted in NAME.nc.tries
+    # [a missing or unreadable count is 0], and returns the new count.
+    #
+    tries_file_name=nc_filename+'.tries'
+    number_of_tries=0
+    #
+    try:
+        with open(tries_file_name, "r") as tries_file:
+            number_of_tries=int(tries_file.read().split()[0])
+            #
+        #
+    except (OSError, IOError, ValueError, IndexError):
+        number_of_tries=0
+        #
+    #
+    number_of_tries+=1
+    Write_Text_File(tries_file_name, str(number_of_tries)+'\n')
+    #
+    return( number_of_tries)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Count_Pipeline_Try FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Remove_Pipeline_Markers
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Remove_Pipeline_Markers(nc_filename):
+    #
+    # Removes every NAME.done.WRITER marker and the NAME.tries count of
+    # -nc_filename-, once the file itself is removed or kept as FAILED_NAME,
+    # so a new delivery under the same name is converted by all the
+    # converters again.
+    #
+    remove_status=0
+    #
+    for marker_name in GLOB.glob(GLOB.escape(nc_filename)+'.done.*')+GLOB.glob(GLOB.escape(nc_filename)+'.tries'):
+        remove_status=max(remove_status, Remove_File(marker_name))
+        #
+    #
+    return( remove_status)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Remove_Pipeline_Markers FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Keep_Failed_NCDF_File
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Keep_Failed_NCDF_File(nc_filename):
+    #
+    # Keeps -nc_filename- as FAILED_NAME for examination, as
+    # -Convert_Inbox_NCDF_File- does, and removes its markers.
+    #
+    failed_nc_filename=OS.path.join(OS.path.dirname(nc_filename), 'FAILED_'+OS.path.basename(nc_filename))
+    print("---PIPELINE: keeping "+nc_filename+" as "+failed_nc_filename)
+    #
+    try:
+        OS.replace(nc_filename, failed_nc_filename)
+    except OSError as move_error:
+        print("---MOVE FAILED: "+str(move_error))
+        return( 97)
+        #
+    #
+    Remove_Pipeline_Markers(nc_filename)
+    #
+    return( 0)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Keep_Failed_NCDF_File FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Convert_NCDF_File_Once
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Convert_NCDF_File_Once(nc_filename, ncdf_reader, pipeline_writers):
+    #
+    # Converts one NETCDF file for every converter in -pipeline_writers-,
+    # a list of (writer name, main function) in the order they run. The
+    # writer name is the key of the converter's record writer in
+    # WRITER_SWATH_VARIABLES, -main- is the converter's
+    # main(pending_nc_filename, decoded_swath).
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  The file is decoded once [Decode_NCDF_Swath] and the same arrays are
+    #  given to each -main-. The cell counts [RUN_COUNTS] start before the
+    #  decode, which counts the -time- cells, and run over all the converters
+    #  of the file. Given a decoded swath, -main- neither reopens nor removes
+    #  the file. It is removed here, once all the converters made their
+    #  product, so a converter that failed can be run again on it.
+    #  A converter that returned 1, or 97 [the ASCII file was made, with
+    #  problems with the operating system, e.g. one copy target down],
+    #  leaves a NAME.done.WRITER marker [Get_Done_Marker_Name] and is
+    #  skipped when the kept file is run again, so its product is not
+    #  published twice. A file that cannot be decoded, or is kept for
+    #  PIPELINE_MAX_TRIES runs [Count_Pipeline_Try; a path problem, 90, is
+    #  not counted], is kept as FAILED_NAME [Keep_Failed_NCDF_File] instead
+    #  of being tried on every run.
+    #
+    #  Returns the execution code for the file:
+    #      1 every converter succeeded and the file is removed,
+    #     90 a converter hit a path problem,
+    #      0 the file could not be decoded [kept as FAILED_NAME], or a
+    #        converter stopped with an exception [the traceback is printed],
+    #     97 a converter [or the removal, the renaming or a marker of the
+    #        file] had a problem with the operating system [the file is
+    #        removed all the same once every converter made its product],
+    #     55 a converter did not find the file.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    writer_executions=[]
+    pending_writers=[]
+    #
+    for writer_name, main_function in pipeline_writers:
+        #
+        if OS.path.isfile(Get_Done_Marker_Name(nc_filename, writer_name)):
+            print("---PIPELINE: "+writer_name+" already succeeded on "+nc_filename+", skipped")
+            writer_executions.append(1)
+        else:
+            pending_writers.append((writer_name, main_function))
+            #
+        #
+    #
+    if len(pending_writers) > 0:
+        #
+        print(dadash+dadash)
+        print("---PIPELINE: decoding "+nc_filename+" once for "+', '.join(x[0] for x in pending_writers))
+        print(dadash+dadash)
+        #
+        Reset_Run_Counts()
+        Reset_Stage_Times()
+        #
+        try:
+            decoded_swath=Decode_NCDF_Swath(nc_filename, ncdf_reader, [x[0] for x in pending_writers])
+        except Exception:
+            TRACEBACK.print_exc(file=SYS.stdout)
+            print("---PIPELINE: could not decode "+nc_filename)
+            #
+            if Keep_Failed_NCDF_File(nc_filename) != 0:
+                return( 97)
+                #
+            #
+            return( 0)
+            #
+        #
+        Report_Stage_Times(nc_filename)
+        #
+        try:
+            for writer_name, main_function in pending_writers:
+                #
+                try:
+                    this_execution=main_function(nc_filename, decoded_swath)
+                except Exception:
+                    TRACEBACK.print_exc(file=SYS.stdout)
+                    this_execution=0
+                    #
+                #
+                if this_execution in (1, 97):
+                    #
+                    if Write_Text_File(Get_Done_Marker_Name(nc_filename, writer_name), TIME.strftime("%Y-%m-%d %H:%M:%S")+'\n') != 0:
+                        print("---PIPELINE: could not mark "+writer_name+" done on "+nc_filename)
+                        this_execution=97
+                        #
+                    #
+                #
+                writer_executions.append(this_execution)
+                #
+                print(dadash+dadash)
+                print("---PIPELINE: "+writer_name+" Execution Code "+str(this_execution)+" for "+nc_filename)
+                print(dadash+dadash)
+                #
+            #
+        finally:
+            Close_Decoded_Swath(decoded_swath)
+            #
+        #
+    #
+    if writer_executions.count(1)+writer_executions.count(97) == len(writer_executions):
+        #
+        if Remove_File(nc_filename) != 0:
+            print("---PIPELINE: could not remove "+nc_filename)
+            return( 97)
+            #
+        #
+        if Remove_Pipeline_Markers(nc_filename) != 0:
+            print("---PIPELINE: could not remove the markers of "+nc_filename)
+            return( 97)
+            #
+        #
+        print("---PIPELINE: every writer made its product, removed "+nc_filename)
+        #
+        return( max(writer_executions))
+        #
+    #
+    print("---PIPELINE: not every writer succeeded, the file is kept: "+nc_filename)
+    #
+    if 90 not in writer_executions and OS.path.isfile(nc_filename):
+        #
+        number_of_tries=Count_Pipeline_Try(nc_filename)
+        print("---PIPELINE: run "+str(number_of_tries)+" of "+str(PIPELINE_MAX_TRIES)+" for "+nc_filename)
+        #
+        if number_of_tries >= PIPELINE_MAX_TRIES and Keep_Failed_NCDF_File(nc_filename) != 0:
+            writer_executions.append(97)
+            #
+        #
+    #
+    for exec_code in (90, 0, 97, 55):
+        if exec_code in writer_executions:
+            return( exec_code)
+            #
+        #
+    #
+    return( max(writer_executions))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Convert_NCDF_File_Once FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+#==-FNMOC/N38DI PYTHON MODULE DEFINITION-===========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_core/run_log.py
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  MODULE OVERVIEW:
+#	(1) The -scatsat_core- logger [LOGGER] used by the time and string
+#	    helpers instead of print. The level comes from SCATSAT_LOG_LEVEL
+#	    [DEBUG, INFO, WARNING, ERROR; INFO when it is not set].
+#	        INFO    the wall clock banners, as before
+#	        DEBUG   the per-cell diagnostics ["num_days is....", leap year, ...]
+#	(2) Counters of the per-cell problems [RUN_COUNTS], printed once at the
+#	    end of each file instead of a line for every cell.
+#	(3) Wall clock seconds of each stage of -main- [STAGE_TIMES], printed
+#	    once at the end of each file as one key=value line:
+#	        Stage timings : file=NAME.nc validate=0.002 list=0.004 ... total=3.512
+#
+# Programmer: Mr. Paul McCrone     02 February  2015 --Original Build for NASA RAPIDSCAT----
+#                                  13 September 2017 --New modified build for ISRO ScatSat--
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 First version.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.1, Dated 2026-Oct-17
+#                                 Added the stage timers [STAGE_TIMES,
+#                                 Reset_Stage_Times, Start_Stage_Clock,
+#                                 Stop_Stage_Clock, Report_Stage_Times].
+#========================================================================================
+#
+import os as OS
+import sys as SYS
+import logging as LOGGING
+import time as TIME
+import collections as COLL
+#
+LOGGER=LOGGING.getLogger('scatsat_core')
+LOGGER.addHandler(LOGGING.NullHandler())
+#
+#----------------------------------------------------------------
+# The per-cell problems counted for each file.
+#   bad_time_cells     times that could not be converted [NaN, fill
+#                      value or out of range]; they get the current time
+#   bad_jday_cells     Julian days outside the month and date tables
+#   nan_mle_cells      MLE strings of a NaN objective ['---99', '00nan']
+#   bad_length_mle     MLE strings that were not 5 characters long
+#----------------------------------------------------------------
+#
+RUN_COUNTS={'bad_time_cells':0, 'bad_jday_cells':0, 'nan_mle_cells':0, 'bad_length_mle':0}
+#
+#----------------------------------------------------------------
+# The seconds spent in each stage of -main- for the current file, in
+# the order the stages ran. A stage timed twice is added up.
+# STAGE_CLOCK holds the perf_counter at the start of the file [run]
+# and at the start of the current stage [stage].
+#----------------------------------------------------------------
+#
+STAGE_TIMES=COLL.OrderedDict()
+STAGE_CLOCK={'run':0.0, 'stage':0.0}
+#
+#
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#  LIST OF PYTHON FUNCTIONS:
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#  ==> Setup_Run_Logging(level_name=None)
+#	--> level_name:String, Output: Integer logging level
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Count_Run_Event(event_name, count=1)
+#	--> event_name:String [a RUN_COUNTS key], Output: None
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Reset_Run_Counts()
+#	--> Output: None
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Report_Run_Counts()
+#	--> Output: None [one INFO line]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Reset_Stage_Times()
+#	--> Output: None
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Start_Stage_Clock()
+#	--> Output: None
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Stop_Stage_Clock(stage_name)
+#	--> stage_name:String, Output: Float seconds of the stage
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Report_Stage_Times(nc_filename)
+#	--> nc_filename:String, Output: None [one INFO line]
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#
+#----------------------------------------------------------------
+# A StreamHandler that always writes to the current SYS.stdout, so the
+# log lines stay in order with the print lines of -main- , and land in
+# the worker log of a backlog file [redirect_stdout in backlog.py].
+#----------------------------------------------------------------
+#
+class Stdout_Handler(LOGGING.StreamHandler):
+    #
+    @property
+    def stream(self):
+        return( SYS.stdout)
+    #
+    @stream.setter
+    def stream(self, value):
+        pass
+    #
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Setup_Run_Logging
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Setup_Run_Logging(level_name=None):
+    #
+    # Sends LOGGER to stdout [the ksh scripts keep stdout in the log file]
+    # with the bare message, the way print wrote it. -level_name- defaults to
+    # SCATSAT_LOG_LEVEL, then INFO. Calling it again only changes the level.
+    #
+    if level_name is None:
+        level_name=OS.environ.get('SCATSAT_LOG_LEVEL', 'INFO')
+        #
+    #
+    log_level=LOGGING.getLevelName(str(level_name).strip().upper())
+    #
+    if not isinstance(log_level, int):
+        print("---Unknown log level "+str(level_name)+", using INFO")
+        log_level=LOGGING.INFO
+        #
+    #
+    if not any(isinstance(handler, Stdout_Handler) for handler in LOGGER.handlers):
+        handler=Stdout_Handler()
+        handler.setFormatter(LOGGING.Formatter('%(message)s'))
+        LOGGER.addHandler(handler)
+        LOGGER.propagate=False
+        #
+    #
+    LOGGER.setLevel(log_level)
+    #
+    return( log_level)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Setup_Run_Logging FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Count_Run_Event
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Count_Run_Event(event_name, count=1):
+    #
+    RUN_COUNTS[event_name]=RUN_COUNTS.get(event_name, 0)+int(count)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Count_Run_Event FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Reset_Run_Counts
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Reset_Run_Counts():
+    #
+    for event_name in RUN_COUNTS:
+        RUN_COUNTS[event_name]=0
+        #
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Reset_Run_Counts FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Report_Run_Counts
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Report_Run_Counts():
+    #
+    LOGGER.info("Cell counts   : "+", ".join(event_name+" "+str(RUN_COUNTS[event_name])
+                                             for event_name in sorted(RUN_COUNTS)))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Report_Run_Counts FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Reset_Stage_Times
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Reset_Stage_Times():
+    #
+    # Called at the start of -main-. The total of the file is counted from here.
+    #
+    STAGE_TIMES.clear()
+    #
+    right_now=TIME.perf_counter()
+    STAGE_CLOCK['run']=right_now
+    STAGE_CLOCK['stage']=right_now
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Reset_Stage_Times FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Start_Stage_Clock
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Start_Stage_Clock():
+    #
+    # Only needed where the time since the last stage should not be
+    # counted in the next one [Stop_Stage_Clock restarts the clock].
+    #
+    STAGE_CLOCK['stage']=TIME.perf_counter()
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Start_Stage_Clock FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Stop_Stage_Clock
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Stop_Stage_Clock(stage_name):
+    #
+    # Adds the seconds since the last start [or stop] to -stage_name- and
+    # restarts the clock for the next stage.
+    #
+    right_now=TIME.perf_counter()
+    stage_seconds=right_now-STAGE_CLOCK['stage']
+    #
+    STAGE_TIMES[stage_name]=STAGE_TIMES.get(stage_name, 0.0)+stage_seconds
+    STAGE_CLOCK['stage']=right_now
+    #
+    return( stage_seconds)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Stop_Stage_Clock FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Report_Stage_Times
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Report_Stage_Times(nc_filename):
+    #
+    # One line per file, space separated key=value pairs in seconds, so
+    # the job logs can be searched with grep and split with awk:
+    #     Stage timings : file=NAME.nc validate=0.002 ... other=0.010 total=3.512
+    # -other- is the time of -main- outside the timed stages [the prints].
+    #
+    total_seconds=TIME.perf_counter()-STAGE_CLOCK['run']
+    other_seconds=total_seconds-sum(STAGE_TIMES.values())
+    #
+    stage_fields=["file="+OS.path.basename(nc_filename)]
+    stage_fields+=[stage_name+"=%.3f" % STAGE_TIMES[stage_name] for stage_name in STAGE_TIMES]
+    stage_fields+=["other=%.3f" % other_seconds, "total=%.3f" % total_seconds]
+    #
+    LOGGER.info("Stage timings : "+" ".join(stage_fields))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Report_Stage_Times FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
@@ -0,0 +1,569 @@
+# -*- coding: utf-8 -*-
+#==-FNMOC/N38DI PYTHON MODULE DEFINITION-===========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_core/scalar_writers.py
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  MODULE OVERVIEW:
+#	(1) The reference record writers: the nested i/j loops that -main- of
+#	    the converters ran before the whole swath writers of ascii_writers.py,
+#	    one WVC at a time, with the per-cell helpers
+#	        Get_Converted_Time90, Determine_Wind_SPEED, Determine_Wind_Direction.
+#	    The FNMOC ascii modifications [fnmoc_adjust] are made on each record
+#	    the way the PERL scripts make them on the finished file.
+#	(2) Compute_MLE_STRNG_Cells, the per-cell MLE strings of a JPL
+#	    -ambiguity_obj- array [max(STR_AMBIG_OBJ) and Compute_MLE_STRNG].
+#	(3) SCALAR_ASCII_WRITERS, keyed like ASCII_WRITERS.
+#
+#	These are slow on purpose. They are only used by the regression run
+#	[scatsat_regression3.py], which checks that the fast writers give the
+#	same bytes. DO NOT "speed up" this module.
+#
+# Programmer: Mr. Paul McCrone     02 February  2015 --Original Build for NASA RAPIDSCAT----
+#                                  13 September 2017 --New modified build for ISRO ScatSat--
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 The i/j loops of the converters, kept as the reference.
+#========================================================================================
+#
+import math as MATH
+import numpy as N
+#
+from .time_conversion import Get_Converted_Time90, Get_Time_Units_Basis
+from .wind_strings import Determine_Wind_SPEED, Determine_Wind_Direction, Compute_MLE_STRNG
+#
+#
+#----------------------------------------------------------------
+# Get_Converted_Time90 is two days short of the 1990 basis time; the
+# converters always added FACTOR48 before calling it.
+#----------------------------------------------------------------
+#
+FACTOR48=2.0*24.0*60.0*60.0
+#
+TIME90_BASIS=N.datetime64('1990-01-01T00:00:00', 's')
+#
+#
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#  LIST OF PYTHON FUNCTIONS:
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#  ==> Get_Time90_Offset(time_units)
+#	--> time_units:String, Output: (Float seconds to add, Float seconds per step)
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Format_QSCAT_Records_Scalar(datatim, time_units, datalat, ..., rev_number, fnmoc_adjust)
+#	--> Whole swath arrays, Output: All FGGE qscat records as one String
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Format_SATFOCUS_Records_Scalar(datatim, time_units, datalat, ..., fnmoc_adjust)
+#	--> Whole swath arrays, Output: All SATFOCUS records as one String
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Compute_MLE_STRNG_Cells(ambig_obj)
+#	--> ambig_obj:Array [row, cell, ambiguity], Output: Nested List of Strings
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Write_QSCAT_Swath_Scalar(swath, time_units, rev_number, fnmoc_adjust)
+#  ==> Write_SATFOCUS_Swath_Scalar(swath, time_units, rev_number, fnmoc_adjust)
+#	--> swath:Dictionary of Arrays, Output: String
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Time90_Offset
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Time90_Offset(time_units):
+    #
+    # -Get_Converted_Time90- only knows the 1990 basis time. A time of
+    # another basis [the 1999 JPL files] is moved to it first:
+    #     Get_Converted_Time90(time90_offset+datatim[i,j]*step_seconds)
+    #
+    basis_time,step_seconds=Get_Time_Units_Basis(time_units)
+    #
+    time90_offset=FACTOR48+float((basis_time-TIME90_BASIS).astype(N.int64))
+    #
+    return( time90_offset, step_seconds)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Time90_Offset FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Format_QSCAT_Records_Scalar
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Format_QSCAT_Records_Scalar(datatim, time_units, datalat, datalon, datawspd, datawdir, datamdlspd, datamdldir, datawvcqfl, rev_number, fnmoc_adjust):
+    #
+    # The FGGE qscat i/j loop of -main- [scatsat_knmi_convert_rscat_ncdf_2_qscat_ASCII3.py
+    # version 3.0.3], one record at a time. The dead code of the loop
+    # [values built and never written] is left out.
+    #
+    ONE_SPACE=' '
+    STR_1_SPACE_CHAR=ONE_SPACE
+    STR_2_SPACE_CHAR=ONE_SPACE+STR_1_SPACE_CHAR
+    MINUS99="-99"
+    DBLDASH="--"
+    DASH="-"
+    ZZERO="0"
+    #
+    time90_offset,step_seconds=Get_Time90_Offset(time_units)
+    #
+    shape_wspd=N.shape(datawspd)
+    #
+    STR_ALL_LINES=[]
+    #
+    for i in range(shape_wspd[0]):
+        for j in range(shape_wspd[1]):
+            #
+            #---TIME: MMDDhhmm
+            #
+            STR_TIME_INPUT=time90_offset+datatim[i,j]*step_seconds
+            STR_TIME=Get_Converted_Time90(STR_TIME_INPUT)
+            NEW_STR_TIME=STR_TIME[4:6]+STR_TIME[6:8]+STR_TIME[9:11]+STR_TIME[11:13]
+            #
+            #---LATITUDE
+            #
+            STR_LAT_A=datalat[i,j]
+            STR_LAT_X100C=str(STR_LAT_A*100.0)
+            #
+            if (STR_LAT_A >= 0.0) and (STR_LAT_A < 0.1):
+                STR_LAT=STR_2_SPACE_CHAR+"00"+STR_LAT_X100C[0:1]
+            elif (STR_LAT_A > -0.1) and (STR_LAT_A < 0.0):
+                STR_LAT=DASH+STR_1_SPACE_CHAR+(ZZERO*2)+STR_LAT_X100C[1:2]
+            elif (STR_LAT_A >= 0.1) and (STR_LAT_A < 1.0):
+                STR_LAT=STR_1_SPACE_CHAR+"0"+STR_LAT_X100C[0:2]
+            elif (STR_LAT_A >= 1.0) and (STR_LAT_A < 10.0):
+                STR_LAT="  "+STR_LAT_X100C[0:3]
+            elif (STR_LAT_A >= 10.0) and (STR_LAT_A < 89.9):
+                STR_LAT=STR_1_SPACE_CHAR+STR_LAT_X100C[0:4]
+            elif (STR_LAT_A >= -89.9) and (STR_LAT_A < -10.0):
+                STR_LAT=DASH+STR_LAT_X100C[1:5]
+            elif (STR_LAT_A > -10.0) and (STR_LAT_A <= -1.0):
+                STR_LAT=DASH+STR_1_SPACE_CHAR+STR_LAT_X100C[1:4]
+            elif (STR_LAT_A > -1.0) and (STR_LAT_A <= -0.1):
+                STR_LAT=DASH+STR_1_SPACE_CHAR+ZZERO+STR_LAT_X100C[1:3]
+            elif (STR_LAT_A >= -0.01) and (STR_LAT_A <= 0.01):
+                STR_LAT=STR_1_SPACE_CHAR+(ZZERO*4)
+            elif STR_LAT_A <= -90.0:
+                STR_LAT=STR_2_SPACE_CHAR+MINUS99
+            elif STR_LAT_A >= 90.0:
+                STR_LAT=STR_2_SPACE_CHAR+MINUS99
+            else:
+                STR_LAT=STR_1_SPACE_CHAR+STR_LAT_X100C[0:4]
+                #
+            #
+            if (STR_LAT_A >= 1.0) and (STR_LAT_A < 10.0):
+                STR_LAT='+ '+STR_LAT_X100C[0:3]
+            if (STR_LAT_A >= 0.1) and (STR_LAT_A < 1.0):
+                STR_LAT='+ 0'+STR_LAT_X100C[0:2]
+            if (STR_LAT_A >= 0.0) and (STR_LAT_A < 0.1):
+                STR_LAT='+ 00'+STR_LAT_X100C[0:1]
+                #
+            #
+            #---LONGITUDE
+            #
+            STR_LON_A=datalon[i,j]
+            STR_LON_X100C=str(STR_LON_A*100.0)
+            STR_LON=STR_LON_X100C[0:5]
+            #
+            if (STR_LON_A >= 100.0) and (STR_LON_A < 360.0):
+                STR_LON=STR_LON_X100C[0:5]
+            if (STR_LON_A >= 10.0) and (STR_LON_A < 100.0):
+                STR_LON=STR_1_SPACE_CHAR+STR_LON_X100C[0:4]
+            if (STR_LON_A >= 1.0) and (STR_LON_A < 10.0):
+                STR_LON='+0'+STR_LON_X100C[0:3]
+            if (STR_LON_A >= 0.1) and (STR_LON_A < 1.0):
+                STR_LON='+00'+STR_LON_X100C[0:2]
+            if (STR_LON_A >= 0.01) and (STR_LON_A < 0.1):
+                STR_LON='+000'+STR_LON_X100C[0:1]
+            if STR_LON_A < 0.0:
+                STR_LON=STR_2_SPACE_CHAR+MINUS99
+            if STR_LON_A == 0.0:
+                STR_LON='00000'
+            if STR_LON_A >= 360.0:
+                STR_LON=STR_2_SPACE_CHAR+MINUS99
+                #
+            #
+            #---WIND SPEED
+            #
+            STR_WSP_A=datawspd[i,j]
+            STR_WSP_B=str(datawspd[i,j])
+            STR_WSP_X10C=str(STR_WSP_A*10.0)
+            #
+            if STR_WSP_A < 0.0:
+                STR_WSP=MINUS99
+            elif STR_WSP_B == DBLDASH:
+                STR_WSP=MINUS99
+            else:
+                STR_WSP=STR_WSP_X10C[0:3]
+                #
+            #
+            if (STR_WSP_A >= 10.0) and (STR_WSP_A < 100.0):
+                STR_WSP=STR_WSP_X10C[0:3]
+            if (STR_WSP_A >= 1.0) and (STR_WSP_A < 10.0):
+                STR_WSP='+'+STR_WSP_X10C[0:2]
+            if (STR_WSP_A >= 0.1) and (STR_WSP_A < 1.0):
+                STR_WSP='+0'+STR_WSP_X10C[0:1]
+            if (STR_WSP_A >= 0.0) and (STR_WSP_A < 0.1):
+                STR_WSP='000'
+                #
+            #
+            #---WIND DIRECTION [oceanographic, turned by 180]
+            #
+            STR_WDR_A=datawdir[i,j]
+            STR_WDR_TEMP=STR_WDR_A+180.0
+            if STR_WDR_A >= 180.0:
+                STR_WDR_TEMP=STR_WDR_A-180.0
+                #
+            STR_WDR_A=STR_WDR_TEMP
+            STR_WDR_B=str(datawdir[i,j])
+            STR_WDR_X1C=str(STR_WDR_A*1.0)
+            STR_WDR=STR_WDR_X1C[0:3]
+            #
+            if STR_WDR_A < 0.0:
+                STR_WDR=MINUS99
+            elif MATH.isnan(STR_WDR_A):
+                STR_WDR=MINUS99
+            elif STR_WDR_B == DBLDASH:
+                STR_WDR=MINUS99
+            else:
+                if (STR_WDR_A >= 10.0) and (STR_WDR_A < 100.0):
+                    STR_WDR='0'+STR_WDR_X1C[0:2]
+                if (STR_WDR_A >= 1.0) and (STR_WDR_A < 10.0):
+                    STR_WDR='00'+STR_WDR_X1C[0:1]
+                if (STR_WDR_A >= 0.1) and (STR_WDR_A < 1.0):
+                    STR_WDR='000'
+                if (STR_WDR_A >= 0.0) and (STR_WDR_A < 0.1):
+                    STR_WDR='000'
+                    #
+                #
+            #
+            #---MODEL WIND SPEED AND DIRECTION
+            #
+            STR_NCEP_WSPD=Determine_Wind_SPEED(datamdlspd[i,j])
+            STR_NCEP_WDIR=Determine_Wind_Direction(datamdldir[i,j])
+            #
+            #---REV NUMBER, ROW, CELL
+            #
+            if len(rev_number) == 5:
+                STR_REV_NUMBER='0'+rev_number
+            elif len(rev_number) == 4:
+                STR_REV_NUMBER='00'+rev_number
+            else:
+                STR_REV_NUMBER=rev_number
+                #
+            #
+            LEN_ROW_B=len(str(i))
+            LEN_CEL_B=len(str(j))
+            #
+            if LEN_ROW_B == 1:
+                STR_ROW='000'+str(i)
+            elif LEN_ROW_B == 2:
+                STR_ROW='00'+str(i)
+            elif LEN_ROW_B == 3:
+                STR_ROW='0'+str(i)
+            elif LEN_ROW_B == 4:
+                STR_ROW=str(i)
+            else:
+                STR_ROW='9999'
+                #
+            #
+            if LEN_CEL_B == 1:
+                STR_CEL='00'+str(j)
+            elif LEN_CEL_B == 2:
+                STR_CEL='0'+str(j)
+            elif LEN_CEL_B == 3:
+                STR_CEL=str(j)
+            else:
+                STR_CEL='999'
+                #
+            #
+            #---WVC QUALITY FLAGS
+            #
+            STR_FLAGS_A=datawvcqfl[i,j]
+            STR_FLAGS_B=str(STR_FLAGS_A)
+            LEN_FLAGS_B=len(STR_FLAGS_B)
+            #
+            if not MATH.isnan(STR_FLAGS_A):
+                STR_FLAGS_B=str(int(STR_FLAGS_A))
+                LEN_FLAGS_B=len(STR_FLAGS_B)
+                #
+            #
+            if LEN_FLAGS_B == 1:
+                STR_WVC_FLAGS='00000'+STR_FLAGS_B
+            elif LEN_FLAGS_B == 2:
+                STR_WVC_FLAGS='0000'+STR_FLAGS_B
+            elif LEN_FLAGS_B == 3:
+                STR_WVC_FLAGS='000'+STR_FLAGS_B
+            elif LEN_FLAGS_B == 4:
+                STR_WVC_FLAGS='00'+STR_FLAGS_B
+            elif LEN_FLAGS_B == 5:
+                STR_WVC_FLAGS='0'+STR_FLAGS_B
+            else:
+                STR_WVC_FLAGS=STR_FLAGS_B[0:6]
+                #
+            #
+            if MATH.isnan(STR_FLAGS_A):
+                STR_WVC_FLAGS='-99-99'
+                #
+            #
+            #---The record [no ambiguities in the KNMI files]
+            #
+            STR_THIS_LINE=(NEW_STR_TIME+STR_LAT+STR_LON+STR_WSP+STR_WDR+
+                           STR_NCEP_WSPD+STR_NCEP_WDIR+MINUS99+MINUS99+STR_REV_NUMBER+
+                           STR_ROW+STR_CEL+'-99-99'+STR_WVC_FLAGS+
+                           (MINUS99+MINUS99+'---99')*3+MINUS99+MINUS99+'  -99')
+            #
+            #---rscat_wind_adjust_rscat_data.pl
+            #
+            if fnmoc_adjust:
+                STR_THIS_LINE=STR_THIS_LINE.replace('+', ' ').replace('---99', '  -99', 3)
+                #
+            #
+            if STR_WDR_B != "--":
+                STR_ALL_LINES.append(STR_THIS_LINE+'\n')
+                #
+            #
+        #
+    #---END OF LOOPS
+    #
+    return( ''.join(STR_ALL_LINES))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Format_QSCAT_Records_Scalar FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Format_SATFOCUS_Records_Scalar
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Format_SATFOCUS_Records_Scalar(datatim, time_units, datalat, datalon, datawspd, datawdir, fnmoc_adjust):
+    #
+    # The SATFOCUS i/j loop of -main- [scatsat_knmi_convert_rscat_ncdf_2_satfocus3.py
+    # version 3.0.3], one record at a time, with the underscore padding
+    # the PERL script turns into spaces.
+    #
+    wuscr="_"
+    dwuscr="__"
+    MINUS99="-99"
+    DBLDASH="--"
+    NEGONE=1.0-2.0
+    CONVERT_MPS_2_KNOTS=1.943844492
+    #
+    time90_offset,step_seconds=Get_Time90_Offset(time_units)
+    #
+    shape_wspd=N.shape(datawspd)
+    #
+    STR_ALL_LINES=[]
+    #
+    for i in range(shape_wspd[0]):
+        for j in range(shape_wspd[1]):
+            #
+            #---TIME: YYYY/MM/DD_hh:mm:ss
+            #
+            STR_TIME_INPUT=time90_offset+datatim[i,j]*step_seconds
+            STR_TIME=Get_Converted_Time90(STR_TIME_INPUT)
+            NEW_STR_DATE=STR_TIME[0:4]+'/'+STR_TIME[4:6]+'/'+STR_TIME[6:8]
+            NEW_STR_TIME=NEW_STR_DATE+'_'+STR_TIME[9:11]+':'+STR_TIME[11:13]+':'+STR_TIME[14:16]
+            #
+            #---LATITUDE
+            #
+            STR_LAT_A=datalat[i,j]
+            STR_LAT_X100C=str(STR_LAT_A*1.0)
+            STR_LAT=str(datalat[i,j])
+            #
+            if (STR_LAT_A >= 0.0) and (STR_LAT_A < 0.1):
+                STR_LAT=dwuscr+STR_LAT_X100C+'0'
+            elif (STR_LAT_A > -0.1) and (STR_LAT_A < 0.0):
+                STR_LAT=wuscr+STR_LAT_X100C+'0'
+            elif (STR_LAT_A >= 0.1) and (STR_LAT_A < 1.0):
+                STR_LAT=dwuscr+STR_LAT_X100C+'0'
+            elif (STR_LAT_A >= 1.0) and (STR_LAT_A < 10.0):
+                STR_LAT=dwuscr+STR_LAT_X100C+'0'
+            elif (STR_LAT_A >= 10.0) and (STR_LAT_A < 89.9):
+                STR_LAT=wuscr+STR_LAT_X100C+'0'
+            elif (STR_LAT_A >= -89.9) and (STR_LAT_A < -10.0):
+                STR_LAT=STR_LAT_X100C[0:6]+'0'
+            elif (STR_LAT_A > -10.0) and (STR_LAT_A <= -1.0):
+                STR_LAT=wuscr+STR_LAT_X100C+'0'
+            elif (STR_LAT_A > -1.0) and (STR_LAT_A <= -0.1):
+                STR_LAT=wuscr+STR_LAT_X100C+'0'
+            elif (STR_LAT_A >= -0.01) and (STR_LAT_A <= 0.01):
+                STR_LAT=wuscr+STR_LAT_X100C+'0'
+            elif STR_LAT_A <= -90.0:
+                STR_LAT=MINUS99
+            elif STR_LAT_A >= 90.0:
+                STR_LAT=MINUS99
+            else:
+                STR_LAT=STR_LAT_X100C[0:7]
+                #
+            #
+            # Six characters: cut, or padded on the right with underscores.
+            #
+            STR_LAT=(STR_LAT+dwuscr+dwuscr+dwuscr)[0:6]
+            #
+            #---LONGITUDE [-180 to 180]
+            #
+            STR_LON_A=datalon[i,j]
+            STR_LON_AA=STR_LON_A
+            if (STR_LON_A >= 180.0):
+                STR_LON_AA=(360.0-STR_LON_A)*NEGONE
+                #
+            STR_LON='%8.3f'%STR_LON_AA
+            #
+            if STR_LON_A == 0.0:
+                STR_LON='__0.0000'
+            if STR_LON_A == 180.0:
+                STR_LON='_180.000'
+            if STR_LON_A >= 360.0:
+                STR_LON='-99999999'
+                #
+            #
+            #---WIND SPEED [knots]
+            #
+            STR_WSP_A=datawspd[i,j]*CONVERT_MPS_2_KNOTS
+            STR_WSP_B=str(datawspd[i,j]*CONVERT_MPS_2_KNOTS)
+            STR_WSP='%6.3f'%STR_WSP_A
+            #
+            if MATH.isnan(STR_WSP_A):
+                STR_WSP=MINUS99
+            if STR_WSP_A < 0.0:
+                STR_WSP='-99999'
+            if STR_WSP_B == DBLDASH:
+                STR_WSP='-99999'
+                #
+            #
+            #---WIND DIRECTION [oceanographic, turned by 180]
+            #
+            STR_WDR_A=datawdir[i,j]
+            STR_WDR_TEMP=STR_WDR_A+180.0
+            if STR_WDR_A >= 180.0:
+                STR_WDR_TEMP=STR_WDR_A-180.0
+                #
+            STR_WDR_A=STR_WDR_TEMP
+            STR_WDR_B=str(datawdir[i,j])
+            STR_WDR='%7.3f'%STR_WDR_A
+            #
+            if STR_WDR_A < 0.0:
+                STR_WDR='-999999'
+            elif MATH.isnan(STR_WDR_A):
+                STR_WDR='-999999'
+            elif STR_WDR_B == DBLDASH:
+                STR_WDR='-999999'
+                #
+            #
+            #---The record
+            #
+            STR_THIS_LINE=('SCT__'+STR_LAT+'__'+STR_LON+'__'+STR_WDR+'__'+STR_WSP+
+                           '_0_0_'+NEW_STR_TIME+'___')
+            #
+            #---rscat_knmi_adjust_satfocus_data.pl
+            #
+            if fnmoc_adjust:
+                STR_THIS_LINE=STR_THIS_LINE.replace('_', ' ').replace('---99', '  -99', 2)
+                #
+            #
+            if STR_WDR_B != "--":
+                STR_ALL_LINES.append(STR_THIS_LINE+'\n')
+                #
+            #
+        #
+    #---END OF LOOPS
+    #
+    return( ''.join(STR_ALL_LINES))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Format_SATFOCUS_Records_Scalar FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Compute_MLE_STRNG_Cells
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Compute_MLE_STRNG_Cells(ambig_obj):
+    #
+    # The MLE strings of the JPL loop: for each WVC the maximum of its
+    # -ambiguity_obj- values [max(STR_AMBIG_OBJ)], then -Compute_MLE_STRNG-
+    # for each ambiguity. Returns a [row][cell][ambiguity] nested list,
+    # the same as Compute_MLE_STRNG_Array(ambig_obj).tolist() .
+    #
+    ambig_obj=N.ma.asarray(ambig_obj)
+    #
+    shape_obj=N.shape(ambig_obj)
+    #
+    mle_strings=[]
+    #
+    for i in range(shape_obj[0]):
+        #
+        row_strings=[]
+        #
+        for j in range(shape_obj[1]):
+            STR_AMBIG_OBJ=ambig_obj[i,j]
+            MAX_STR_AMBIG_OBJ=max(STR_AMBIG_OBJ)
+            #
+            row_strings.append([Compute_MLE_STRNG(STR_AMBIG_OBJ[k], MAX_STR_AMBIG_OBJ)
+                                for k in range(shape_obj[2])])
+            #
+        #
+        mle_strings.append(row_strings)
+        #
+    #
+    return( mle_strings)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Compute_MLE_STRNG_Cells FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Write_QSCAT_Swath_Scalar
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Write_QSCAT_Swath_Scalar(swath, time_units, rev_number, fnmoc_adjust):
+    #
+    return( Format_QSCAT_Records_Scalar(swath['time'], time_units, swath['lat'], swath['lon'], swath['wind_speed'], swath['wind_dir'], swath['model_speed'], swath['model_dir'], swath['wvc_quality_flag'], rev_number, fnmoc_adjust))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Write_QSCAT_Swath_Scalar FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Write_SATFOCUS_Swath_Scalar
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Write_SATFOCUS_Swath_Scalar(swath, time_units, rev_number, fnmoc_adjust):
+    #
+    return( Format_SATFOCUS_Records_Scalar(swath['time'], time_units, swath['lat'], swath['lon'], swath['wind_speed'], swath['wind_dir'], fnmoc_adjust))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Write_SATFOCUS_Swath_Scalar FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#----------------------------------------------------------------
+# Reference writers, keyed like ASCII_WRITERS.
+#----------------------------------------------------------------
+#
+SCALAR_ASCII_WRITERS={'QSCAT':Write_QSCAT_Swath_Scalar,
+                      'SATFOCUS':Write_SATFOCUS_Swath_Scalar}
+#
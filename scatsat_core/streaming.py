@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+#==-FNMOC/N38DI PYTHON MODULE DEFINITION-===========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_core/streaming.py
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  MODULE OVERVIEW:
+#	(1) Streaming conversion: the swath is read, time converted, formatted
+#	    and appended to the ascii file a block of N scan rows at a time,
+#	    instead of reading every variable for the whole file first. The
+#	    memory used is set by N, not by the size of the swath.
+#	(2) N comes from SCATSAT_CHUNK_ROWS [not set or 0: the whole swath
+#	    at once, as before].
+#	(3) The records are the same as the whole swath ones, in the same
+#	    order. Each block is flushed to the file as soon as it is written,
+#	    so the file [NAME.PID.part in the temp directory] can be followed
+#	    while it grows. It is renamed into place once complete, as before.
+#
+# Programmer: Mr. Paul McCrone     02 February  2015 --Original Build for NASA RAPIDSCAT----
+#                                  13 September 2017 --New modified build for ISRO ScatSat--
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 First version.
+#========================================================================================
+#
+import os as OS
+#
+from .ncdf_readers import Read_Swath_Rows
+from .ascii_writers import ASCII_WRITERS, WRITER_SWATH_VARIABLES
+from .time_conversion import Get_Converted_Time_Array
+from .run_log import LOGGER, Start_Stage_Clock, Stop_Stage_Clock
+#
+#
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#  LIST OF PYTHON FUNCTIONS:
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#  ==> Get_Chunk_Rows()
+#	--> Output: Integer [SCATSAT_CHUNK_ROWS, 0 for the whole swath]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Write_Swath_In_Chunks(writefileobj, fileobj, ncdf_reader, writer_name,
+#                            time_units, rev_number, fnmoc_adjust, chunk_rows)
+#	--> writefileobj:open ascii file, Output: Integer [records written]
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Chunk_Rows
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Chunk_Rows():
+    #
+    # The number of scan rows per block from SCATSAT_CHUNK_ROWS. 0 [the
+    # whole swath at once] when it is not set, or not a whole number.
+    #
+    chunk_rows=OS.environ.get('SCATSAT_CHUNK_ROWS', '')
+    #
+    if chunk_rows.strip() == '':
+        return( 0)
+        #
+    #
+    try:
+        return( max(0, int(chunk_rows)))
+    except ValueError:
+        LOGGER.warning("SCATSAT_CHUNK_ROWS=%s is not a number of rows, the whole swath is read", chunk_rows)
+        return( 0)
+        #
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Chunk_Rows FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Write_Swath_In_Chunks
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Write_Swath_In_Chunks(writefileobj, fileobj, ncdf_reader, writer_name, time_units, rev_number, fnmoc_adjust, chunk_rows):
+    #
+    # Writes the records of ASCII_WRITERS[writer_name] for the whole swath of
+    # the open NETCDF file -fileobj- to -writefileobj-, -chunk_rows- scan
+    # rows at a time:
+    #     read the rows of WRITER_SWATH_VARIABLES[writer_name] [Read_Swath_Rows],
+    #     convert their -time- [Get_Converted_Time_Array],
+    #     format them [the writer, told the swath row of the block],
+    #     append them to the file and flush it.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  The arrays of one block are dropped before the next one is read.
+    #  The read, time, format and write stages are timed over all the blocks
+    #  [Stop_Stage_Clock adds up].
+    #  A .nc.gz file is already in memory in one piece [Open_NCDF_File], so
+    #  only the arrays and the records are bounded for those.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    swath_names=WRITER_SWATH_VARIABLES[writer_name]
+    ascii_writer=ASCII_WRITERS[writer_name]
+    #
+    number_of_rows=fileobj.variables[ncdf_reader['time']].shape[0]
+    number_of_records=0
+    #
+    LOGGER.info("Streaming %s records: %d rows, %d rows at a time", writer_name, number_of_rows, chunk_rows)
+    #
+    for first_row in range(0, number_of_rows, chunk_rows):
+        #
+        Start_Stage_Clock()
+        swath=Read_Swath_Rows(fileobj, ncdf_reader, swath_names, first_row, first_row+chunk_rows)
+        Stop_Stage_Clock('read')
+        #
+        obs_time=Get_Converted_Time_Array(swath['time'], time_units)
+        Stop_Stage_Clock('time')
+        #
+        STR_CHUNK_LINES=ascii_writer(obs_time, swath, rev_number, fnmoc_adjust, first_row)
+        Stop_Stage_Clock('format')
+        #
+        writefileobj.write(STR_CHUNK_LINES)
+        writefileobj.flush()
+        Stop_Stage_Clock('write')
+        #
+        number_of_records+=STR_CHUNK_LINES.count('\n')
+        #
+        del swath, obs_time, STR_CHUNK_LINES
+        #
+    #
+    return( number_of_records)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Write_Swath_In_Chunks FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+#==-FNMOC/N38DI PYTHON MODULE DEFINITION-===========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_core/synthetic_swaths.py
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  MODULE OVERVIEW:
+#	(1) Synthetic level 2B NETCDF files for the benchmark and regression
+#	    runs, so the converters can be timed without a live KNMI push:
+#	        oscat   oscat_YYYYMMDD_HHMMSS_scasa1_RRRRR_o_250_ovw_l2.nc     [KNMI]
+#	        rapid   rapid_YYYYMMDD_HHMMSS_iss____RRRRR_2hr_o_250_1903_ovw_l2.nc [KNMI]
+#	        jpl     rs_l2b_v1_RRRRR_YYYYMMDDHHmm.nc                        [JPL]
+#	    on the 25 km [1624 x 72] or the 50 km [812 x 36] grid [SWATH_GRIDS].
+#	(2) The swaths look like the real ones where the converters care:
+#	    packed integers with fill values and scale factors [KNMI], floats
+#	    with NaNs and a 1999 basis time [JPL], masked swath edges, land and
+#	    ice blocks, scattered QC rejects, one time per scan row.
+#
+# Programmer: Mr. Paul McCrone     02 February  2015 --Original Build for NASA RAPIDSCAT----
+#                                  13 September 2017 --New modified build for ISRO ScatSat--
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 First version.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.1, Dated 2026-Oct-17
+#                                 The KNMI files are netCDF3 classic, as the real ones.
+#========================================================================================
+#
+import datetime
+import numpy as N
+import netCDF4 as NCF
+#
+from .ncdf_readers import KNMI_NCDF_VARIABLES, JPL_NCDF_VARIABLES
+#
+#----------------------------------------------------------------
+# Rows, cells and the resolution tag of the file name.
+#----------------------------------------------------------------
+#
+SWATH_GRIDS={'25km':(1624, 72, '250'),
+             '50km':(812, 36, '500')}
+#
+SYNTHETIC_PRODUCTS=('oscat', 'rapid', 'jpl')
+#
+ORBIT_SECONDS=99.0*60.0     # One orbit [about 99 minutes] per file.
+NUM_AMBIGUITIES=4           # JPL -ambiguity_*- third dimension.
+#
+#
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#  LIST OF PYTHON FUNCTIONS:
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#  ==> Synthetic_NCDF_File_Name(product, grid, start_time, rev_number)
+#	--> product:String, start_time:datetime, Output: String [no directory]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Make_Synthetic_Swath(grid, start_time, seed)
+#	--> grid:String, Output: Dictionary of swath name : Masked Array
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Write_Synthetic_NCDF_File(nc_filename, product, grid, start_time, seed=0)
+#	--> nc_filename:String, Output: Integer [number of WVCs]
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Synthetic_NCDF_File_Name
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Synthetic_NCDF_File_Name(product, grid, start_time, rev_number):
+    #
+    resolution=SWATH_GRIDS[grid][2]
+    #
+    if product == 'oscat':
+        return( start_time.strftime("oscat_%Y%m%d_%H%M%S")+"_scasa1_%05d_o_%s_ovw_l2.nc" % (rev_number, resolution))
+        #
+    if product == 'rapid':
+        return( start_time.strftime("rapid_%Y%m%d_%H%M%S")+"_iss____%05d_2hr_o_%s_1903_ovw_l2.nc" % (rev_number, resolution))
+        #
+    if product == 'jpl':
+        return( "rs_l2b_v1_%05d_" % rev_number+start_time.strftime("%Y%m%d%H%M")+".nc")
+        #
+    #
+    raise ValueError("Unknown synthetic product: "+str(product))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Synthetic_NCDF_File_Name FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Make_Synthetic_Swath
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Make_Synthetic_Swath(grid, start_time, seed):
+    #
+    # The physical swath, before it is packed into a KNMI or JPL file.
+    # Returns a dictionary of swath name [the keys of KNMI_NCDF_VARIABLES]
+    # : masked array, with 'time' in seconds since -start_time- .
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  Masked WVCs: the two outer cells of each side on most rows, a few
+    #  land/ice blocks of rows x cells, and about 3% scattered QC rejects.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    num_rows,num_cells,resolution=SWATH_GRIDS[grid]
+    #
+    rng=N.random.default_rng(seed) if hasattr(N.random, 'default_rng') else N.random.RandomState(seed)
+    uniform=rng.uniform
+    #
+    row_index=N.arange(num_rows)[:, N.newaxis]*N.ones((1, num_cells))
+    cel_index=N.ones((num_rows, 1))*N.arange(num_cells)[N.newaxis, :]
+    #
+    #-----------------------------------------------------------
+    # Masks
+    #-----------------------------------------------------------
+    #
+    wvc_mask=uniform(0.0, 1.0, (num_rows, num_cells)) < 0.03
+    #
+    edge_cells=max(1, num_cells//36)
+    edge_rows=uniform(0.0, 1.0, num_rows) < 0.9
+    wvc_mask[edge_rows, :edge_cells]=True
+    wvc_mask[edge_rows, num_cells-edge_cells:]=True
+    #
+    for block in range(6):
+        first_row=int(uniform(0, num_rows))
+        first_cel=int(uniform(0, num_cells))
+        wvc_mask[first_row:first_row+num_rows//20, first_cel:first_cel+num_cells//3]=True
+        #
+    #
+    #-----------------------------------------------------------
+    # One orbit: latitude along the track, longitude drifting west.
+    #-----------------------------------------------------------
+    #
+    orbit_phase=2.0*N.pi*row_index/num_rows
+    cross_track=(cel_index-(num_cells-1)/2.0)/num_cells
+    #
+    lat=N.clip(82.0*N.sin(orbit_phase)+8.0*cross_track*N.cos(orbit_phase), -89.99, 89.99)
+    lon=N.mod(uniform(0.0, 360.0)+360.0*row_index/num_rows+10.0*cross_track, 360.0)
+    #
+    wind_speed=rng.gamma(2.2, 3.5, (num_rows, num_cells))
+    wind_dir=uniform(0.0, 360.0, (num_rows, num_cells))
+    model_speed=N.abs(wind_speed+rng.normal(0.0, 1.5, (num_rows, num_cells)))
+    model_dir=N.mod(wind_dir+rng.normal(0.0, 20.0, (num_rows, num_cells)), 360.0)
+    #
+    quality_flag=(rng.integers(0, 2**22, (num_rows, num_cells)) if hasattr(rng, 'integers')
+                  else rng.randint(0, 2**22, (num_rows, num_cells)))
+    #
+    scan_time=N.floor(row_index*ORBIT_SECONDS/num_rows)
+    #
+    def masked(values):
+        return( N.ma.array(values, mask=wvc_mask.copy()))
+    #
+    swath={'time':N.ma.array(scan_time, mask=False),
+           'lat':masked(lat),
+           'lon':masked(lon),
+           'wind_speed':masked(wind_speed),
+           'wind_dir':masked(wind_dir),
+           'model_speed':masked(model_speed),
+           'model_dir':masked(model_dir),
+           'wvc_quality_flag':masked(quality_flag),
+           'wvc_index':N.ma.array(cel_index+1, mask=False),
+           'ice_prob':N.ma.array(N.zeros((num_rows, num_cells)), mask=True),
+           'ice_age':N.ma.array(N.zeros((num_rows, num_cells)), mask=True),
+           'bs_distance':masked(rng.normal(0.0, 1.0, (num_rows, num_cells)))}
+    #
+    return( swath)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Make_Synthetic_Swath FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Write_Synthetic_NCDF_File
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Write_Synthetic_NCDF_File(nc_filename, product, grid, start_time, seed=0):
+    #
+    # Writes a synthetic -product- [oscat, rapid, jpl] swath to -nc_filename-.
+    # Returns the number of WVCs [rows x cells].
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  KNMI [oscat, rapid]: netCDF3 classic, packed integers with scale
+    #  factors and fill values, time in seconds since 1990-01-01.
+    #  JPL: netCDF4, floats, the masked WVCs written as NaN [about 5% more NaNs in
+    #  the winds], 16 bit -flags-, time in seconds since 1999-1-1, and
+    #  up to 4 wind ambiguities.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    swath=Make_Synthetic_Swath(grid, start_time, seed)
+    #
+    num_rows,num_cells=swath['lat'].shape
+    stop_time=start_time+datetime.timedelta(seconds=ORBIT_SECONDS)
+    #
+    ncdf_file=NCF.Dataset(nc_filename, 'w', format='NETCDF4' if product == 'jpl' else 'NETCDF3_CLASSIC')
+    #
+    ncdf_file.title='Synthetic '+product+' level 2B swath ['+grid+'] for the scatsat_core benchmark'
+    ncdf_file.source='scatsat_core/synthetic_swaths.py'
+    ncdf_file.institution='synthetic'
+    ncdf_file.history='created '+datetime.datetime.now().isoformat()
+    ncdf_file.start_date=start_time.strftime('%Y-%m-%d')
+    ncdf_file.start_time=start_time.strftime('%H:%M:%S')
+    ncdf_file.stop_date=stop_time.strftime('%Y-%m-%d')
+    ncdf_file.stop_time=stop_time.strftime('%H:%M:%S')
+    #
+    ncdf_file.createDimension('NUMROWS', num_rows)
+    ncdf_file.createDimension('NUMCELLS', num_cells)
+    #
+    if product == 'jpl':
+        #
+        ncdf_file.createDimension('NUMAMBIGS', NUM_AMBIGUITIES)
+        #
+        rng=N.random.RandomState(seed+1)
+        nan_cells=rng.uniform(0.0, 1.0, (num_rows, num_cells)) < 0.05
+        #
+        def jpl_var(swath_name, values, units=None, dims=('NUMROWS', 'NUMCELLS'), nc_type='f4'):
+            ncdf_var=ncdf_file.createVariable(JPL_NCDF_VARIABLES[swath_name], nc_type, dims)
+            if units is not None:
+                ncdf_var.units=units
+                #
+            ncdf_var[:]=values
+            #
+        #
+        def nan_filled(values, extra_nans=False):
+            values=N.ma.filled(values.astype(N.float64), N.nan)
+            if extra_nans:
+                values[nan_cells]=N.nan
+                #
+            return( values)
+        #
+        basis_offset=(start_time-datetime.datetime(1999, 1, 1)).total_seconds()
+        #
+        time_var=ncdf_file.createVariable('time', 'f8', ('NUMROWS', 'NUMCELLS'))
+        time_var.units='seconds since 1999-1-1 0:0:0'
+        time_var[:]=swath['time'].filled(0.0)+basis_offset
+        #
+        jpl_var('lat', nan_filled(swath['lat']), 'degrees_north')
+        jpl_var('lon', nan_filled(swath['lon']), 'degrees_east')
+        jpl_var('wind_speed', nan_filled(swath['wind_speed'], True), 'm s-1')
+        jpl_var('wind_dir', nan_filled(swath['wind_dir'], True), 'degrees')
+        jpl_var('model_speed', nan_filled(swath['model_speed']), 'm s-1')
+        jpl_var('model_dir', nan_filled(swath['model_dir']), 'degrees')
+        jpl_var('wvc_quality_flag', swath['wvc_quality_flag'].filled(0) % 65536, None, nc_type='u2')
+        jpl_var('rain_impact', nan_filled(N.ma.array(rng.gamma(1.0, 0.5, (num_rows, num_cells)), mask=swath['lat'].mask)))
+        #
+        num_ambiguities=rng.randint(1, NUM_AMBIGUITIES+1, (num_rows, num_cells))
+        no_ambiguity=N.arange(NUM_AMBIGUITIES)[N.newaxis, N.newaxis, :] >= num_ambiguities[..., N.newaxis]
+        no_ambiguity=no_ambiguity | swath['lat'].mask[..., N.newaxis]
+        #
+        ambiguity_obj=-N.sort(rng.gamma(2.0, 3.0, (num_rows, num_cells, NUM_AMBIGUITIES)), axis=-1)[..., ::-1]
+        ambiguity_speed=N.abs(swath['wind_speed'].data[..., N.newaxis]+rng.normal(0.0, 0.5, ambiguity_obj.shape))
+        ambiguity_direction=N.mod(swath['wind_dir'].data[..., N.newaxis]+90.0*N.arange(NUM_AMBIGUITIES), 360.0)
+        #
+        ambig_dims=('NUMROWS', 'NUMCELLS', 'NUMAMBIGS')
+        jpl_var('num_ambiguities', N.where(swath['lat'].mask, 0, num_ambiguities), nc_type='i1')
+        jpl_var('ambiguity_obj', N.where(no_ambiguity, N.nan, ambiguity_obj), None, ambig_dims)
+        jpl_var('ambiguity_speed', N.where(no_ambiguity, N.nan, ambiguity_speed), 'm s-1', ambig_dims)
+        jpl_var('ambiguity_direction', N.where(no_ambiguity, N.nan, ambiguity_direction), 'degrees', ambig_dims)
+        #
+    else:
+        #
+        #-----------------------------------------------------------
+        # KNMI packing: [netCDF type, scale factor, fill value, units]
+        #-----------------------------------------------------------
+        #
+        knmi_packing={'lat':('i4', 1.0e-5, -2147483647, 'degrees_north'),
+                      'lon':('i4', 1.0e-5, -2147483647, 'degrees_east'),
+                      'wvc_index':('i2', None, -32767, None),
+                      'model_speed':('i2', 0.01, -32767, 'm s-1'),
+                      'model_dir':('i2', 0.1, -32767, 'degree'),
+                      'ice_prob':('i2', 0.001, -32767, None),
+                      'ice_age':('i2', 0.01, -32767, 'dB'),
+                      'wvc_quality_flag':('i4', None, -2147483647, None),
+                      'wind_speed':('i2', 0.01, -32767, 'm s-1'),
+                      'wind_dir':('i2', 0.1, -32767, 'degree'),
+                      'bs_distance':('i2', 0.01, -32767, None)}
+        #
+        basis_offset=int((start_time-datetime.datetime(1990, 1, 1)).total_seconds())
+        #
+        time_var=ncdf_file.createVariable('time', 'i4', ('NUMROWS', 'NUMCELLS'), fill_value=-2147483647)
+        time_var.units='seconds since 1990-01-01 00:00:00'
+        time_var[:]=swath['time'].astype(N.int64)+basis_offset
+        #
+        for swath_name in sorted(knmi_packing):
+            #
+            nc_type,scale_factor,fill_value,units=knmi_packing[swath_name]
+            #
+            ncdf_var=ncdf_file.createVariable(KNMI_NCDF_VARIABLES[swath_name], nc_type,
+                                              ('NUMROWS', 'NUMCELLS'), fill_value=fill_value)
+            if scale_factor is not None:
+                ncdf_var.scale_factor=scale_factor
+                #
+            if units is not None:
+                ncdf_var.units=units
+                #
+            ncdf_var[:]=swath[swath_name]
+            #
+        #
+    #
+    ncdf_file.close()
+    #
+    return( num_rows*num_cells)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Write_Synthetic_NCDF_File FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
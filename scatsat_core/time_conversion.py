@@ -0,0 +1,996 @@
+# -*- coding: utf-8 -*-
+#==-FNMOC/N38DI PYTHON MODULE DEFINITION-===========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_core/time_conversion.py
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  MODULE OVERVIEW:
+#	(1) The current wall clock time [log lines and ascii file names].
+#	(2) The spacecraft time [seconds since January 1st, 1990, at 0000UTC]
+#	    converted to a calendar year-month-date-time, one value at a time
+#	    or for the whole -time- array at once, for any basis time given
+#	    by the -units- attribute of the -time- variable.
+#	(3) The formatted observation time strings of the ascii records, with
+#	    each distinct time formatted once [TIME90_CACHE_COUNTS].
+#
+# Programmer: Mr. Paul McCrone     02 February  2015 --Original Build for NASA RAPIDSCAT----
+#                                  13 September 2017 --New modified build for ISRO ScatSat--
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 Moved out of the converter scripts into the shared
+#                                 scatsat_core package.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.1, Dated 2026-Oct-17
+#                                 Get_Time90_Strings and TIME90_CACHE_COUNTS.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.2, Dated 2026-Oct-17
+#                                 Logged through LOGGER [run_log.py]: the wall clock
+#                                 banners at INFO, the per-cell lines at DEBUG. The
+#                                 times that cannot be converted are counted
+#                                 [RUN_COUNTS bad_time_cells].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.3, Dated 2026-Oct-17
+#                                 Get_Converted_Time90 looks up one Julian day table
+#                                 [the leap year one or the other] and no longer runs
+#                                 the month range ladder, whose result the table
+#                                 always replaced.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.4, Dated 2026-Oct-17
+#                                 Get_Converted_Time_Array: the basis time and time
+#                                 step come from the -units- attribute [1990 KNMI,
+#                                 1999 JPL, ...]. Get_Converted_Time90_Array calls it
+#                                 with TIME90_UNITS.
+#========================================================================================
+#
+import numpy as N
+import datetime
+import re as RE
+#
+from .jday_tables import Determine_mndate_from_leapjday, Determine_mndate_from_jday
+from .run_log import LOGGER, Count_Run_Event
+#
+#----------------------------------------------------------------
+# Hits and misses of the time string memo [see -Get_Time90_Strings-].
+# The converters reset them at the start of -main- and print them
+# at the end, so the log shows them for every file.
+#----------------------------------------------------------------
+#
+TIME90_CACHE_COUNTS={'hits':0, 'misses':0}
+#
+#----------------------------------------------------------------
+# CF time units [-units- attribute of the NETCDF -time- variable]:
+#   <step> since <yyyy-m-d>[ T]<h:m:s>[ UTC, Z ...]
+# TIME90_UNITS is the KNMI basis, assumed when a file has no units.
+#----------------------------------------------------------------
+#
+TIME90_UNITS='seconds since 1990-01-01 00:00:00'
+#
+TIME_UNITS_PATTERN=RE.compile(r'\s*(seconds?|secs?|s|minutes?|mins?|hours?|hrs?|h|days?|d)\s+since\s+'
+                              r'(\d{1,4})-(\d{1,2})-(\d{1,2})'
+                              r'(?:[ T]+(\d{1,2}):(\d{1,2})(?::(\d{1,2}(?:\.\d*)?))?)?', RE.IGNORECASE)
+#
+SECONDS_PER_TIME_STEP={'seconds':1.0, 'second':1.0, 'secs':1.0, 'sec':1.0, 's':1.0,
+                       'minutes':60.0, 'minute':60.0, 'mins':60.0, 'min':60.0,
+                       'hours':3600.0, 'hour':3600.0, 'hrs':3600.0, 'hr':3600.0, 'h':3600.0,
+                       'days':86400.0, 'day':86400.0, 'd':86400.0}
+#
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#  LIST OF PYTHON FUNCTIONS:
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#  ==> Print_Current_Time(now)
+#	--> now:String, Output: Formatted String
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Access_Current_Time(now, name_format)
+#	--> now:String, Output: Time String formatted with -name_format-
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_Converted_Time90(spacecrafttime):
+#	--> spacecrafttime:Integer or Float, Output: Formatted String
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_Converted_Time90_Array(spacecrafttime):
+#	--> spacecrafttime:Array of Integer or Float, Output: Tuple of Integer Arrays
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_Time_Units_Basis(time_units):
+#	--> time_units:String, Output: Tuple of datetime64 and Float
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_Converted_Time_Array(spacecrafttime, time_units):
+#	--> spacecrafttime:Array of Integer or Float, Output: Tuple of Integer Arrays
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_Time90_Strings(obs_time, keep, time_format):
+#	--> obs_time:Tuple of Integer Arrays, Output: String Array
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Print_Current_Time
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Print_Current_Time(now):
+    #-----
+    ###import datetime
+    #-----
+    now = datetime.datetime.now()
+    #-----
+    LOGGER.info("")
+    LOGGER.info("Current date and time using str method of datetime object:")
+    LOGGER.info(str(now))
+    #-----
+    LOGGER.info(" \n")
+    LOGGER.info("Current date and time using instance attributes:")
+    LOGGER.info("Current year: %d" % now.year)
+    LOGGER.info("Current month: %d" % now.month)
+    LOGGER.info("Current day: %d" % now.day)
+    LOGGER.info("Current hour: %d" % now.hour)
+    LOGGER.info("Current minute: %d" % now.minute)
+    LOGGER.info("Current second: %d" % now.second)
+    LOGGER.info("Current microsecond: %d" % now.microsecond)
+    #-----
+    LOGGER.info(" \n")
+    LOGGER.info("Current date and time using strftime:")
+    #print now.strftime("%Y-%m-%d %H:%M")
+    LOGGER.info(now.strftime("%Y-%m-%d...%H:%M"))
+    #-----
+    LOGGER.info(" \n")
+    LOGGER.info("Current date and time using isoformat:")
+    LOGGER.info(now.isoformat())
+    return( now.strftime("%Y-%m-%d...%H:%M"))
+    #return now
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Print_Current_Time FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Access_Current_Time
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Access_Current_Time(now, name_format="%Y-%m-%d.%H-%M"):
+    #-----
+    # -name_format- is the strftime format of the returned time string. The
+    # qscat converter uses the default [ascii file name], the satfocus
+    # converter passes "%Y-%m-%d.rapidscat.ncdf.%H-%M".
+    #-----
+    ###import datetime
+    #-----
+    now = datetime.datetime.now()
+    #-----
+    LOGGER.info("")
+    LOGGER.info("Current date and time using str method of datetime object:")
+    LOGGER.info(str(now))
+    #-----
+    LOGGER.info(" \n")
+    LOGGER.info("Current date and time using instance attributes:")
+    LOGGER.info("Current year: %d" % now.year)
+    LOGGER.info("Current month: %d" % now.month)
+    LOGGER.info("Current day: %d" % now.day)
+    LOGGER.info("Current hour: %d" % now.hour)
+    LOGGER.info("Current minute: %d" % now.minute)
+    LOGGER.info("Current second: %d" % now.second)
+    LOGGER.info("Current microsecond: %d" % now.microsecond)
+    #-----
+    LOGGER.info(" \n")
+    LOGGER.info("Current date and time using strftime:")
+    #print now.strftime("%Y-%m-%d %H:%M")
+    LOGGER.info(now.strftime("%Y-%m-%d...%H:%M"))
+    #-----
+    LOGGER.info(" \n")
+    LOGGER.info("Current date and time using isoformat:")
+    LOGGER.info(now.isoformat())
+    return( now.strftime(name_format))
+    #return now
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Access_Current_Time FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Converted_Time90
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Converted_Time90(spacecrafttime):
+    #
+    # The input variable -spacecrafttime- must be provided in seconds 
+    # since January 1st, 1990:Time 0000UTC
+    # This is referred to as the basis time, 0 seconds.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  The input  spacecrafttime is expressed in seconds. 
+    #  The input value must be a floating point number.
+    #  A typical input value cojuld be -507502997.521-sec. 
+    #  This would be for Jan 30th, 2015 at around 1525 UTC
+    #  This routine will code this time as:
+    #  20150130-1525.00.000-UTC-
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - processed- - - - -
+    # We will eventually output the converted time as a string -str_converted_sctime-
+    # This will be a string in the following format:
+    # yyyyMMdd-HHmm.SS.sss-UTC-
+    # Thus the Basis time would be expressed as:
+    # 19900101-0000.00.000-UTC-
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    # Another example. February 5th, 2015, 1234[hours and min] 
+    # and 56.789 seconds UTC is expressed as :
+    # 20150205-1234.56.789-UTC-
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    # =====================
+    # NOTE CAREFULLY!!!!! 
+    # =====================
+    # THIS FUNCTION WORKS FOR NASA RAPIDSCAT (FROM KNMI) AND NASA RAPIDSCAT (KNMI) ONLY!!!!!
+    # --------------------------------------------------------------------
+    # The basis time for RapidScat is currently a one-of-a-kind -19900101-0000.00.000-UTC--. 
+    # No other active satellites use this basis time as far as we know!
+    # Unless you KNOW that your satellite uses the 1990 basis time shown above, 
+    # THEN YOU MUST REWRITE THIS FUNCTION FOR YOUR OWN PURPOSES.
+    # This function will not work otherwise. 
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #   
+    #-----
+    ###import datetime
+    #-----
+    #
+    #-----------------------------------------------------
+    #
+    dadots=".  .  .  .  .  .  .  .  .  .  .  .  ."
+    dadash="-------------------------------------"
+    #
+    NOT_A_NUMBER=float('nan')
+    #  MATH.isnan(NOT_A_NUMBER)
+    #
+    #
+    #--#print(dadots+dadots)
+    #--#print(dadots+dadots)
+    #--#print(dadots+dadots)
+
+    #
+    #--#print("spacecrafttime is...."+str(spacecrafttime))	###---===---
+    #
+    #
+    temp_str="00"
+    #
+    #
+    waterfalltime=spacecrafttime*1.0
+    #
+    rightnow = datetime.datetime.now()
+    str_converted_sctime = str(rightnow)
+    #
+    #
+    #--#print(dadots+dadots)
+    #--#print(str_converted_sctime)TEST_20150901_AB.TXT
+    #--#print(dadots+dadots)
+    #
+    # Values for observation time. I will eventually concatenate these together 
+    # in the variable -str_converted_sctime- and return to the main program.
+    #
+    #
+    ob_s_year = rightnow.year
+    ob_s_mnth = rightnow.month
+    ob_s_date = rightnow.day
+    ob_s_hour = rightnow.hour
+    ob_s__min = rightnow.minute
+    ob_s__sec = rightnow.second
+    ob_s_msec = rightnow.microsecond
+    #
+    #
+    obs_year = str(rightnow.year)
+    obs_mnth = str(rightnow.month)
+    obs_date = str(rightnow.day)
+    obs_hour = str(rightnow.hour)
+    obs__min = str(rightnow.minute)
+    obs__sec = str(rightnow.second)
+    obs_msec = str(rightnow.microsecond)
+    #
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - -  - - - - - - - - - - - - - - -
+    #
+    if ob_s_mnth < 10:
+        temp_str='0'+obs_mnth
+        obs_mnth=temp_str
+        # - - - - - - - - - - - - - - - - - #
+    if ob_s_date < 10:
+        temp_str='0'+obs_date
+        obs_date=temp_str
+        # - - - - - - - - - - - - - - - - - #
+    if ob_s_hour < 10:
+        temp_str='0'+obs_hour
+        obs_hour=temp_str
+        # - - - - - - - - - - - - - - - - - #
+    if ob_s__min < 10:
+        temp_str='0'+obs__min
+        obs__min=temp_str
+        # - - - - - - - - - - - - - - - - - #
+    if ob_s__sec < 10:
+        temp_str='0'+obs__sec
+        obs__sec=temp_str
+        # - - - - - - - - - - - - - - - - - #
+    #
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - -  - - - - - - - - - - - - - - -
+    #
+    str_converted_sctime_a=obs_year+obs_mnth+obs_date+'-'
+    str_converted_sctime_b=obs_hour+obs__min+'.'+obs__sec+'.'+obs_msec
+    str_converted_sctime=str_converted_sctime_a+str_converted_sctime_b+'-UTC-'
+    #
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - -  - - - - - - - - - - - - - - -
+    #
+    # Constants for time conversions.
+    #
+    sec_pr_min=60.0	# The # of seconds per minute
+    min_per_hr=60.0	# The # of minutes per hour
+    hr_per_day=24.0	# The # of hours per day
+    day_per_yr=365.0	# The # of days per year (non-leapyear)
+    day_pr_lyr=366.0	# The # of days per leapyear
+    #
+    sec_per_hr = sec_pr_min*min_per_hr	           # The # of seconds per hour
+    #						   #
+    sec_pr_day = sec_pr_min*min_per_hr*hr_per_day  # The # of seconds per day
+    #						   #
+    sec_per_yr = sec_pr_day*day_per_yr		   # The # of seconds per year(non-leapyear) 
+    #						   #
+    sec_pr_lyr = sec_pr_day*day_pr_lyr		   # The # of seconds per leapyear
+    #
+    #-------------------------------------------------------------------------------
+    #
+    # No Rapidscat data IS known to exist prior to Jan 1st, 2013, 0000UTC.
+    # I will refer to this date and time as the FNMOC_RapidScat Start time,
+    # or simply -FR_start_13-.
+    # Therefore, to simplify the converesion process, I will calculate the 
+    # number of seconds from the basis time to FR_start. I will make comparisons
+    # to -FR_Start- to figure out years dates etc. 
+    #
+    #-------------------------------------------------------------------------------
+    #
+    #
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - -  - - - - - - - - - - - - - - -
+    # From 1990 to 1999, there have been 2 leap years [1992, 1996]
+    # [That is Jan 90 to Jan 1999] 
+    # From 1990 to 1999, there have been 7 non-leap years [1990, 1991, 1993, 1994, 1995, 1997, 1998]
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    FR_start_9099 = (7.0*sec_per_yr) + (2.0 * sec_pr_lyr)
+    #
+    # answer should be 283996800.0
+    # This represents the number of seconds from Jan 1 1990 at 0000UTC
+    # UNTIL Jan 1, 1999 at 0000UTC
+    #
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - -  - - - - - - - - - - - - - - -
+    # From 1999 to 2013, there have been 4 leap years [2000, 04, 08, 12]
+    # [Thats Jan 99 to Jan 2013] 
+    # Since 1999, there have been 10 non-leap years [1999, 2001,02,03,05,06,07,09,10,11]
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    FR_start_13 = FR_start_9099 + (10.0*sec_per_yr) + (4 * sec_pr_lyr)
+    #
+    # answer should be 725846400.0   (283996800.0 sec + 441849600.0 sec)
+    # This represents the number of seconds from Jan 1 1999 at 0000UTC
+    # UNTIL Jan 1, 2013 at 0000UTC
+    #
+    #-----------------------------------------------------
+    # I will now calculate the start times out to 2030 
+    # That means Jan 1st, 0000UTC each year.
+    #-----------------------------------------------------
+    #     
+    FR_start_14 = FR_start_13 + (1.0*sec_per_yr)
+    #
+    FR_start_15 = FR_start_14 + (1.0*sec_per_yr)
+    #
+    FR_start_16 = FR_start_15 + (1.0*sec_per_yr)
+    #
+    FR_start_17 = FR_start_16 + (1.0*sec_pr_lyr)  ### 2016 is a leap year, you add the extra to 2017.
+    #
+    FR_start_18 = FR_start_17 + (1.0*sec_per_yr)
+    #
+    FR_start_19 = FR_start_18 + (1.0*sec_per_yr)
+    #
+    FR_start_20 = FR_start_19 + (1.0*sec_per_yr)
+    #
+    FR_start_21 = FR_start_20 + (1.0*sec_pr_lyr)  ### 2020 is a leap year, you add the extra to 2021.
+    #
+    FR_start_22 = FR_start_21 + (1.0*sec_per_yr)
+    #
+    FR_start_23 = FR_start_22 + (1.0*sec_per_yr)
+    #
+    FR_start_24 = FR_start_23 + (1.0*sec_per_yr)
+    #
+    FR_start_25 = FR_start_24 + (1.0*sec_pr_lyr)  ### 2024 is a leap year, you add the extra to 2025.
+    #
+    FR_start_26 = FR_start_25 + (1.0*sec_per_yr)
+    #
+    FR_start_27 = FR_start_26 + (1.0*sec_per_yr)
+    #
+    FR_start_28 = FR_start_27 + (1.0*sec_per_yr)
+    #
+    FR_start_29 = FR_start_28 + (1.0*sec_pr_lyr)  ### 2028 is a leap year, you add the extra to 2029.
+    #
+    FR_start_30 = FR_start_29 + (1.0*sec_per_yr)
+    #
+    # NEXT, WE DO A CASE TYPE STATEMENT WHERE WE ASSIGN THE VALUE OF THE YEAR BASED ON THE # OF SECONDS.
+    #
+    #~~~~~~~~~~~~~~~~~~~~~
+    #----------------------------------------------------------------
+    # If the wind direction is less than 100, insert a zero up front.
+    #----------------------------------------------------------------
+    #
+    decrement4years = FR_start_13
+    basis_year=1999
+    my_year=0
+    year__count=10.0
+    Lyear_count=4.0
+    yesnoleapyear = 0
+
+    #
+    if spacecrafttime > FR_start_13:
+        obs_year = "2013"
+        decrement4years = FR_start_13
+        year__count=year__count+1.0
+        yesnoleapyear = 0
+        #
+    if spacecrafttime > FR_start_14:
+        obs_year = "2014"
+        decrement4years = FR_start_14
+        year__count=year__count+1.0
+        yesnoleapyear = 0
+        #
+    if spacecrafttime > FR_start_15:
+        obs_year = "2015"
+        decrement4years = FR_start_15
+        year__count=year__count+1.0
+        yesnoleapyear = 0
+        #
+    if spacecrafttime > FR_start_16:
+        obs_year = "2016"
+        decrement4years = FR_start_16
+        year__count=year__count+1.0
+        yesnoleapyear = 1
+        #
+    if spacecrafttime > FR_start_17:
+        obs_year = "2017"
+        decrement4years = FR_start_17
+        Lyear_count=Lyear_count+1.0
+        yesnoleapyear = 0
+        #
+    if spacecrafttime > FR_start_18:
+        obs_year = "2018"
+        decrement4years = FR_start_18
+        year__count=year__count+1.0
+        yesnoleapyear = 0
+        #
+    if spacecrafttime > FR_start_19:
+        obs_year = "2019"
+        decrement4years = FR_start_19
+        year__count=year__count+1.0
+        yesnoleapyear = 0
+        #
+    if spacecrafttime > FR_start_20:
+        obs_year = "2020"
+        decrement4years = FR_start_20
+        Lyear_count=Lyear_count+1.0
+        yesnoleapyear = 1
+        #
+    if spacecrafttime > FR_start_21:
+        obs_year = "2021"
+        decrement4years = FR_start_21
+        year__count=year__count+1.0
+        yesnoleapyear = 0
+        #
+    if spacecrafttime > FR_start_22:
+        obs_year = "2022"
+        decrement4years = FR_start_22
+        year__count=year__count+1.0
+        yesnoleapyear = 0
+        #
+    if spacecrafttime > FR_start_23:
+        obs_year = "2023"
+        decrement4years = FR_start_23
+        year__count=year__count+1.0
+        yesnoleapyear = 0
+        #
+    if spacecrafttime > FR_start_24:
+        obs_year = "2024"
+        decrement4years = FR_start_24
+        Lyear_count=Lyear_count+1.0
+        yesnoleapyear = 1
+        #
+    if spacecrafttime > FR_start_25:
+        obs_year = "2025"
+        decrement4years = FR_start_25
+        year__count=year__count+1.0
+        yesnoleapyear = 0
+        #
+    if spacecrafttime > FR_start_26:
+        obs_year = "2026"
+        decrement4years = FR_start_26
+        year__count=year__count+1.0
+        yesnoleapyear = 0
+        #
+    if spacecrafttime > FR_start_27:
+        obs_year = "2027"
+        decrement4years = FR_start_27
+        year__count=year__count+1.0
+        yesnoleapyear = 0
+        #
+    if spacecrafttime > FR_start_28:
+        obs_year = "2028"
+        decrement4years = FR_start_28
+        Lyear_count=Lyear_count+1.0
+        yesnoleapyear = 1
+        #
+    if spacecrafttime > FR_start_29:
+        obs_year = "2029"
+        decrement4years = FR_start_29
+        year__count=year__count+1.0
+        yesnoleapyear = 0
+        #
+    if spacecrafttime > FR_start_30:
+        my_year=basis_year +int(spacecrafttime/sec_per_yr)
+        decrement4years = FR_start_30
+        decrement4years = (sec_pr_lyr * Lyear_count)+(sec_per_yr * year__count)
+        obs_year =str(my_year)
+        yesnoleapyear = 0
+    #-----------------------------------------------------------
+    # End of if block
+    #-----------------------------------------------------------
+    #
+    #--#print("obs_year is...."+str(obs_year))	###---===---
+    #
+
+    #
+    ###decrement4years = (sec_pr_lyr * Lyear_count)+(sec_per_yr * year__count)
+    #
+    #--#print("decrement4years is...."+str(decrement4years))	###---===---
+    #
+    #
+    if decrement4years < FR_start_14:
+        LOGGER.debug("ERROR==>decrement4years cannot be such a small number.")
+        Count_Run_Event('bad_time_cells')
+        return( str_converted_sctime)
+        #
+        #----------------------------------------------------
+        # End of if block
+        #----------------------------------------------------
+    #-----------------------------------------------------------0128
+    if spacecrafttime > decrement4years:
+        waterfalltime = spacecrafttime - decrement4years
+        #--#print("waterfalltime-decrm- is...."+str(waterfalltime))	###---===---
+        #
+        #
+
+        # End of if block
+        #----------------------------------------------------
+    #-----------------------------------------------------------
+    if waterfalltime < 0:
+        LOGGER.debug(dadots+dadots)
+        LOGGER.debug("ERROR==>waterfalltime cannot be negative.")
+        LOGGER.debug(dadots+dadots)
+        Count_Run_Event('bad_time_cells')
+        #----------------------------------------------------
+        # End of if block
+        #----------------------------------------------------
+    #
+    #-----------------------------------------------------------
+    # Now get the number of days. 
+    #-----------------------------------------------------------
+    #
+    num_days =  int(waterfalltime/sec_pr_day)
+    #
+    LOGGER.debug("num_days is...."+str(num_days))	###---===---
+    #
+    #
+    # The month and date come from the Julian day tables [jday_tables.py];
+    # there is no separate month range ladder.
+    #
+    this_month_n_date="0000"                                       ###---===---
+    #                                                               ##---===---
+    if yesnoleapyear == 1:                                         ###---===---
+        LOGGER.debug(dadots+dadots)                                ###---===---
+        LOGGER.debug("This is a leap year.")                       ###---===---
+        LOGGER.debug(dadots+dadots)                                ###---===---
+        this_month_n_date=Determine_mndate_from_leapjday(num_days-1) #---===---
+    else:                                                          ###---===---
+        LOGGER.debug("---This is [NOT] a leap year. ---")          ###---===---
+        this_month_n_date=Determine_mndate_from_jday(num_days-1)   ###---===---
+        #----------------------------------------------------      ###---===---
+        # End of if block                                          ###---===---
+        #----------------------------------------------------      ###---===---
+        #----------------------------------------------------      ###---===---
+    #
+    #
+    if num_days > 366:
+        LOGGER.debug(dadots+dadots)
+        LOGGER.debug("ERROR==>number of days cannot be greater than 366.")
+        LOGGER.debug(dadots+dadots)
+        Count_Run_Event('bad_time_cells')
+        #----------------------------------------------------
+        # End of if block
+        #----------------------------------------------------
+        #----------------------------------------------------
+    #-----------------------------------------------
+    obs_mnth = this_month_n_date[0:2]                                   #---===---
+
+    #-----------------------------------------------
+        #----------------------------------------------------
+    if obs_mnth == "0":
+        obs_mnth = "00"
+        LOGGER.debug("ERROR!!ERROR!! obs_mnth is...."+str(obs_mnth))             ###---===---
+        LOGGER.debug("ERROR!!ERROR!! obs_mnth is not being calculated correctly.") ##---===---
+        #
+    #-----------------------------------------------------
+    #
+    #-----------------------------------------------------
+    #
+    #--#print("obs_mnth is...."+str(obs_mnth))	###---===---
+    #
+    obs_date = this_month_n_date[2:4]                                    #---===---
+
+    #
+    #
+    if obs_date == "1":
+        obs_date = "01"
+        #
+    if obs_date == "2":
+        obs_date = "02"
+        #
+    if obs_date == "3":
+        obs_date = "03"
+        #
+    if obs_date == "4":
+        obs_date = "04"
+        #        #    #
+    if obs_date == "5":
+        obs_date = "05"
+        #
+    if obs_date == "6":
+        obs_date = "06"
+        #0128
+    if obs_date == "7":
+        obs_date = "07"
+        #
+    if obs_date == "8":
+        obs_date = "08"
+        #
+    if obs_date == "9":
+        obs_date = "09"
+        #
+    if obs_date == "0":
+        obs_date = "00"
+        #
+    #
+    #--#print("obs_date is...."+str(obs_date))	###---===---
+    #
+    #-----------------------------------------------------
+    #
+    hourwaterfalltime=waterfalltime-(1.0*num_days*sec_pr_day)
+
+    num_hours = int(hourwaterfalltime/sec_per_hr) # sec_per_hr
+
+
+    obs_hour = str(num_hours)
+    #
+    if obs_hour == "0":
+        obs_hour = "00"
+        #
+    if obs_hour == "1":
+        obs_hour = "01"
+        #
+    if obs_hour == "2":
+        obs_hour = "02"
+        #
+    if obs_hour == "3":
+        obs_hour = "03"
+        #
+    if obs_hour == "4":
+        obs_hour = "04"
+        #
+    if obs_hour == "5":
+        obs_hour = "05"
+        #
+    if obs_hour == "6":
+        obs_hour = "06"
+        #
+    if obs_hour == "7":
+        obs_hour = "07"
+        #
+    if obs_hour == "8":
+        obs_hour = "08"
+        #
+    if obs_hour == "9":
+        obs_hour = "09"
+        #
+    #
+    #-----------------------------------------------------
+    ###
+    mintwaterfalltime=hourwaterfalltime-(1.0*num_hours*sec_per_hr)
+    
+    num_mint=int(mintwaterfalltime/sec_pr_min)
+
+    obs__min = str(num_mint)
+    #
+    if obs__min == "0":
+        obs__min = "00"
+        #
+    if obs__min == "1":
+        obs__min = "01"
+        #    #
+    if obs__min == "2":
+        obs__min = "02"
+        #
+    if obs__min == "3":
+        obs__min = "03"
+        #
+    if obs__min == "4":
+        obs__min = "04"
+        #
+    if obs__min == "5":
+        obs__min = "05"
+        #
+    if obs__min == "6":
+        obs__min = "06"
+        #    #
+    if obs__min == "7":
+        obs__min = "07"
+        #
+    if obs__min == "8":
+        obs__min = "08"
+        #
+    if obs__min == "9":
+        obs__min = "09"
+        #
+    #-----------------------------------------------------
+    ###
+    sec_waterfalltime=mintwaterfalltime-(1.0*num_mint*sec_pr_min)
+
+    num_sec=int(sec_waterfalltime/1.0)
+
+
+    obs__sec = str(num_sec)
+    #
+    if obs__sec == "0":
+        obs__sec = "00"
+        #
+    if obs__sec == "1":
+        obs__sec = "01"
+        #
+    if obs__sec == "2":
+        obs__sec = "02"
+        #
+    if obs__sec == "3":
+        obs__sec = "03"
+        #
+    if obs__sec == "4":
+        obs__sec = "04"
+        #
+    if obs__sec == "5":
+        obs__sec = "05"
+        #
+    if obs__sec == "6":
+        obs__sec = "06"
+        #
+    if obs__sec == "7":
+        obs__sec = "07"
+        #
+    if obs__sec == "8":
+        obs__sec = "08"
+        #
+    if obs__sec == "9":
+        obs__sec = "09"
+        #
+    #
+    #-----------------------------------------------------
+    ###
+    msec_waterfalltime=sec_waterfalltime-(1.0*num_sec)
+
+    num_msec=int(msec_waterfalltime*1000.0)
+
+    obs_msec = str(num_msec)
+    #-----------------------------------------------------
+    #    #  20150130-1525.00.000-UTC-
+    #-----------------------------------------------------
+
+    str_converted_sctime_a=obs_year+obs_mnth+obs_date+'-'
+
+    str_converted_sctime_b=obs_hour+obs__min+'.'+obs__sec+'.'+obs_msec
+
+    str_converted_sctime=str_converted_sctime_a+str_converted_sctime_b+'-UTC-'
+
+    #
+    #-----------------------------------------------------
+    #
+    return( str_converted_sctime)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Converted_Time90 FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Converted_Time90_Array
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Converted_Time90_Array(spacecrafttime):
+    #
+    # This is the whole-swath version of -Get_Converted_Time90-.
+    # The input variable -spacecrafttime- is the entire -time- array
+    # read from the netCDF file, in seconds since January 1st, 1990:Time 0000UTC.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  Same as -Get_Converted_Time_Array- with the 1990 basis [TIME90_UNITS].
+    #  Six integer arrays of the same shape as the input are returned:
+    #       obs_year, obs_mnth, obs_date, obs_hour, obs__min, obs__sec
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    return( Get_Converted_Time_Array(spacecrafttime, TIME90_UNITS))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Converted_Time90_Array FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Time_Units_Basis
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Time_Units_Basis(time_units):
+    #
+    # The basis time and the size of one time step of a CF -units-
+    # attribute, e.g.
+    #     'seconds since 1990-01-01 00:00:00'    KNMI
+    #     'seconds since 1999-1-1 0:0:0'         JPL
+    #     'days since 2000-01-01T00:00:00Z'
+    # Returns (datetime64 basis time [s], Float seconds per time step).
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  Units that cannot be read give the 1990 basis the converters have
+    #  always assumed, with a warning in the log.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    units_match=TIME_UNITS_PATTERN.match(str(time_units))
+    #
+    if units_match is None:
+        LOGGER.warning("---Unknown time units ["+str(time_units)+"], assuming "+TIME90_UNITS)
+        units_match=TIME_UNITS_PATTERN.match(TIME90_UNITS)
+        #
+    #
+    step_name,year,mnth,date,hour,mint,secs=units_match.groups()
+    #
+    basis_time=datetime.datetime(int(year), int(mnth), int(date),
+                                 int(hour or 0), int(mint or 0), int(float(secs or 0)))
+    #
+    return( N.datetime64(basis_time, 's'), SECONDS_PER_TIME_STEP[step_name.lower()])
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Time_Units_Basis FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Converted_Time_Array
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Converted_Time_Array(spacecrafttime, time_units):
+    #
+    # The whole -time- array read from the netCDF file, converted with
+    # the basis time and time step of its -units- attribute [time_units],
+    # so the 1990 KNMI and the 1999 JPL files go through the same code.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  Rather than walking the year cascade and the Julian day tables
+    #  once for every WVC, the whole array is converted in one pass
+    #  with numpy datetime64 arithmetic.  The calendar (leap years etc.)
+    #  is handled by numpy, so there is no 2013-2030 limit.
+    #
+    #  Six integer arrays of the same shape as the input are returned:
+    #       obs_year, obs_mnth, obs_date, obs_hour, obs__min, obs__sec
+    #
+    #  The per-cell formatters in -main- just index into these arrays.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  Masked (fill value) or NaN times cannot be converted. As with
+    #  -Get_Converted_Time90-, those cells get the current date and time.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    basis_time,step_seconds=Get_Time_Units_Basis(time_units)
+    #
+    sctime=N.ma.filled(N.ma.asarray(spacecrafttime,dtype=N.float64),N.nan)
+    #
+    if step_seconds != 1.0:
+        sctime=sctime*step_seconds
+        #
+    #
+    bad_time=N.isnan(sctime)
+    #
+    #-----------------------------------------------------------
+    # Whole seconds since the basis time, then the calendar parts.
+    #-----------------------------------------------------------
+    whole_sec=N.floor(N.where(bad_time,0.0,sctime)).astype(N.int64)
+    #
+    obstime=basis_time+whole_sec.astype('timedelta64[s]')
+    obs_days=obstime.astype('datetime64[D]')
+    obs_mnths=obstime.astype('datetime64[M]')
+    obs_years=obstime.astype('datetime64[Y]')
+    #
+    obs_year=obs_years.astype(N.int64)+1970
+    obs_mnth=(obs_mnths-obs_years).astype(N.int64)+1
+    obs_date=(obs_days-obs_mnths).astype(N.int64)+1
+    #
+    sec_of_day=(obstime-obs_days).astype(N.int64)
+    obs_hour=sec_of_day//3600
+    obs__min=(sec_of_day%3600)//60
+    obs__sec=sec_of_day%60
+    #
+    #-----------------------------------------------------------
+    # Fill the cells that have no valid time with the current time.
+    #-----------------------------------------------------------
+    if bad_time.any():
+        Count_Run_Event('bad_time_cells', N.count_nonzero(bad_time))
+        rightnow = datetime.datetime.now()
+        obs_year[bad_time]=rightnow.year
+        obs_mnth[bad_time]=rightnow.month
+        obs_date[bad_time]=rightnow.day
+        obs_hour[bad_time]=rightnow.hour
+        obs__min[bad_time]=rightnow.minute
+        obs__sec[bad_time]=rightnow.second
+        #
+        #----------------------------------------------------
+        # End of if block
+        #----------------------------------------------------
+    #
+    return( obs_year, obs_mnth, obs_date, obs_hour, obs__min, obs__sec)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Converted_Time_Array FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Time90_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Time90_Strings(obs_time, keep, time_format):
+    #
+    # The observation time strings of the WVCs -keep- [flat indexes].
+    # -obs_time- is the tuple returned by -Get_Converted_Time90_Array-, and
+    # -time_format- names its parts, e.g.
+    #     '%(year)04d/%(mnth)02d/%(date)02d_%(hour)02d:%(min)02d:%(sec)02d'
+    #     '%(mnth)02d%(date)02d%(hour)02d%(min)02d'   [MMDDhhmm]
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  All the WVCs of a scan row share one time, so the strings are memoized
+    #  on the whole-second time [the key YYYYMMDDhhmmss]: each distinct key
+    #  is formatted once, and the other cells of the row take that string.
+    #  TIME90_CACHE_COUNTS counts the cells served from the memo [hits] and
+    #  the keys that were formatted [misses].
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    obs_year,obs_mnth,obs_date,obs_hour,obs__min,obs__sec=obs_time
+    #
+    time_key=(obs_year.ravel()[keep]*10000000000+obs_mnth.ravel()[keep]*100000000
+              +obs_date.ravel()[keep]*1000000+obs_hour.ravel()[keep]*10000
+              +obs__min.ravel()[keep]*100+obs__sec.ravel()[keep])
+    #
+    unique_key, key_index=N.unique(time_key, return_inverse=True)
+    #
+    unique_strings=N.array([time_format % {'year':k//10000000000, 'mnth':k//100000000%100,
+                                           'date':k//1000000%100, 'hour':k//10000%100,
+                                           'min':k//100%100, 'sec':k%100}
+                            for k in unique_key.tolist()], dtype=N.str_)
+    #
+    TIME90_CACHE_COUNTS['misses']+=unique_key.size
+    TIME90_CACHE_COUNTS['hits']+=time_key.size-unique_key.size
+    #
+    return( unique_strings[key_index.ravel()])
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Time90_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
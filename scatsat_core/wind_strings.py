@@ -0,0 +1,743 @@
+# -*- coding: utf-8 -*-
+#==-FNMOC/N38DI PYTHON MODULE DEFINITION-===========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_core/wind_strings.py
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  MODULE OVERVIEW:
+#	(1) The per-value string builders of the original converters
+#	    [wind speed, wind direction, MLE].
+#	(2) The whole swath string helpers used by the record writers.
+#
+# Programmer: Mr. Paul McCrone     02 February  2015 --Original Build for NASA RAPIDSCAT----
+#                                  13 September 2017 --New modified build for ISRO ScatSat--
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 Moved out of the converter scripts into the shared
+#                                 scatsat_core package.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.1, Dated 2026-Oct-17
+#                                 Determine_Wind_SPEED_Array and
+#                                 Determine_Wind_Direction_Array: the wind codes for a
+#                                 whole swath at once.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.2, Dated 2026-Oct-17
+#                                 Compute_MLE_STRNG_Array: the JPL ambiguity MLE codes
+#                                 for a whole swath at once.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.3, Dated 2026-Oct-17
+#                                 The MLE strings of a NaN objective and the ones that
+#                                 were not 5 characters long are counted [RUN_COUNTS];
+#                                 the per-cell banner is logged at DEBUG.
+#========================================================================================
+#
+import numpy as N
+import math as MATH
+#
+from .run_log import LOGGER, Count_Run_Event
+#
+#
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#  LIST OF PYTHON FUNCTIONS:
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#  ==> Determine_Wind_SPEED(data_from_netcdf)
+#	--> data_from_netcdf:Float, Output: Formatted String
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Determine_Wind_Direction(data_from_file)
+#	--> data_from_file:Float, Output: Formatted String
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Compute_MLE_STRNG(datafromfile, MAX_data_Value)
+#	--> datafromfile:Float, Output: Formatted String
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_Cell_Values(data_array)
+#	--> data_array:Masked Array, Output: Flat Array of values, Flat Array of mask
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_Value_Strings(cell_value, cell_mask, factor)
+#	--> cell_value:Float Array, Output: String Array of str(value*factor)
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Slice_Value_Strings(value_strings, start, stop)
+#	--> value_strings:String Array, Output: String Array [start:stop]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Get_Digit_Strings(int_values, num_digits)
+#	--> int_values:Integer Array, Output: Zero padded String Array
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Determine_Wind_SPEED_Array(data_array)
+#	--> data_array:Masked Array, Output: String Array of 3 character speed codes
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Determine_Wind_Direction_Array(data_array)
+#	--> data_array:Masked Array, Output: String Array of 3 character direction codes
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Compute_MLE_STRNG_Array(ambig_obj)
+#	--> ambig_obj:Masked Array [row, cell, ambiguity], Output: String Array of 5 character MLE codes
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Determine_Wind_SPEED
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Determine_Wind_SPEED(data_from_netcdf):
+    #
+    #-----#-----#-----#-----#-----
+    #
+    MINUS99='-99'
+    DBLDASH='--'
+    #
+    NOT_A_NUMBER=float('nan')
+    #  MATH.isnan(NOT_A_NUMBER)
+    #
+    #
+    #
+    STR_WSPEED_A=data_from_netcdf
+    STR_WSPEED_B=str(data_from_netcdf)
+    STR_WSPEED_X10=STR_WSPEED_A*10.0
+    STR_WSPEED_X10C=str(STR_WSPEED_X10)
+    STR_WSPEED=STR_WSPEED_X10C[0:3]
+    STR_Wind_SPEED_Value=STR_WSPEED_X10C[0:3]
+    #
+    #
+    #-----------------------------
+    #
+    #----------------------------------------------------------------
+    # If the Wind Speed is less than 0, then use -99, otherwise,
+    # take the first three characters.
+    #----------------------------------------------------------------
+    #
+    if STR_WSPEED_A < 0.0:
+        #
+        STR_WSPEED=MINUS99
+        #
+    elif STR_WSPEED_B == DBLDASH:
+        #
+        STR_WSPEED=MINUS99
+        #
+    else:
+        #
+        STR_WSPEED=STR_WSPEED_X10C[0:3]
+        #
+        #-----------------------------------------------------------
+        # End of if block
+        #-----------------------------------------------------------
+        #
+    #
+    if (STR_WSPEED_A >= 10.0) and (STR_WSPEED_A < 100.0):
+        STR_WSPEED=STR_WSPEED_X10C[0:3]
+        #
+    #
+    if (STR_WSPEED_A >= 1.0) and (STR_WSPEED_A < 10.0):
+        STR_WSPEED='+'+STR_WSPEED_X10C[0:2]
+        #
+    #
+    if (STR_WSPEED_A >= 0.1) and (STR_WSPEED_A < 1.0):
+        STR_WSPEED='+0'+STR_WSPEED_X10C[0:1]
+        #
+    #
+    if (STR_WSPEED_A >= 0.0) and (STR_WSPEED_A < 0.1):
+        STR_WSPEED='000'
+        #
+    #=QWERTYUIOP.ASDFGHJKL.ZXCVBNM=
+    #
+    #
+    if MATH.isnan(data_from_netcdf):
+        STR_WSPEED=MINUS99
+        #
+        #-----------------------------------------------------------
+        # End of if block
+        #-----------------------------------------------------------
+    #
+    #-----
+    STR_Wind_SPEED_Value=STR_WSPEED
+    #
+    return STR_Wind_SPEED_Value
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Determine_Wind_SPEED
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Determine_Wind_Direction
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Determine_Wind_Direction(data_from_file):
+    #
+    #-----#-----#-----#-----#-----
+    #
+    MINUS99="-99"
+    DBLDASH="--"
+    #
+    #
+    NOT_A_NUMBER=float('nan')
+    #  MATH.isnan(NOT_A_NUMBER)
+    #
+    STR_WDIR_A=data_from_file
+    STR_WDIR_B=str(data_from_file)
+    STR_WDIR_X1=STR_WDIR_A*1.0
+    STR_WDIR_X1C=str(STR_WDIR_X1)
+    STR_WDIR=STR_WDIR_X1C[0:3]
+    #
+    if MATH.isnan(STR_WDIR_A):
+        STR_WDIR=MINUS99
+        # 
+        #-----------------------------------------------------------
+        # End of if block
+        #-----------------------------------------------------------
+    #
+    #
+    #----------------------------------------------------------------
+    # If the Wind direction is less than 0, then use -99, otherwise,
+    # take the first three characters.
+    #----------------------------------------------------------------
+    if STR_WDIR_A < 0.0:
+        # 
+        STR_WDIR=MINUS99
+        #
+    elif MATH.isnan(STR_WDIR_A):
+        #
+        STR_WDIR=MINUS99
+        #
+    elif STR_WDIR_B == DBLDASH:
+        #
+        STR_WDIR=MINUS99
+        #
+    else:
+        #xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+        # NESTED IF BLOCK 
+        # If the Wind direction is less than 100, then insert a zero up front, otherwise,
+        # take the first three characters.
+        #xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+        #
+        if (STR_WDIR_A >= 10.0) and (STR_WDIR_A < 100.0):
+            STR_WDIR='0'+STR_WDIR_X1C[0:2]
+            #
+        if (STR_WDIR_A >= 1.0) and (STR_WDIR_A < 10.0):
+            STR_WDIR='00'+STR_WDIR_X1C[0:1]
+            #
+        if (STR_WDIR_A >= 0.1) and (STR_WDIR_A < 1.0):
+            STR_WDIR='000'
+            #
+        if (STR_WDIR_A >= 0.0) and (STR_WDIR_A < 0.1):
+            STR_WDIR='000'
+            #
+        #if datawdir[i,j] < 100.0:
+            #    ###STR_WDR="0"+str(datawdir[i,j])
+            #    STR_WDR="0"+STR_WDR_X1C[0:2]
+        #
+	#else:
+	##
+        #    STR_WDR=STR_WDR_X1C[0:3]
+	#   #	        
+        #xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+	# End of NESTED IF block
+	#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+        #
+        #-----------------------------------------------------------
+        # End of if block
+        #-----------------------------------------------------------
+        #
+        #
+    #
+    if MATH.isnan(data_from_file):
+        STR_WDIR=MINUS99
+	#
+	#-----------------------------------------------------------
+	# End of if block
+	#-----------------------------------------------------------
+    #
+    STR_Wind_Direction_Value=STR_WDIR
+    #
+    #-----
+    #
+    return STR_Wind_Direction_Value
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Determine_Wind_Direction FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Compute_MLE_STRNG
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Compute_MLE_STRNG(datafromfile, MAX_data_Value):
+    #-----
+    ###import math as MATH
+    #-----
+    #
+    dadash="-------------------------------------"
+    #
+    NOT_A_NUMBER=float('nan')
+    #  MATH.isnan(NOT_A_NUMBER)
+    #
+    Value_of_MLE = 0
+    #
+    STR_Value_of_MLE = str(Value_of_MLE)
+    #
+    #-----math.fabs(-2.0)
+    #
+    # Calculate prob value.
+    #
+    probability0=0
+    probability0=(datafromfile-MAX_data_Value)/2.0
+    Value_of_MLE0 = MATH.exp(probability0)
+    #
+    #Value_of_MLE0 = MATH.exp(datafromfile)
+    #
+    Value_of_MLE1 = MATH.fabs(Value_of_MLE0)
+    Value_of_MLE_3K = Value_of_MLE1*30000.0
+    #
+    if MATH.isnan(Value_of_MLE_3K):
+        #
+        Value_of_MLE  = Value_of_MLE1
+        #
+    else:
+        Value_of_MLE  = MATH.trunc(Value_of_MLE_3K)
+        #
+        #MATH.trunc(x)
+        #----------------------------------------------------------------
+        #END IF
+        #----------------------------------------------------------------
+    STR_Value_of_MLE0 = str(Value_of_MLE)
+    LEN_Value_of_MLE0 = len(STR_Value_of_MLE0)
+    #
+    #
+    #----------------------------------------------------------------
+    # Begin IF Block for LEN_FLAGS_B
+    #----------------------------------------------------------------
+    #
+    if LEN_Value_of_MLE0 == 1:
+	#
+        STR_Value_of_MLE='0000'+STR_Value_of_MLE0
+	#
+    elif LEN_Value_of_MLE0 == 2:
+        #
+        STR_Value_of_MLE='000'+STR_Value_of_MLE0
+        #
+    elif LEN_Value_of_MLE0 == 3:
+        #
+        STR_Value_of_MLE='00'+STR_Value_of_MLE0
+        #
+    elif LEN_Value_of_MLE0 == 4:
+        #
+        STR_Value_of_MLE='0'+STR_Value_of_MLE0
+        #
+    elif LEN_Value_of_MLE0 == 5:
+        #
+        STR_Value_of_MLE=STR_Value_of_MLE0
+        #
+    else:
+        #
+        STR_Value_of_MLE=STR_Value_of_MLE0[0:5]
+        #
+        #-----------------------------------------------------------
+        # End of if block
+        #-----------------------------------------------------------
+    #
+    if MATH.isnan(datafromfile):
+        #
+        STR_Value_of_MLE='---99'
+        #
+        #-----------------------------------------------------------
+        # End of if block
+        #-----------------------------------------------------------
+    #
+    temp_STR=STR_Value_of_MLE
+    LEN_temp_STR = len(temp_STR)
+    #
+    if LEN_temp_STR != 5:
+        LOGGER.debug(dadash)
+        LOGGER.debug("The MLE String was NOT 5 Characters long!")
+        LOGGER.debug(dadash)
+        Count_Run_Event('bad_length_mle')
+        if LEN_temp_STR > 5:
+            STR_Value_of_MLE=temp_STR[0:5]
+            #
+            #-x-x-x-x-x-x-x-x-x-x-x-x-x-x-x-x-x-x
+            # End of if block
+            #-x-x-x-x-x-x-x-x-x-x-x-x-x-x-x-x-x-x
+        if LEN_temp_STR == 0:
+            STR_Value_of_MLE='00000'
+            #
+            #-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y
+            # End of if block
+            #-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y
+        if LEN_temp_STR == 1:
+            STR_Value_of_MLE='0000'+temp_STR
+            #
+            #-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y
+            # End of if block
+            #-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y
+        if LEN_temp_STR == 2:
+            STR_Value_of_MLE='000'+temp_STR
+            #
+            #-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y
+            # End of if block
+            #-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y
+        if LEN_temp_STR == 3:
+            STR_Value_of_MLE='00'+temp_STR
+            #
+            #-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y
+            # End of if block
+            #-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y
+        if LEN_temp_STR == 4:
+            STR_Value_of_MLE='0'+temp_STR
+            #
+            #-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y
+            # End of if block
+            #-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y-y
+        #
+        #
+        #-----------------------------------------------------------
+        # End of if block [[[LEN_temp_STR != 5]]]
+        #-----------------------------------------------------------
+    #
+    if MATH.isnan(datafromfile):
+        #
+        STR_Value_of_MLE='---99'
+        #
+        #-----------------------------------------------------------
+        # End of if block
+        #-----------------------------------------------------------
+    #
+    if MATH.isnan(datafromfile) or MATH.isnan(Value_of_MLE_3K):
+        Count_Run_Event('nan_mle_cells')
+        #
+    #
+    #-----
+    #
+    return( STR_Value_of_MLE)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Compute_MLE_STRNG FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Cell_Values
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Cell_Values(data_array):
+    #
+    # Flatten a (masked) netCDF array into the value and the mask of each WVC.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  The values are cast to the type the old per-cell code worked in,
+    #  which is the type of  -data_array[i,j]+0.0- . That keeps every
+    #  comparison and every -str()- the same as in the old i/j loop.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    data_array=N.ma.asarray(data_array)
+    #
+    cell_mask=N.ma.getmaskarray(data_array).ravel()
+    cell_data=N.ma.getdata(data_array).ravel()
+    #
+    cell_type=type(cell_data.dtype.type(0)+0.0)
+    cell_value=cell_data.astype(cell_type)
+    #
+    return( cell_value, cell_mask)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Cell_Values FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Value_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Value_Strings(cell_value, cell_mask, factor):
+    #
+    # Returns a numpy string array holding  -str(value*factor)-  for every cell.
+    # Masked cells get '--', which is what -str()- gives for a masked element.
+    #
+    scaled_value=cell_value*cell_value.dtype.type(factor)
+    #
+    if scaled_value.dtype == N.float64:
+        value_strings=list(map(repr, scaled_value.tolist()))
+    else:
+        value_strings=[str(x) for x in scaled_value]
+        #
+        #----------------------------------------------------
+        # End of if block
+        #----------------------------------------------------
+    #
+    for k in N.flatnonzero(cell_mask):
+        value_strings[k]='--'
+        #
+    #
+    return( N.array(value_strings, dtype=N.str_))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Value_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Slice_Value_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Slice_Value_Strings(value_strings, start, stop):
+    #
+    # The column version of  -STR_X[start:stop]- .
+    # Each string is viewed as a row of characters and the columns
+    # -start- to -stop- are cut out in one step. Short strings give
+    # short (or empty) results, just like a python slice.
+    #
+    num_chars=stop-start
+    #
+    if value_strings.dtype.itemsize//4 < stop:
+        value_strings=value_strings.astype('U%d' % stop)
+        #
+    #
+    width=value_strings.dtype.itemsize//4
+    char_codes=value_strings.view(N.uint32).reshape(-1, width)[:, start:stop]
+    #
+    return( N.ascontiguousarray(char_codes).view('U%d' % num_chars).ravel())
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Slice_Value_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Digit_Strings
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Digit_Strings(int_values, num_digits):
+    #
+    # Zero padded, fixed width digit strings [ '%0Nd' ] for a whole array
+    # of non-negative integers, built directly into a character buffer.
+    #
+    int_values=N.asarray(int_values, dtype=N.int64).ravel()
+    #
+    char_codes=N.empty((int_values.size, num_digits), dtype=N.uint32)
+    #
+    for k in range(num_digits):
+        place=10**(num_digits-1-k)
+        char_codes[:, k]=48+(int_values//place)%10
+        #
+    #
+    return( char_codes.view('U%d' % num_digits).ravel())
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Digit_Strings FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Determine_Wind_SPEED_Array
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Determine_Wind_SPEED_Array(data_array):
+    #
+    # Whole swath version of -Determine_Wind_SPEED- .
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  -data_array- is a (masked) netCDF array. Returns the flat String Array
+    #  of the 3 character wind speed codes, one per WVC:
+    #     '-99'         masked, NaN or negative,
+    #     '000'         0.0 to 0.1,
+    #     '+0N', '+NN'  0.1 to 1.0 and 1.0 to 10.0,
+    #     str(speed*10)[0:3] otherwise.
+    #  The mask is used directly [no str(value) == '--' test] and every code
+    #  is cut out of one str(speed*10) column, so each one is the same as
+    #  -Determine_Wind_SPEED- gives for that WVC.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    MINUS99='-99'
+    #
+    wsp_value, wsp_mask=Get_Cell_Values(data_array)
+    wsp_x10c=Get_Value_Strings(wsp_value, wsp_mask, 10.0)
+    #
+    a=N.where(wsp_mask, N.nan, wsp_value)
+    #
+    STR_WSPEED=N.select(
+        [N.isnan(a) | (a < 0.0),
+         (a >= 0.0) & (a < 0.1),
+         (a >= 0.1) & (a < 1.0),
+         (a >= 1.0) & (a < 10.0)],
+        [MINUS99,
+         '000',
+         N.char.add('+0', Slice_Value_Strings(wsp_x10c, 0, 1)),
+         N.char.add('+', Slice_Value_Strings(wsp_x10c, 0, 2))],
+        Slice_Value_Strings(wsp_x10c, 0, 3))
+    #
+    return( STR_WSPEED)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Determine_Wind_SPEED_Array FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Determine_Wind_Direction_Array
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Determine_Wind_Direction_Array(data_array):
+    #
+    # Whole swath version of -Determine_Wind_Direction- .
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  -data_array- is a (masked) netCDF array. Returns the flat String Array
+    #  of the 3 character wind direction codes, one per WVC:
+    #     '-99'         masked, NaN or negative,
+    #     '000'         0.0 to 1.0,
+    #     '00N', '0NN'  1.0 to 10.0 and 10.0 to 100.0,
+    #     str(direction)[0:3] otherwise.
+    #  Same as -Determine_Wind_Direction- for every WVC [see
+    #  -Determine_Wind_SPEED_Array- ].
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    MINUS99='-99'
+    #
+    wdr_value, wdr_mask=Get_Cell_Values(data_array)
+    wdr_x1c=Get_Value_Strings(wdr_value, wdr_mask, 1.0)
+    #
+    a=N.where(wdr_mask, N.nan, wdr_value)
+    #
+    STR_WDIR=N.select(
+        [N.isnan(a) | (a < 0.0),
+         (a >= 0.0) & (a < 1.0),
+         (a >= 1.0) & (a < 10.0),
+         (a >= 10.0) & (a < 100.0)],
+        [MINUS99,
+         '000',
+         N.char.add('00', Slice_Value_Strings(wdr_x1c, 0, 1)),
+         N.char.add('0', Slice_Value_Strings(wdr_x1c, 0, 2))],
+        Slice_Value_Strings(wdr_x1c, 0, 3))
+    #
+    return( STR_WDIR)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Determine_Wind_Direction_Array FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Compute_MLE_STRNG_Array
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Compute_MLE_STRNG_Array(ambig_obj):
+    #
+    # Whole swath version of -Compute_MLE_STRNG- for the JPL -ambiguity_obj-
+    # array [row, cell, ambiguity].
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #  The maximum of each WVC is found the way  -max(STR_AMBIG_OBJ)-  finds it:
+    #  a masked or NaN value never replaces the running maximum, and a masked
+    #  first value leaves the maximum masked. Every ambiguity is then scaled
+    #  as  exp((obj-max)/2)*30000 , truncated and zero padded to 5 characters.
+    #  A NaN or masked objective gives '---99', a NaN product gives '00nan'.
+    #
+    #  The values are worked in the same types as the per-cell code. The few
+    #  products that land within 1.0e-6 of a whole number are redone with
+    #  -MATH.exp- , so the truncation always agrees with -Compute_MLE_STRNG-.
+    #
+    #  Returns a String Array of the same [row, cell, ambiguity] shape.
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    #
+    ambig_obj=N.ma.asarray(ambig_obj)
+    #
+    obj_mask=N.ma.getmaskarray(ambig_obj)
+    obj_data=N.ma.getdata(ambig_obj)
+    #
+    cell_type=type(obj_data.dtype.type(0)+0.0)
+    #
+    with N.errstate(invalid='ignore', over='ignore'):
+        #
+        #-----------------------------------------------------------
+        # Running maximum over the ambiguities.
+        #-----------------------------------------------------------
+        #
+        max_data=obj_data[..., 0].copy()
+        max_mask=obj_mask[..., 0].copy()
+        #
+        for k in range(1, obj_data.shape[-1]):
+            replace_max=(~obj_mask[..., k]) & (~max_mask) & (obj_data[..., k] > max_data)
+            max_data=N.where(replace_max, obj_data[..., k], max_data)
+            #
+        #
+        #-----------------------------------------------------------
+        # (obj-max)/2.0 , then exp, fabs and times 30000.0
+        #-----------------------------------------------------------
+        #
+        probability0=(obj_data-max_data[..., N.newaxis]).astype(cell_type)/cell_type(2.0)
+        probability0=N.where(max_mask[..., N.newaxis], N.nan, probability0)
+        #
+        Value_of_MLE_3K=N.fabs(N.exp(probability0.astype(N.float64)))*30000.0
+        #
+        near_whole=(Value_of_MLE_3K >= 0.5) & (N.fabs(Value_of_MLE_3K-N.around(Value_of_MLE_3K)) < 1.0e-6)
+        #
+        for k in N.flatnonzero(near_whole):
+            Value_of_MLE_3K.flat[k]=MATH.fabs(MATH.exp(probability0.flat[k]))*30000.0
+            #
+        #
+        mle_nan=N.isnan(Value_of_MLE_3K)
+        obj_nan=obj_mask | N.isnan(obj_data.astype(cell_type))
+        #
+    #
+    Value_of_MLE=N.trunc(N.where(mle_nan, 0.0, Value_of_MLE_3K)).astype(N.int64)
+    #
+    #-----------------------------------------------------------
+    # More than 5 digits: keep the first five [STR[0:5]].
+    #-----------------------------------------------------------
+    #
+    too_long=(Value_of_MLE >= 100000)
+    #
+    while N.any(too_long):
+        Value_of_MLE=N.where(too_long, Value_of_MLE//10, Value_of_MLE)
+        too_long=(Value_of_MLE >= 100000)
+        #
+    #
+    #-----------------------------------------------------------
+    # Zero padded 5 digit strings, built in a character buffer
+    # of the native string type ['S' python 2, 'U' python 3].
+    #-----------------------------------------------------------
+    #
+    str_char=N.dtype(N.str_).char
+    #
+    if str_char == 'S':
+        char_codes=N.empty(Value_of_MLE.shape+(5,), dtype=N.uint8)
+    else:
+        char_codes=N.empty(Value_of_MLE.shape+(5,), dtype=N.uint32)
+        #
+    #
+    for k in range(5):
+        char_codes[..., k]=48+(Value_of_MLE//10**(4-k))%10
+        #
+    #
+    STR_Value_of_MLE=char_codes.view(str_char+'5').reshape(Value_of_MLE.shape)
+    #
+    STR_Value_of_MLE=N.where(mle_nan, '00nan', STR_Value_of_MLE)
+    STR_Value_of_MLE=N.where(obj_nan, '---99', STR_Value_of_MLE)
+    #
+    Count_Run_Event('nan_mle_cells', N.count_nonzero(mle_nan | obj_nan))
+    #
+    return( STR_Value_of_MLE)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Compute_MLE_STRNG_Array FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
@@ -0,0 +1,217 @@
+#!/satdat/python/sata/bin/python
+# -*- coding: utf-8 -*-
+#==============================================================
+#
+#==============================================================
+#
+#
+#==-FNMOC/N38DI PYTHON PROGRAM DEFINITION-==========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_knmi_daemon3.py
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  PROGRAM OVERVIEW:
+#	(1) Watch mode: an optional long running service in place of the SMS
+#	    chain for each KNMI file [scatsat_knmi.job, scatsat_knmi.fcn, the
+#	    *_direxist.ksh and *_ncdf.ksh scripts]. The two converters are
+#	    imported once [numpy, scipy, matplotlib, netCDF4 stay loaded] and
+#	    each oscat_*.nc[.gz] file is converted as soon as it is closed in
+#	    XFER_BASEPATH [inotify; polling where inotify is not available]:
+#	        scatsat_knmi_convert_rscat_ncdf_2_qscat_ASCII3.py    main(file)
+#	            in XFER_BASEPATH [/satdat/curr/scatsat_knmi]
+#	        scatsat_knmi_convert_rscat_ncdf_2_satfocus3.py       main(file)
+#	            in /satdat/curr/scatsat_satfocus
+#	    The files already in the inboxes are converted first, as --all does.
+#	(2) The outputs are the ones of the converters run with --all, and
+#	    each file gets the same Execution Code messages in the log
+#	    [Report_Execution_Code]. See scatsat_core/inbox_watch.py.
+#	(3) With --pipeline each file is decoded once for both converters
+#	    [scatsat_knmi_pipeline3.py] and removed once both succeeded.
+#	(4) SIGTERM or SIGINT stops the service once the current file is done.
+#	    It also stops on a path problem [Execution Code 90]. The exit
+#	    status is 0 after a normal stop [Execution Code 1 or 55], or the
+#	    Execution Code [90, 97], so the supervisor and sat_mon see it.
+#
+#  USAGE:
+#	Run with the environment of scatsat_knmi_process_ncdf.ksh [OPSBIN,
+#	XFER_BASEPATH, KNMI_BASEPATH] after the *_direxist.ksh scripts:
+#	python -W ignore scatsat_knmi_daemon3.py [--poll SECONDS] [--no-inotify] [--pipeline]
+#	                                          >> ${XFER_BASEPATH}/log.scatsat_knmi.netcdf.scatsat.log
+#	    --poll SECONDS    the longest wait for a stop request, and the time
+#	                      between two scans when polling [default 5]
+#	    --no-inotify      poll the inbox [for file systems without inotify
+#	                      events, such as files written from another node]
+#	    --pipeline        one decode for both converters, in XFER_BASEPATH only
+#
+# Programmer: Mr. Paul McCrone     02 February  2015 --Original Build for NASA RAPIDSCAT----
+#                                  13 September 2017 --New modified build for ISRO ScatSat--
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 First version.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.1, Dated 2026-Oct-17
+#                                 --pipeline [one decode for both converters].
+#========================================================================================
+#
+import os as OS
+import sys as SYS
+import signal as SIGNAL
+import warnings as WARNINGS
+#
+#
+#----------------------------------------------------------------
+# scatsat_core and the converters are next to this script [${EXECDIR}].
+#----------------------------------------------------------------
+#
+SYS.path.insert(0, OS.path.dirname(OS.path.abspath(__file__)))
+#
+from scatsat_core import Setup_Run_Logging, Print_Current_Time, Serve_Inbox_NCDF_Files, Report_Execution_Code
+#
+with WARNINGS.catch_warnings():
+    WARNINGS.simplefilter("ignore")
+    import scatsat_knmi_convert_rscat_ncdf_2_qscat_ASCII3 as QSCAT_CONVERTER
+    import scatsat_knmi_convert_rscat_ncdf_2_satfocus3 as SATFOCUS_CONVERTER
+    import scatsat_knmi_pipeline3 as PIPELINE
+    #
+#
+#----------------------------------------------------------------
+# The inbox of each converter, as the *_ncdf.ksh scripts export
+# XFER_BASEPATH. The SATFOCUS inbox is where the QSCAT converter copies
+# the NETCDF file [my_SATFOCUS_BASEPATH, hardcoded there too].
+#----------------------------------------------------------------
+#
+KNMI_XFER_BASEPATH=OS.environ.get('XFER_BASEPATH', '') or '/satdat/curr/scatsat_knmi'
+SATFOCUS_XFER_BASEPATH='/satdat/curr/scatsat_satfocus'
+#
+#----------------------------------------------------------------
+# The converters in the order of scatsat_knmi.fcn. The SATFOCUS one
+# removes the NETCDF file, so it runs last.
+#----------------------------------------------------------------
+#
+CONVERTERS=[('QSCAT', QSCAT_CONVERTER.main, KNMI_XFER_BASEPATH),
+            ('SATFOCUS', SATFOCUS_CONVERTER.main, SATFOCUS_XFER_BASEPATH)]
+#
+#----------------------------------------------------------------
+# With --pipeline: one step, both writers fed from one decode.
+#----------------------------------------------------------------
+#
+PIPELINE_CONVERTERS=[('PIPELINE', PIPELINE.Convert_Pipeline_File, KNMI_XFER_BASEPATH)]
+#
+#----------------------------------------------------------------
+# Set by the signal handler, read by -Serve_Inbox_NCDF_Files-.
+#----------------------------------------------------------------
+#
+STOP_REQUEST={'stop':False}
+#
+#
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#  LIST OF PYTHON FUNCTIONS:
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#  ==> Get_Option(option_name, default_value)
+#	--> option_name:String [--poll], Output: String
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Request_Stop(signal_number, stack_frame)
+#	--> signal_number:Integer, Output: None
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> main()
+#	--> Output: Integer exit status [0, 90 or 97]
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Option
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Option(option_name, default_value):
+    #
+    if option_name in SYS.argv[1:]:
+        return( SYS.argv[SYS.argv.index(option_name)+1])
+        #
+    #
+    return( default_value)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Option FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Request_Stop
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Request_Stop(signal_number, stack_frame):
+    #
+    print("---WATCH: signal "+str(signal_number)+" received, stopping after the current file")
+    STOP_REQUEST['stop']=True
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Request_Stop FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function main
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def main():
+    #
+    dadash="-------------------------------------"
+    #
+    poll_seconds=max(0.1, float(Get_Option('--poll', '5')))
+    use_inotify='--no-inotify' not in SYS.argv[1:]
+    #
+    if '--pipeline' in SYS.argv[1:]:
+        converters=PIPELINE_CONVERTERS
+    else:
+        converters=CONVERTERS
+        #
+    #
+    Setup_Run_Logging()
+    #
+    SIGNAL.signal(SIGNAL.SIGTERM, Request_Stop)
+    SIGNAL.signal(SIGNAL.SIGINT, Request_Stop)
+    #
+    print(dadash+dadash)
+    print('---BEGIN scatsat_knmi_daemon3.py  [pid '+str(OS.getpid())+']  -----')
+    the_start_time = Print_Current_Time(' ')
+    print(dadash+dadash)
+    #
+    my_execution=Serve_Inbox_NCDF_Files(converters, ('oscat_',), poll_seconds, use_inotify, STOP_REQUEST)
+    #
+    Report_Execution_Code(my_execution)
+    #
+    print(dadash+dadash)
+    print("Starting Time:"+str(the_start_time))
+    the_end_time = Print_Current_Time(' ')
+    print("Ending   Time:"+str(the_end_time))
+    print('---END scatsat_knmi_daemon3.py  -----')
+    print(dadash+dadash)
+    #
+    if my_execution in (1, 55):
+        return( 0)
+        #
+    #
+    return( my_execution)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF main FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+if __name__ == '__main__':
+    SYS.exit(main())
+    #
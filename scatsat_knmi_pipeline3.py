@@ -0,0 +1,208 @@
+#!/satdat/python/sata/bin/python
+# -*- coding: utf-8 -*-
+#==============================================================
+#
+#==============================================================
+#
+#
+#==-FNMOC/N38DI PYTHON PROGRAM DEFINITION-==========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_knmi_pipeline3.py
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  PROGRAM OVERVIEW:
+#	(1) One decode, many outputs: each oscat_*.nc[.gz] file in XFER_BASEPATH
+#	    is opened, read and time converted once, and the decoded swath is
+#	    handed to the -main- of every converter in PIPELINE_WRITERS:
+#	        scatsat_knmi_convert_rscat_ncdf_2_qscat_ASCII3.py    FGGE qscat
+#	        scatsat_knmi_convert_rscat_ncdf_2_satfocus3.py       SATFOCUS [and the
+#	                                                             copy to NRL]
+#	    See -Convert_NCDF_File_Once- in scatsat_core/pipeline.py.
+#	(2) Replaces the two steps of scatsat_knmi.fcn [scatsat_knmi_process_ncdf.ksh,
+#	    then scatsat_knmi_satfocus_ncdf.ksh], which each opened and read the
+#	    file. The file is no longer copied to /satdat/curr/scatsat_satfocus.
+#	(3) The file is removed only after every converter made its product
+#	    [Execution Code 1 or 97]. A file that failed stays in XFER_BASEPATH,
+#	    instead of being removed by the -rm -rf oscat_*.nc*- of the first ksh
+#	    script while the second one still needs it. The next run only runs
+#	    the converters that did not make their product from it
+#	    [NAME.done.WRITER markers]. A file that cannot be decoded, or is
+#	    still kept after PIPELINE_MAX_TRIES runs, is kept as FAILED_NAME and
+#	    not tried again.
+#	(4) A new converter joins the pipeline with a record writer in
+#	    ASCII_WRITERS and WRITER_SWATH_VARIABLES [scatsat_core] and a
+#	    main(pending_nc_filename, decoded_swath) listed in PIPELINE_WRITERS.
+#
+#  USAGE:
+#	Run by scatsat_knmi_pipeline_ncdf.ksh, with its environment [OPSBIN,
+#	XFER_BASEPATH, KNMI_BASEPATH]:
+#	python -W ignore scatsat_knmi_pipeline3.py [--all] [--workers N]
+#	    --all          every pending file, oldest orbit first [otherwise only
+#	                   the most recent file, as the converters do]
+#	    --workers N    the pending files N at a time [implies --all]
+#	The exit status is 0 for the Execution Codes 1 and 55, otherwise the
+#	Execution Code [90, 97; 1 for 0, a file that could not be converted],
+#	as for scatsat_knmi_daemon3.py, so the job sees a failure.
+#
+# Programmer: Mr. Paul McCrone     02 February  2015 --Original Build for NASA RAPIDSCAT----
+#                                  13 September 2017 --New modified build for ISRO ScatSat--
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 First version.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.1, Dated 2026-Oct-17
+#                                 The execution code is the exit status [it was
+#                                 always 0].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.2, Dated 2026-Oct-17
+#                                 A kept file is not converted again by the converters
+#                                 that succeeded on it, and a file that cannot be
+#                                 decoded is kept as FAILED_NAME [scatsat_core/pipeline.py].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.3, Dated 2026-Oct-17
+#                                 A bad --workers N prints the usage line and gives the
+#                                 Execution Code 90 [Get_Number_Of_Workers].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.4, Dated 2026-Oct-17
+#                                 A converter that returned 97 is not run again on a
+#                                 kept file, and a file kept for PIPELINE_MAX_TRIES
+#                                 runs is kept as FAILED_NAME [scatsat_core/pipeline.py].
+#========================================================================================
+#
+import os as OS
+import sys as SYS
+import warnings as WARNINGS
+#
+#
+#----------------------------------------------------------------
+# scatsat_core and the converters are next to this script [${EXECDIR}].
+#----------------------------------------------------------------
+#
+SYS.path.insert(0, OS.path.dirname(OS.path.abspath(__file__)))
+#
+from scatsat_core import Setup_Run_Logging, Print_Current_Time, List_NCDF_Files, NCDF_READERS
+from scatsat_core import Convert_NCDF_File_Once, Process_Pending_NCDF_Files, Get_Number_Of_Workers, Report_Execution_Code
+#
+with WARNINGS.catch_warnings():
+    WARNINGS.simplefilter("ignore")
+    import scatsat_knmi_convert_rscat_ncdf_2_qscat_ASCII3 as QSCAT_CONVERTER
+    import scatsat_knmi_convert_rscat_ncdf_2_satfocus3 as SATFOCUS_CONVERTER
+    #
+#
+#----------------------------------------------------------------
+# The registered writers, in the order of scatsat_knmi.fcn:
+#     (writer name [ASCII_WRITERS, WRITER_SWATH_VARIABLES], main function)
+#----------------------------------------------------------------
+#
+PIPELINE_WRITERS=[('QSCAT', QSCAT_CONVERTER.main),
+                  ('SATFOCUS', SATFOCUS_CONVERTER.main)]
+#
+#
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#  LIST OF PYTHON FUNCTIONS:
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#  ==> Convert_Pipeline_File(nc_filename)
+#	--> nc_filename:String, Output: Execution code for the file
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> main()
+#	--> Output: Execution code for the run [1, 55, 90 or 97]
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Convert_Pipeline_File
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Convert_Pipeline_File(nc_filename):
+    #
+    # One file through all of PIPELINE_WRITERS. Takes the place of the
+    # converter -main- in backlog mode [Process_Pending_NCDF_Files] and in
+    # watch mode [scatsat_knmi_daemon3.py --pipeline].
+    #
+    return( Convert_NCDF_File_Once(nc_filename, NCDF_READERS['KNMI'], PIPELINE_WRITERS))
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Convert_Pipeline_File FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function main
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def main():
+    #
+    dadash="-------------------------------------"
+    #
+    Setup_Run_Logging()
+    #
+    print(dadash+dadash)
+    print('---BEGIN scatsat_knmi_pipeline3.py  [writers: '+', '.join(x[0] for x in PIPELINE_WRITERS)+']  -----')
+    the_start_time = Print_Current_Time(' ')
+    print(dadash+dadash)
+    #
+    #----------------------------------------------------------------------
+    # --all: every pending file [see -Process_Pending_NCDF_Files-].
+    # --workers N [implies --all]: the pending files N at a time.
+    # Otherwise only the most recent file, as the converters do.
+    #----------------------------------------------------------------------
+    #
+    number_of_workers=Get_Number_Of_Workers(SYS.argv)
+    #
+    datapath=(OS.environ.get('XFER_BASEPATH', '') or '/satdat/curr/scatsat_knmi')+'/'
+    #
+    if number_of_workers == 0:
+        my_execution=90
+    elif ('--all' in SYS.argv[1:]) or ('--workers' in SYS.argv[1:]):
+        my_execution=Process_Pending_NCDF_Files(Convert_Pipeline_File, ('oscat_',), number_of_workers)
+    elif not OS.path.exists(datapath):
+        print("-------The datapath is INVALID! NEED TO CHECK THIS!!!!!!!! -----------------")
+        my_execution=90
+    else:
+        all_ncdf_files=List_NCDF_Files(datapath, 'oscat_')
+        #
+        if len(all_ncdf_files) == 0:
+            print("----There are no NETCDF files to process-- End Execution! ------")
+            my_execution=55
+        else:
+            my_execution=Convert_Pipeline_File(all_ncdf_files[-1])
+            #
+        #
+    #
+    #----------------------------------------------------------------
+    # Let me know if the program executed successfully.
+    # Otherwise, give me a --helpful-- error message!
+    #----------------------------------------------------------------
+    #
+    Report_Execution_Code(my_execution)
+    #
+    print(dadash+dadash)
+    print("Starting Time:"+str(the_start_time))
+    the_end_time = Print_Current_Time(' ')
+    print("Ending   Time:"+str(the_end_time))
+    print('---END scatsat_knmi_pipeline3.py  -----')
+    print(dadash+dadash)
+    #
+    return( my_execution)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF main FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+if __name__ == '__main__':
+    my_execution=main()
+    SYS.exit(0 if my_execution in (1, 55) else (my_execution or 1))
+    #
@@ -0,0 +1,533 @@
+#!/satdat/python/sata/bin/python
+# -*- coding: utf-8 -*-
+#==============================================================
+#
+#==============================================================
+#
+#
+#==-FNMOC/N38DI PYTHON PROGRAM DEFINITION-==========================================
+#
+# NAME:
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+# scatsat_regression3.py
+# ::::::::::::::::::::::::::::::::::::::::::::::::::
+#
+#  PROGRAM OVERVIEW:
+#	(1) Golden output check of the fast [whole swath] writers against the
+#	    reference i/j loops [scatsat_core/scalar_writers.py], record by
+#	    record, before a fast path is turned on in operations:
+#	        ASCII_WRITERS QSCAT, SATFOCUS   vs  SCALAR_ASCII_WRITERS
+#	        with and without the FNMOC ascii modifications
+#	        Compute_MLE_STRNG_Array         vs  Compute_MLE_STRNG  [JPL files]
+#	(2) The swaths are synthetic [scatsat_core/synthetic_swaths.py] and/or
+#	    recorded files named on the command line [.nc or .nc.gz; the JPL
+#	    reader is used for rs_l2b_* files, the KNMI reader otherwise].
+#	(3) For each check, the cells per second of both implementations.
+#	    The first differing records are printed, with their record number.
+#	(4) The per-cell -Get_Converted_Time90- puts the last two days of a
+#	    year in month 00 of the next year [2016/12/31 is 2017/00/00]; the
+#	    whole swath time conversion gives the calendar date. Records that
+#	    differ only there are counted as -yearend- and do not fail the run.
+#	(5) With SCATSAT_PACKED_VALUES=1 the fast writers format the raw packed
+#	    integers and the reference loops the unpacked values, so the packed
+#	    formatting [scatsat_core/packed_strings.py] is checked too.
+#	(6) The ascii file names of backlog mode [Reserve_File_Name]: files
+#	    converted in the same minute from the same orbit each get a name
+#	    of their own, one after the other and side by side.
+#	(7) A netCDF3 file cut short [Check_NCDF3_File_Size] is kept as
+#	    FAILED_NAME by the pipeline [Convert_NCDF_File_Once] and never
+#	    reaches a writer; the complete file does.
+#
+#  USAGE:
+#	python scatsat_regression3.py [--grid 25km|50km|all|none] [--products oscat,rapid,jpl]
+#	                              [--seeds N] [--show N] [recorded.nc ...]
+#
+#	Exit code 0 when no record differs [yearend records aside], 1 otherwise.
+#
+# Programmer: Mr. Paul McCrone     02 February  2015 --Original Build for NASA RAPIDSCAT----
+#                                  13 September 2017 --New modified build for ISRO ScatSat--
+#
+# Modification  : BELOW
+#========================================================================================
+#  Version 1.0.0, Dated 2026-Oct-17
+#                                 First version.
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.1, Dated 2026-Oct-17
+#                                 The reference loops get the unpacked swath
+#                                 [SCATSAT_PACKED_VALUES=1].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.2, Dated 2026-Oct-17
+#                                 Check_Ascii_File_Names [see (6)].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.3, Dated 2026-Oct-17
+#                                 The reference loops and the synthetic swaths come from
+#                                 their modules [no longer imported by the package].
+#  - - - - - -  - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#  Version 1.0.4, Dated 2026-Oct-17
+#                                 Check_Truncated_NCDF_Files [see (7)].
+#========================================================================================
+#
+import io as IO
+import os as OS
+import sys as SYS
+import time as TIME
+import shutil as SHUTIL
+import datetime
+import tempfile as TEMPFILE
+import warnings as WARNINGS
+import contextlib as CONTEXTLIB
+#
+#
+#----------------------------------------------------------------
+# scatsat_core is next to this script [${EXECDIR}].
+#----------------------------------------------------------------
+#
+SYS.path.insert(0, OS.path.dirname(OS.path.abspath(__file__)))
+#
+from scatsat_core import NCDF_READERS, Open_NCDF_File, Read_Swath_Variables, Read_Time_Units
+from scatsat_core import Get_Converted_Time_Array, ASCII_WRITERS, WRITER_SWATH_VARIABLES
+from scatsat_core import Compute_MLE_STRNG_Array
+from scatsat_core.scalar_writers import SCALAR_ASCII_WRITERS, Compute_MLE_STRNG_Cells
+from scatsat_core import Unpack_Swath_Values, Reserve_File_Name, Convert_NCDF_File_Once
+from scatsat_core.synthetic_swaths import SWATH_GRIDS, SYNTHETIC_PRODUCTS, Synthetic_NCDF_File_Name, Write_Synthetic_NCDF_File
+#
+#
+REGRESSION_START_TIME=datetime.datetime(2017, 2, 28, 22, 45, 0)    # Into the 1st of March.
+#
+#----------------------------------------------------------------
+# Where the time is in each record [start, stop], and where its
+# month is in the time [start, stop].
+#----------------------------------------------------------------
+#
+RECORD_TIME_FIELDS={'QSCAT':(0, 8, 0, 2),
+                    'SATFOCUS':(-22, -3, 5, 7)}
+#
+#
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#  LIST OF PYTHON FUNCTIONS:
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#  ==> Get_Option(option_name, default_value)
+#	--> option_name:String [--grid], Output: String
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Is_Yearend_Difference(writer_name, scalar_line, fast_line)
+#	--> Output: Boolean
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Compare_Records(case_name, writer_name, scalar_lines, fast_lines, scalar_seconds, fast_seconds, cells, show)
+#	--> Output: Integer [number of differing records]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Check_NCDF_File(nc_filename, case_name, show)
+#	--> Output: Integer [number of differing records]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Check_Ascii_File_Names(workdir, number_of_files)
+#	--> Output: Integer [number of products lost]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> Check_Truncated_NCDF_Files(workdir)
+#	--> Output: Integer [number of files handled wrongly]
+#  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .  .
+#  ==> main()
+#	--> Output: Integer [0 or 1]
+#--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x--x
+#
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Get_Option
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Get_Option(option_name, default_value):
+    #
+    if option_name in SYS.argv[1:]:
+        return( SYS.argv[SYS.argv.index(option_name)+1])
+        #
+    #
+    return( default_value)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Get_Option FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Is_Yearend_Difference
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Is_Yearend_Difference(writer_name, scalar_line, fast_line):
+    #
+    # True when the records differ only in the time, and the scalar
+    # time is in month 00 [see (4) above].
+    #
+    if writer_name not in RECORD_TIME_FIELDS:
+        return( False)
+        #
+    #
+    time_start,time_stop,mnth_start,mnth_stop=RECORD_TIME_FIELDS[writer_name]
+    #
+    scalar_time=scalar_line[time_start:time_stop]
+    #
+    if scalar_time[mnth_start:mnth_stop] != '00':
+        return( False)
+        #
+    #
+    return( scalar_line[:time_start]+scalar_line[time_stop:] == fast_line[:time_start]+fast_line[time_stop:])
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Is_Yearend_Difference FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Compare_Records
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Compare_Records(case_name, writer_name, scalar_lines, fast_lines, scalar_seconds, fast_seconds, cells, show):
+    #
+    # One line per check:
+    #   case  records  differing  yearend  scalar cells/s  fast cells/s  speedup
+    # then up to -show- differing records [scalar, then fast].
+    # The -yearend- records are not counted as differing.
+    #
+    number_of_diffs=0
+    number_of_yearend=0
+    #
+    for scalar_line,fast_line in zip(scalar_lines, fast_lines):
+        if scalar_line != fast_line:
+            if Is_Yearend_Difference(writer_name, scalar_line, fast_line):
+                number_of_yearend+=1
+            else:
+                number_of_diffs+=1
+                #
+            #
+        #
+    #
+    number_of_diffs+=abs(len(scalar_lines)-len(fast_lines))
+    #
+    print('%-42s %8d %6d %7d %11.0f %11.0f %7.1fx  %s' % (case_name, len(scalar_lines), number_of_diffs, number_of_yearend,
+                                                         cells/max(scalar_seconds, 1.0e-9), cells/max(fast_seconds, 1.0e-9),
+                                                         scalar_seconds/max(fast_seconds, 1.0e-9),
+                                                         'IDENTICAL' if number_of_diffs == 0 else 'DIFFERENT'))
+    #
+    if len(scalar_lines) != len(fast_lines):
+        print("   ---Record count: scalar "+str(len(scalar_lines))+", fast "+str(len(fast_lines)))
+        #
+    #
+    shown=0
+    for record_number,(scalar_line,fast_line) in enumerate(zip(scalar_lines, fast_lines)):
+        if shown >= show:
+            break
+            #
+        if scalar_line != fast_line and not Is_Yearend_Difference(writer_name, scalar_line, fast_line):
+            print("   record %d" % record_number)
+            print("     scalar "+repr(scalar_line))
+            print("     fast   "+repr(fast_line))
+            shown+=1
+            #
+        #
+    #
+    return( number_of_diffs)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Compare_Records FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Check_NCDF_File
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Check_NCDF_File(nc_filename, case_name, show):
+    #
+    # Every check for one NETCDF file. The fast side includes the whole
+    # swath time conversion, the scalar side converts the time per cell.
+    #
+    is_jpl=OS.path.basename(nc_filename).startswith('rs_l2b_')
+    ncdf_reader=NCDF_READERS['JPL' if is_jpl else 'KNMI']
+    #
+    fileobj=Open_NCDF_File(nc_filename)
+    swath=Read_Swath_Variables(fileobj, ncdf_reader, sorted(set(WRITER_SWATH_VARIABLES['QSCAT'])|set(WRITER_SWATH_VARIABLES['SATFOCUS'])))
+    time_units=Read_Time_Units(fileobj, ncdf_reader)
+    #
+    ambig_obj=None
+    if is_jpl and ncdf_reader['ambiguity_obj'] in fileobj.variables:
+        ambig_obj=fileobj.variables[ncdf_reader['ambiguity_obj']][:]
+        #
+    #
+    fileobj.close()
+    #
+    scalar_swath=dict((name, Unpack_Swath_Values(swath, name)) for name in swath if name != 'packing')
+    #
+    cells=swath['lat'].size
+    number_of_diffs=0
+    #
+    for writer_name in sorted(ASCII_WRITERS):
+        for fnmoc_adjust in (False, True):
+            #
+            start_clock=TIME.perf_counter()
+            scalar_lines=SCALAR_ASCII_WRITERS[writer_name](scalar_swath, time_units, '02048', fnmoc_adjust).splitlines()
+            scalar_seconds=TIME.perf_counter()-start_clock
+            #
+            start_clock=TIME.perf_counter()
+            obs_time=Get_Converted_Time_Array(swath['time'], time_units)
+            fast_lines=ASCII_WRITERS[writer_name](obs_time, swath, '02048', fnmoc_adjust).splitlines()
+            fast_seconds=TIME.perf_counter()-start_clock
+            #
+            number_of_diffs+=Compare_Records(case_name+' '+writer_name+(' fnmoc' if fnmoc_adjust else ' perl'), writer_name,
+                                             scalar_lines, fast_lines, scalar_seconds, fast_seconds, cells, show)
+            #
+        #
+    #
+    if ambig_obj is not None:
+        #
+        start_clock=TIME.perf_counter()
+        scalar_mle=Compute_MLE_STRNG_Cells(ambig_obj)
+        scalar_seconds=TIME.perf_counter()-start_clock
+        #
+        start_clock=TIME.perf_counter()
+        fast_mle=Compute_MLE_STRNG_Array(ambig_obj).tolist()
+        fast_seconds=TIME.perf_counter()-start_clock
+        #
+        number_of_diffs+=Compare_Records(case_name+' MLE', 'MLE',
+                                         [' '.join(cell_strings) for row_strings in scalar_mle for cell_strings in row_strings],
+                                         [' '.join(cell_strings) for row_strings in fast_mle for cell_strings in row_strings],
+                                         scalar_seconds, fast_seconds, cells, show)
+        #
+    #
+    return( number_of_diffs)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Check_NCDF_File FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Check_Ascii_File_Names
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Check_Ascii_File_Names(workdir, number_of_files):
+    #
+    # -number_of_files- files of one minute and one rev, as the qscat
+    # converter names them in backlog mode: first one after the other [each
+    # published to the archive and removed from ascii_temp before the next],
+    # then all at once [all still in ascii_temp, as with --workers].
+    # Every file must get a name of its own.
+    #
+    ascii_temp=OS.path.join(workdir, 'ascii_temp')
+    ascii_orig=OS.path.join(workdir, 'ascii_orig')
+    OS.mkdir(ascii_temp)
+    OS.mkdir(ascii_orig)
+    #
+    asciifilenamea=REGRESSION_START_TIME.strftime("%Y-%m-%d.%H-%M")
+    ascii_file_names=[asciifilenamea, asciifilenamea+'.02048']+[asciifilenamea+'.02048.'+str(k) for k in range(2, 100)]
+    ascii_file_names=[x+".scatsat.knmi.ascii.txt" for x in ascii_file_names]
+    #
+    number_lost=0
+    #
+    for case_name in ('one after the other', 'side by side'):
+        #
+        reserved_names=[]
+        #
+        for k in range(number_of_files):
+            reserved_names.append(Reserve_File_Name(ascii_temp, ascii_file_names, [ascii_orig]))
+            #
+            if case_name == 'one after the other' and reserved_names[-1] != '':
+                OS.replace(OS.path.join(ascii_temp, reserved_names[-1]), OS.path.join(ascii_orig, reserved_names[-1]))
+                #
+            #
+        #
+        lost=number_of_files-len(set(x for x in reserved_names if x != ''))
+        number_lost+=lost
+        #
+        print('%-42s %8d %6d  %s' % ('ascii names '+case_name, number_of_files, lost, 'DISTINCT' if lost == 0 else 'LOST'))
+        #
+    #
+    return( number_lost)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Check_Ascii_File_Names FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function Check_Truncated_NCDF_Files
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def Check_Truncated_NCDF_Files(workdir):
+    #
+    # A synthetic oscat file, cut short [the first 5000 bytes, half of it,
+    # all but its last byte] and complete, through the pipeline with a
+    # writer that only counts its calls. A cut file must be kept as
+    # FAILED_NAME [Execution Code 0] without the writer being run, the
+    # complete file must be converted and removed [Execution Code 1].
+    #
+    complete_filename=OS.path.join(workdir, 'complete.nc')
+    Write_Synthetic_NCDF_File(complete_filename, 'oscat', '50km', REGRESSION_START_TIME)
+    #
+    with open(complete_filename, "rb") as nc_obj:
+        nc_bytes=nc_obj.read()
+        #
+    #
+    nc_filename=OS.path.join(workdir, Synthetic_NCDF_File_Name('oscat', '50km', REGRESSION_START_TIME, 2048))
+    failed_nc_filename=OS.path.join(workdir, 'FAILED_'+OS.path.basename(nc_filename))
+    #
+    writer_calls=[]
+    #
+    def Count_Writer_Call(pending_nc_filename, decoded_swath):
+        writer_calls.append(pending_nc_filename)
+        return( 1)
+        #
+    #
+    pipeline_writers=[('QSCAT', Count_Writer_Call)]
+    #
+    number_wrong=0
+    #
+    for file_size in (5000, len(nc_bytes)//2, len(nc_bytes)-1, len(nc_bytes)):
+        #
+        with open(nc_filename, "wb") as nc_obj:
+            nc_obj.write(nc_bytes[:file_size])
+            #
+        #
+        del writer_calls[:]
+        #
+        with CONTEXTLIB.redirect_stdout(IO.StringIO()):
+            this_execution=Convert_NCDF_File_Once(nc_filename, NCDF_READERS['KNMI'], pipeline_writers)
+            #
+        #
+        if file_size < len(nc_bytes):
+            case_name='truncated input, '+str(file_size)+' bytes'
+            is_right=this_execution == 0 and len(writer_calls) == 0 and OS.path.isfile(failed_nc_filename)
+            status='QUARANTINED' if is_right else 'PUBLISHED'
+        else:
+            case_name='complete input, '+str(file_size)+' bytes'
+            is_right=this_execution == 1 and len(writer_calls) == 1 and not OS.path.isfile(nc_filename)
+            status='CONVERTED' if is_right else 'NOT CONVERTED'
+            #
+        #
+        if not is_right:
+            number_wrong+=1
+            #
+        #
+        print('%-42s %8d %6d  %s' % (case_name, this_execution, len(writer_calls), status))
+        #
+        for file_name in (nc_filename, failed_nc_filename):
+            if OS.path.isfile(file_name):
+                OS.remove(file_name)
+                #
+            #
+        #
+    #
+    return( number_wrong)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF Check_Truncated_NCDF_Files FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#######  Begin Function main
+#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+def main():
+    #
+    dadash="----------------------------------------------------------------"
+    #
+    grid_option=Get_Option('--grid', '50km')
+    grids={'all':sorted(SWATH_GRIDS), 'none':[]}.get(grid_option, [grid_option])
+    products=Get_Option('--products', ','.join(SYNTHETIC_PRODUCTS)).split(',')
+    number_of_seeds=int(Get_Option('--seeds', '1'))
+    show=int(Get_Option('--show', '5'))
+    #
+    option_values=[SYS.argv[k+1] for k in range(1, len(SYS.argv)-1) if SYS.argv[k].startswith('--')]
+    recorded_files=[name for name in SYS.argv[1:] if not name.startswith('--') and name not in option_values]
+    #
+    for name in grids:
+        if name not in SWATH_GRIDS:
+            print("---Unknown grid "+name+", use one of: "+', '.join(sorted(SWATH_GRIDS))+", all or none")
+            return( 1)
+            #
+        #
+    #
+    for name in products:
+        if name not in SYNTHETIC_PRODUCTS:
+            print("---Unknown product "+name+", use one of: "+','.join(SYNTHETIC_PRODUCTS))
+            return( 1)
+            #
+        #
+    #
+    #----------------------------------------------------------------
+    # The masked cells give numpy warnings in the scalar loops, as they
+    # always did in -main-.
+    #----------------------------------------------------------------
+    #
+    WARNINGS.simplefilter('ignore')
+    #
+    print(dadash)
+    print('%-42s %8s %6s %7s %11s %11s %8s' % ('case', 'records', 'diffs', 'yearend', 'scalar c/s', 'fast c/s', 'speedup'))
+    #
+    number_of_diffs=0
+    #
+    workdir=TEMPFILE.mkdtemp(prefix='scatsat_regression_')
+    #
+    try:
+        for grid in grids:
+            for product in products:
+                for seed in range(number_of_seeds):
+                    nc_filename=OS.path.join(workdir, Synthetic_NCDF_File_Name(product, grid, REGRESSION_START_TIME, 2048+seed))
+                    Write_Synthetic_NCDF_File(nc_filename, product, grid, REGRESSION_START_TIME, seed=seed)
+                    #
+                    number_of_diffs+=Check_NCDF_File(nc_filename, product+' '+grid+' seed '+str(seed), show)
+                    OS.remove(nc_filename)
+                    #
+                #
+            #
+        #
+    finally:
+        SHUTIL.rmtree(workdir)
+        #
+    #
+    for nc_filename in recorded_files:
+        number_of_diffs+=Check_NCDF_File(nc_filename, OS.path.basename(nc_filename)[:24], show)
+        #
+    #
+    workdir=TEMPFILE.mkdtemp(prefix='scatsat_regression_')
+    #
+    try:
+        number_of_diffs+=Check_Ascii_File_Names(workdir, 4)
+        number_of_diffs+=Check_Truncated_NCDF_Files(workdir)
+    finally:
+        SHUTIL.rmtree(workdir)
+        #
+    #
+    print(dadash)
+    #
+    if number_of_diffs != 0:
+        print("---FAILURE! "+str(number_of_diffs)+" records differ. Do not turn on the fast path.")
+        return( 1)
+        #
+    #
+    print("No differing records.")
+    return( 0)
+    #
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+    #### END OF main FUNCTION
+    #-----#-----#-----#-----#-----#-----#-----#-----#-----#-----#-----
+#
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+#
+if __name__ == '__main__':
+    SYS.exit(main())
+    #